@@ -1,9 +1,25 @@
 """
 Backend package for elevated ambitions project.
 Contains models, data processing, and API functionality.
+
+Subpackages are imported on first access rather than at package import,
+so entry points only pay for what they use.
 """
 
-from . import models
-from . import notebooks
+import importlib
+import os
+
+__version__ = "0.1.0"
+
+# Logfire registers a pydantic plugin that imports all of Logfire the first time
+# any model class is built. We never enable Logfire's pydantic instrumentation,
+# so skip loading it unless the environment explicitly says otherwise.
+os.environ.setdefault("PYDANTIC_DISABLE_PLUGINS", "logfire-plugin")
+
+_LAZY_SUBPACKAGES = {"models", "notebooks"}
 
-__version__ = "0.1.0" 
\ No newline at end of file
+def __getattr__(name: str):
+    """Import `backend.models` / `backend.notebooks` on first attribute access."""
+    if name in _LAZY_SUBPACKAGES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
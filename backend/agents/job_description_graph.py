@@ -2,7 +2,7 @@ from langgraph.graph import StateGraph, START, END
 from datetime import datetime
 
 from backend.models.job_description_workflow_state import JobDescriptionProcessingState
-from backend.agents.nodes import extraction_node, grader_node
+from backend.agents.nodes import extraction_node, grader_node, candidate_extraction_node
 
 def should_continue(state: JobDescriptionProcessingState) -> str:
     """
@@ -32,6 +32,24 @@ def should_continue(state: JobDescriptionProcessingState) -> str:
     # Shouldn't get here, but default to extraction if we do
     return "extract_job"
 
+def route_start(state: JobDescriptionProcessingState) -> str:
+    """
+    Chooses the first round: parallel candidates when more than one is
+    requested, otherwise the sequential extract -> grade loop.
+    """
+    return "extract_candidates" if state.num_candidates > 1 else "extract_job"
+
+def after_extraction(state: JobDescriptionProcessingState) -> str:
+    """
+    Routes after extraction: grade the output, re-extract on an escalated
+    model tier, or stop on failure.
+    """
+    if state.status == "failed":
+        return END
+    if state.status == "extracting":
+        return "extract_job"
+    return "grade_job"
+
 def create_job_description_graph() -> StateGraph:
     """
     Creates and returns a compiled job description processing graph.
@@ -41,10 +59,26 @@ def create_job_description_graph() -> StateGraph:
     # Add nodes
     workflow.add_node("extract_job", extraction_node)
     workflow.add_node("grade_job", grader_node)
+    workflow.add_node("extract_candidates", candidate_extraction_node)
     
     # Add edges
-    workflow.add_edge(START, "extract_job")
-    workflow.add_edge("extract_job", "grade_job")
+    workflow.add_conditional_edges(
+        START,
+        route_start,
+        {
+            "extract_candidates": "extract_candidates",
+            "extract_job": "extract_job"
+        }
+    )
+    workflow.add_conditional_edges(
+        "extract_job",
+        after_extraction,
+        {
+            "extract_job": "extract_job",
+            "grade_job": "grade_job",
+            END: END
+        }
+    )
     workflow.add_conditional_edges(
         "grade_job",
         should_continue,
@@ -53,5 +87,14 @@ def create_job_description_graph() -> StateGraph:
             END: END
         }
     )
+    # Candidates are graded in-node, so the same routing applies afterwards
+    workflow.add_conditional_edges(
+        "extract_candidates",
+        should_continue,
+        {
+            "extract_job": "extract_job",
+            END: END
+        }
+    )
     
     return workflow.compile()
@@ -0,0 +1,159 @@
+"""
+Cost-aware model cascade for job description extraction.
+Defines the model tiers, local validation of extractions and a policy that
+remembers, per `via` source and company, which tier usually succeeds.
+"""
+
+from typing import Dict, List, Optional
+import random
+from backend.models.job_description_models import JobDescription
+from backend.logging_config import get_logger
+
+# Initialize logging
+logger = get_logger()
+
+# Ordered cheapest first; costs are USD per million tokens (Groq list prices)
+MODEL_TIERS: Dict[str, Dict] = {
+    "fast": {
+        "model": "llama-3.1-8b-instant",
+        "input_cost_per_million": 0.05,
+        "output_cost_per_million": 0.08,
+    },
+    "large": {
+        "model": "llama-3.3-70b-versatile",
+        "input_cost_per_million": 0.59,
+        "output_cost_per_million": 0.79,
+    },
+}
+TIER_ORDER: List[str] = list(MODEL_TIERS)
+
+
+def next_tier(tier: str) -> Optional[str]:
+    """Return the tier to escalate to, or None if already at the largest model."""
+    position = TIER_ORDER.index(tier)
+    return TIER_ORDER[position + 1] if position + 1 < len(TIER_ORDER) else None
+
+
+def estimate_cost(tier: str, input_tokens: int, output_tokens: int) -> float:
+    """Estimate the USD cost of a single call on the given tier."""
+    pricing = MODEL_TIERS[tier]
+    return (
+        input_tokens * pricing["input_cost_per_million"]
+        + output_tokens * pricing["output_cost_per_million"]
+    ) / 1_000_000
+
+
+def validate_extraction(structured_job: Optional[JobDescription], raw_job: Dict) -> List[str]:
+    """
+    Cheap local checks that catch obviously incomplete extractions before grading.
+
+    Args:
+        structured_job: Extraction output
+        raw_job: Original job listing data
+
+    Returns:
+        List[str]: Human-readable issues; empty when the extraction looks sound
+    """
+    if structured_job is None:
+        return ["No structured job produced"]
+
+    issues = []
+    if not (structured_job.role_summary.title or "").strip():
+        issues.append("Missing role title")
+
+    raw_company = (raw_job.get("company_name") or "").strip().lower()
+    company = structured_job.company_overview.company_name if structured_job.company_overview else None
+    if raw_company and (not company or raw_company not in company.strip().lower()):
+        issues.append("Company name does not match the listing")
+
+    # Listings with highlight sections should yield responsibilities or qualifications
+    if raw_job.get("job_highlights"):
+        details = structured_job.responsibilities_and_qualifications
+        if not details or not (
+            details.responsibilities
+            or details.required_qualifications
+            or details.preferred_qualifications
+        ):
+            issues.append("No responsibilities or qualifications extracted")
+
+    return issues
+
+
+def policy_keys(raw_job: Dict) -> List[str]:
+    """Memory keys for a listing, most specific first."""
+    keys = []
+    if raw_job.get("company_name"):
+        keys.append(f"company:{raw_job['company_name'].strip().lower()}")
+    if raw_job.get("via"):
+        keys.append(f"via:{raw_job['via'].strip().lower()}")
+    return keys
+
+
+class ModelCascadePolicy:
+    """
+    Chooses the starting extraction tier for a listing.
+
+    Starts on the fast tier unless history for the listing's company (or,
+    failing that, its `via` source) shows the fast tier rarely succeeds.
+    A small exploration rate keeps re-testing the fast tier for those keys.
+    Outcomes are kept in memory and, when a collection is given, persisted.
+    """
+
+    def __init__(
+        self,
+        collection=None,
+        min_samples: int = 3,
+        success_threshold: float = 0.6,
+        explore_rate: float = 0.1
+    ):
+        self.collection = collection
+        self.min_samples = min_samples
+        self.success_threshold = success_threshold
+        self.explore_rate = explore_rate
+        self.stats: Dict[str, Dict[str, Dict[str, int]]] = {}
+
+    async def load(self):
+        """Load persisted tier statistics."""
+        if self.collection is None:
+            return
+        async for doc in self.collection.find({}):
+            self.stats[doc["_id"]] = doc.get("tiers", {})
+        logger.info(f"Loaded model cascade stats for {len(self.stats)} keys")
+
+    def choose_tier(self, raw_job: Dict) -> str:
+        """Pick the starting tier for a listing."""
+        for key in policy_keys(raw_job):
+            fast = self.stats.get(key, {}).get(TIER_ORDER[0])
+            if not fast or fast.get("attempts", 0) < self.min_samples:
+                continue
+            success_rate = fast.get("successes", 0) / fast["attempts"]
+            if success_rate < self.success_threshold and random.random() >= self.explore_rate:
+                return TIER_ORDER[-1]
+            return TIER_ORDER[0]
+        return TIER_ORDER[0]
+
+    async def record(self, raw_job: Dict, starting_tier: str, succeeded: bool):
+        """
+        Record whether a job completed on its starting tier without escalation.
+
+        Args:
+            raw_job: Original job listing data
+            starting_tier: Tier of the first extraction call
+            succeeded: True if the job completed without escalating
+        """
+        for key in policy_keys(raw_job):
+            tier_stats = self.stats.setdefault(key, {}).setdefault(
+                starting_tier, {"attempts": 0, "successes": 0}
+            )
+            tier_stats["attempts"] += 1
+            tier_stats["successes"] += int(succeeded)
+
+            if self.collection is not None:
+                await self.collection.update_one(
+                    {"_id": key},
+                    {"$inc": {
+                        f"tiers.{starting_tier}.attempts": 1,
+                        f"tiers.{starting_tier}.successes": int(succeeded)
+                    }},
+                    upsert=True
+                )
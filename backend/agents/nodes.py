@@ -1,24 +1,58 @@
 from langchain_groq import ChatGroq
-from dotenv import load_dotenv
 import os
-from typing import Dict
+from typing import Dict, Optional, Tuple
 from langchain.prompts import ChatPromptTemplate
 from datetime import datetime
+import asyncio
+import time
 
 from backend.models.job_description_models import JobDescription, GraderOutput
 from backend.models.job_description_workflow_state import JobDescriptionProcessingState
-from backend.prompts.job_description_processing import job_description_annotator, job_description_grader
+from backend.prompts.job_description_processing import (
+    job_description_annotator, job_description_grader, extraction_prompt_variants
+)
+from backend.agents.model_cascade import MODEL_TIERS, estimate_cost, next_tier, validate_extraction
+from backend.logging_config import load_environment
 
-load_dotenv()
+load_environment()
 
-async def extraction_node(state: JobDescriptionProcessingState) -> dict:
-    """Extract structured job information from raw job listing data."""
-    state_updates = {
-        "status": "extracting",
-        "attempts": state.attempts + 1,
-        "updated_at": datetime.now()
+# Grader score at which an extraction is accepted
+ACCEPTANCE_SCORE = 0.8
+
+# (temperature, prompt variant) per parallel candidate; cycled when K exceeds the list
+CANDIDATE_CONFIGS = [
+    (0.1, "default"),
+    (0.5, "sectioned"),
+    (0.8, "verbatim"),
+    (0.3, "sectioned"),
+    (0.6, "verbatim"),
+]
+
+async def _extract(
+    state: JobDescriptionProcessingState,
+    tier: str,
+    temperature: float = 0.1,
+    prompt_variant: str = "default"
+) -> Tuple[JobDescription, Dict]:
+    """
+    Run a single extraction call.
+
+    Returns:
+        Tuple[JobDescription, Dict]: Parsed job and the call record (tier, model,
+        token usage, cost and latency)
+
+    Raises:
+        Exception: If the call fails; the partial call record is attached as `call_record`
+    """
+    call_record = {
+        "tier": tier,
+        "model": MODEL_TIERS[tier]["model"],
+        "attempt": state.attempts + 1,
+        "temperature": temperature,
+        "prompt_variant": prompt_variant
     }
-    
+    started = time.perf_counter()
+
     try:
         context = {
             "raw_job": state.raw_job_data,
@@ -26,40 +60,221 @@ async def extraction_node(state: JobDescriptionProcessingState) -> dict:
             "previous_feedback": state.grader_output.overall_feedback if state.grader_output else "None",
             "previous_extraction": state.structured_job.model_dump() if state.structured_job else "None"
         }
-        
+
         prompt = ChatPromptTemplate.from_messages([
             ("system", job_description_annotator),
             ("user", """
             Please parse this job listing into a structured format. Here's the context:
-            
+
             Raw Job Data: {raw_job}
             Attempt Number: {attempt_number}
             Previous Feedback: {previous_feedback}
             Previous Structured Job: {previous_extraction}
-            """)
+            """ + extraction_prompt_variants[prompt_variant])
         ])
 
         extraction_model = ChatGroq(
-            model="llama-3.3-70b-versatile",
-            temperature=0.1,
+            model=MODEL_TIERS[tier]["model"],
+            temperature=temperature,
             max_retries=2,
             stop_sequences=None
-        ).with_structured_output(JobDescription)
-        
-        structured_job = await (prompt | extraction_model).ainvoke(context)
-        
-        state_updates.update({
-            "structured_job": structured_job,
-            "status": "grading",
-            "error_message": None
+        ).with_structured_output(JobDescription, include_raw=True)
+
+        response = await (prompt | extraction_model).ainvoke(context)
+        usage = getattr(response["raw"], "usage_metadata", None) or {}
+        call_record.update({
+            "input_tokens": usage.get("input_tokens", 0),
+            "output_tokens": usage.get("output_tokens", 0),
         })
-        
+        call_record["cost_usd"] = estimate_cost(tier, call_record["input_tokens"], call_record["output_tokens"])
+
+        if response.get("parsing_error") or response.get("parsed") is None:
+            raise ValueError(f"Structured output parsing failed: {response.get('parsing_error')}")
+
+        return response["parsed"], call_record
+
     except Exception as e:
-        state_updates.update({
+        call_record["error"] = str(e)
+        e.call_record = call_record
+        raise
+
+    finally:
+        call_record["latency_s"] = time.perf_counter() - started
+
+async def _grade(raw_job: Dict, structured_job: JobDescription) -> GraderOutput:
+    """Grade a single extraction with the fast grader model."""
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", job_description_grader),
+        ("user", """
+        Original Job Listing: {raw_job}
+        Extracted Job Description: {structured_job}
+        """)
+    ])
+
+    grader_model = ChatGroq(
+        model="llama-3.1-8b-instant",  # Using faster 8B model for grading
+        temperature=0.1,
+        max_retries=2,
+        stop_sequences=None
+    ).with_structured_output(GraderOutput)
+
+    return await (prompt | grader_model).ainvoke({
+        "raw_job": raw_job,
+        "structured_job": structured_job
+    })
+
+def _status_after_grading(state: JobDescriptionProcessingState, grader_output: GraderOutput) -> Dict:
+    """Status updates for a graded round: accept, retry on the next tier, or fail."""
+    if grader_output.overall_quality_score >= ACCEPTANCE_SCORE:
+        return {"status": "completed", "error_message": None}
+    if state.attempts >= state.max_attempts:
+        return {
             "status": "failed",
-            "error_message": str(e)
+            "error_message": f"Max attempts reached. Final quality score: {grader_output.overall_quality_score}"
+        }
+    # Below the bar: retry on the next model tier if there is one
+    return {
+        "status": "extracting",
+        "error_message": None,
+        "model_tier": next_tier(state.model_tier) or state.model_tier
+    }
+
+async def extraction_node(state: JobDescriptionProcessingState) -> dict:
+    """
+    Extract structured job information from raw job listing data.
+    Uses the model tier in `state.model_tier` and escalates to the next tier
+    when the output fails local validation or the call itself errors.
+    """
+    tier = state.model_tier
+    escalation = next_tier(tier)
+    can_retry = escalation is not None and state.attempts + 1 < state.max_attempts
+    state_updates = {
+        "status": "extracting",
+        "attempts": state.attempts + 1,
+        "updated_at": datetime.now()
+    }
+
+    try:
+        structured_job, call_record = await _extract(state, tier)
+
+        issues = validate_extraction(structured_job, state.raw_job_data)
+        call_record["validation_issues"] = issues
+
+        if issues and can_retry:
+            # Skip grading and go straight to the larger model
+            state_updates.update({
+                "structured_job": structured_job,
+                "model_tier": escalation,
+                "error_message": None
+            })
+        else:
+            state_updates.update({
+                "structured_job": structured_job,
+                "status": "grading",
+                "error_message": None
+            })
+
+    except Exception as e:
+        call_record = getattr(e, "call_record", {"tier": tier, "error": str(e)})
+        if can_retry:
+            state_updates.update({
+                "model_tier": escalation,
+                "error_message": str(e)
+            })
+        else:
+            state_updates.update({
+                "status": "failed",
+                "error_message": str(e)
+            })
+
+    state_updates["extraction_calls"] = state.extraction_calls + [call_record]
+    return state_updates
+
+async def candidate_extraction_node(state: JobDescriptionProcessingState) -> dict:
+    """
+    First-round extraction with `state.num_candidates` concurrent candidates.
+
+    Each candidate uses a different temperature / prompt variant and is graded
+    as soon as it finishes. The best-scoring candidate is kept, and remaining
+    candidates are cancelled once one clears the acceptance score. Trades extra
+    tokens for lower tail latency on postings that would otherwise need
+    several sequential extract -> grade rounds.
+    """
+    tier = state.model_tier
+    started = time.perf_counter()
+    state_updates = {
+        "attempts": state.attempts + 1,
+        "updated_at": datetime.now()
+    }
+
+    async def run_candidate(index: int):
+        temperature, variant = CANDIDATE_CONFIGS[index % len(CANDIDATE_CONFIGS)]
+        try:
+            structured_job, call_record = await _extract(state, tier, temperature, variant)
+        except Exception as e:
+            call_record = getattr(e, "call_record", {"tier": tier, "error": str(e)})
+            call_record["candidate"] = index
+            return None, None, call_record
+
+        call_record["candidate"] = index
+        try:
+            grader_output = await _grade(state.raw_job_data, structured_job)
+        except Exception as e:
+            call_record["grading_error"] = str(e)
+            return structured_job, None, call_record
+
+        call_record["quality_score"] = grader_output.overall_quality_score
+        return structured_job, grader_output, call_record
+
+    tasks = [asyncio.create_task(run_candidate(i)) for i in range(state.num_candidates)]
+    calls = []
+    best: Optional[Tuple[JobDescription, GraderOutput]] = None
+    time_to_accept = None
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            structured_job, grader_output, call_record = await next_done
+            calls.append(call_record)
+            if grader_output is None:
+                continue
+            if best is None or grader_output.overall_quality_score > best[1].overall_quality_score:
+                best = (structured_job, grader_output)
+            if grader_output.overall_quality_score >= ACCEPTANCE_SCORE:
+                time_to_accept = time.perf_counter() - started
+                break
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    state_updates["extraction_calls"] = state.extraction_calls + calls
+    state_updates["candidate_stats"] = {
+        "k": state.num_candidates,
+        "completed": len(calls),
+        "cancelled": len(pending),
+        "best_score": best[1].overall_quality_score if best else None,
+        "time_to_accept_s": time_to_accept,
+        "latency_s": time.perf_counter() - started
+    }
+
+    if best is None:
+        # No candidate produced a graded extraction; fall back to sequential retries
+        errors = [call.get("error") or call.get("grading_error") for call in calls]
+        state_updates.update({
+            "status": "failed" if state.attempts + 1 >= state.max_attempts else "extracting",
+            "model_tier": next_tier(tier) or tier,
+            "error_message": next((error for error in errors if error), "No candidate extraction succeeded")
         })
-    
+        return state_updates
+
+    structured_job, grader_output = best
+    graded_state = state.model_copy(update={"attempts": state.attempts + 1})
+    state_updates.update({
+        "structured_job": structured_job,
+        "grader_output": grader_output,
+        **_status_after_grading(graded_state, grader_output)
+    })
     return state_updates
 
 async def grader_node(state: JobDescriptionProcessingState) -> dict:
@@ -67,49 +282,20 @@ async def grader_node(state: JobDescriptionProcessingState) -> dict:
     state_updates = {
         "updated_at": datetime.now()
     }
-    
+
     try:
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", job_description_grader),
-            ("user", """
-            Original Job Listing: {raw_job}
-            Extracted Job Description: {structured_job}
-            """)
-        ])
-        
-        grader_model = ChatGroq(
-            model="llama-3.1-8b-instant",  # Using faster 8B model for grading
-            temperature=0.1,
-            max_retries=2,
-            stop_sequences=None
-        ).with_structured_output(GraderOutput)
-        
-        grader_output = await (prompt | grader_model).ainvoke({
-            "raw_job": state.raw_job_data,
-            "structured_job": state.structured_job
-        })
-        
+        grader_output = await _grade(state.raw_job_data, state.structured_job)
+
         # Simple status determination based on quality score
-        if grader_output.overall_quality_score >= 0.8:
-            status = "completed"
-            error_message = None
-        elif state.attempts >= state.max_attempts:
-            status = "failed"
-            error_message = f"Max attempts reached. Final quality score: {grader_output.overall_quality_score}"
-        else:
-            status = "extracting"
-            error_message = None
-        
         state_updates.update({
             "grader_output": grader_output,
-            "status": status,
-            "error_message": error_message
+            **_status_after_grading(state, grader_output)
         })
-        
+
     except Exception as e:
         state_updates.update({
             "status": "failed",
             "error_message": str(e)
         })
-    
-    return state_updates
\ No newline at end of file
+
+    return state_updates
@@ -0,0 +1 @@
+"""HTTP read API over the job collections (see backend.api.app)."""
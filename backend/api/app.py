@@ -0,0 +1,205 @@
+"""
+Read API over `elevated_jobs` and `job_listings`.
+Requests share the process-wide Motor pool (`backend.database.mongodb`), and
+JSON responses are served from an in-process TTL/LRU cache
+(`backend.api.cache`) that is dropped whenever the elevation workflow saves a
+job. Responses carry a weak ETag (`If-None-Match` gets a 304) and are
+gzip-compressed above 1 KB.
+
+Endpoints:
+    GET /jobs                 elevated jobs, newest first (keyset pages, filters)
+    GET /jobs/search?q=       keyword search over elevated jobs
+    GET /jobs/{id}            one elevated job
+    GET /listings/search?q=   keyword search over raw listings
+    GET /listings/{id}        one raw listing (`?full=true` adds its body)
+    GET /health               liveness and cache statistics
+
+Usage:
+    python -m backend.api.app [--host 127.0.0.1] [--port 8000] [--workers N]
+"""
+
+from typing import Any, Awaitable, Callable, List, Optional
+from contextlib import asynccontextmanager
+import asyncio
+import os
+
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+
+from backend.api.cache import CacheVersion, ResponseCache, poll_version
+from backend.database import mongodb, get_cache_versions_collection
+from backend.database.raw_store import HOT_PROJECTION
+from backend.database.repositories import get_elevated_jobs_repository, get_job_listings_repository
+from backend.logging_config import get_logger, setup_logging
+
+logger = get_logger()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an `If-None-Match` header against an ETag."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+async def cached_json(request: Request, compute: Callable[[], Awaitable[Any]]) -> Response:
+    """JSON response for the request's path and query, from the cache when possible."""
+    cache: ResponseCache = request.app.state.cache
+    key = f"{request.url.path}?{sorted(request.query_params.multi_items())}"
+    entry = await cache.get_or_compute(key, compute)
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
+
+
+def object_id(value: str):
+    """ObjectId for a path parameter; malformed IDs are reported as not found."""
+    from bson import ObjectId
+
+    if not ObjectId.is_valid(value):
+        raise HTTPException(status_code=404, detail="Not found")
+    return value
+
+
+def create_app(
+    elevated_jobs=None,
+    listings=None,
+    cache: Optional[ResponseCache] = None,
+    version_poll_interval: float = 1.0
+) -> FastAPI:
+    """
+    Build the API. Repositories are created from the shared MongoDB client at
+    startup unless they are passed in.
+
+    Args:
+        elevated_jobs: `ElevatedJobsRepository`
+        listings: `JobListingsRepository`
+        cache: Response cache (API_CACHE_SIZE entries, API_CACHE_TTL seconds by default)
+        version_poll_interval: Seconds between checks of the shared data version
+    """
+    cache = cache or ResponseCache(
+        max_entries=int(os.getenv("API_CACHE_SIZE", "2048")),
+        ttl=float(os.getenv("API_CACHE_TTL", "30"))
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if app.state.elevated_jobs is not None:
+            yield
+            return
+        setup_logging()
+        async with mongodb:
+            app.state.elevated_jobs = await get_elevated_jobs_repository()
+            app.state.listings = await get_job_listings_repository()
+            version = CacheVersion(await get_cache_versions_collection())
+            poller = asyncio.create_task(poll_version(app.state.cache, version, version_poll_interval))
+            try:
+                yield
+            finally:
+                poller.cancel()
+                logger.info("API cache summary", metadata=app.state.cache.snapshot())
+
+    app = FastAPI(title="Elevated Ambitions API", lifespan=lifespan)
+    app.state.elevated_jobs = elevated_jobs
+    app.state.listings = listings
+    app.state.cache = cache
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+    @app.get("/health")
+    async def health(request: Request):
+        return {"status": "ok", "cache": request.app.state.cache.snapshot()}
+
+    @app.get("/jobs")
+    async def browse_jobs(
+        request: Request,
+        limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = None,
+        title: Optional[str] = None,
+        title_family: Optional[str] = None,
+        seniority: Optional[str] = None,
+        industry: Optional[str] = None,
+        remote: Optional[str] = None,
+        has_salary: Optional[bool] = None,
+        min_salary: Optional[int] = None,
+        posted_within_days: Optional[int] = Query(None, ge=1),
+        is_remote: Optional[bool] = None,
+        near: Optional[str] = None,
+        within_miles: Optional[float] = Query(None, gt=0, le=500),
+        region: Optional[str] = None,
+        fields: Optional[List[str]] = Query(None)
+    ):
+        async def compute():
+            try:
+                page = await request.app.state.elevated_jobs.browse(
+                    limit, cursor, fields,
+                    title=title, title_family=title_family, seniority=seniority,
+                    industry=industry, remote=remote, has_salary=has_salary,
+                    min_salary=min_salary, posted_within_days=posted_within_days, is_remote=is_remote,
+                    near=near, within_miles=within_miles, region=region
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return page.model_dump()
+
+        return await cached_json(request, compute)
+
+    @app.get("/jobs/search")
+    async def search_jobs(request: Request, q: str = Query(..., min_length=1), limit: int = Query(20, ge=1, le=100)):
+        async def compute():
+            return await request.app.state.elevated_jobs.search(q, limit)
+
+        return await cached_json(request, compute)
+
+    @app.get("/jobs/{job_id}")
+    async def get_job(request: Request, job_id: str):
+        async def compute():
+            job = await request.app.state.elevated_jobs.get(object_id(job_id))
+            if job is None:
+                raise HTTPException(status_code=404, detail="Not found")
+            return job
+
+        return await cached_json(request, compute)
+
+    @app.get("/listings/search")
+    async def search_listings(request: Request, q: str = Query(..., min_length=1), limit: int = Query(20, ge=1, le=100)):
+        async def compute():
+            return await request.app.state.listings.search(q, limit, HOT_PROJECTION)
+
+        return await cached_json(request, compute)
+
+    @app.get("/listings/{job_id}")
+    async def get_listing(request: Request, job_id: str, full: bool = False):
+        async def compute():
+            job = await request.app.state.listings.get(object_id(job_id), full)
+            if job is None:
+                raise HTTPException(status_code=404, detail="Not found")
+            return job
+
+        return await cached_json(request, compute)
+
+    return app
+
+
+app = create_app()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point: serve the API with uvicorn."""
+    import argparse
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Read API for elevated jobs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (each has its own pool and cache)")
+    args = parser.parse_args(argv)
+
+    uvicorn.run("backend.api.app:app", host=args.host, port=args.port, workers=args.workers, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
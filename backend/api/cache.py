@@ -0,0 +1,137 @@
+"""
+In-process response cache for the read API.
+Entries are serialized JSON bodies with an ETag, evicted least recently used
+beyond `max_entries` and expired after `ttl` seconds. Every write to the job
+collections bumps a shared data version (`cache_versions` collection); API
+processes poll it and drop their cache when it changes, so a saved elevated
+job is visible within one poll interval rather than one TTL.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Optional
+from collections import OrderedDict
+from datetime import datetime
+import asyncio
+import hashlib
+import json
+import time
+
+from backend.logging_config import get_logger
+
+logger = get_logger()
+
+VERSION_ID = "jobs"
+
+
+def encode_json(payload: Any) -> bytes:
+    """Compact JSON with ObjectIds as strings and datetimes in ISO 8601."""
+    def default(value: Any) -> str:
+        return value.isoformat() if isinstance(value, datetime) else str(value)
+
+    return json.dumps(payload, default=default, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class CacheEntry:
+    """A cached response body and its validator."""
+
+    def __init__(self, body: bytes, expires_at: float):
+        self.body = body
+        self.etag = f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+        self.expires_at = expires_at
+
+
+class ResponseCache:
+    """
+    TTL + LRU cache of encoded responses. Concurrent misses for the same key
+    share one computation instead of each querying MongoDB.
+    """
+
+    def __init__(self, max_entries: int = 2048, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.version: Optional[int] = None
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, body: bytes) -> CacheEntry:
+        entry = CacheEntry(body, time.monotonic() + self.ttl)
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+        return entry
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> CacheEntry:
+        """Cached entry for `key`, computing and encoding the payload on a miss."""
+        entry = self.get(key)
+        if entry is not None:
+            self.stats["hits"] += 1
+            return entry
+        if key in self._inflight:
+            self.stats["hits"] += 1
+            return await asyncio.shield(self._inflight[key])
+
+        self.stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        version = self.version
+        try:
+            body = encode_json(await compute())
+            # Don't store a result computed before an invalidation
+            entry = self.put(key, body) if version == self.version else CacheEntry(body, 0.0)
+            future.set_result(entry)
+            return entry
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so waiter-less failures don't warn
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def invalidate(self, version: Optional[int] = None):
+        """Drop every entry (the data changed or `version` differs from the last one seen)."""
+        if version is not None and version == self.version:
+            return
+        self.version = version if version is not None else (self.version or 0) + 1
+        self.entries.clear()
+        self.stats["invalidations"] += 1
+
+    def snapshot(self) -> Dict:
+        return {**self.stats, "entries": len(self.entries), "version": self.version}
+
+
+class CacheVersion:
+    """Shared data version; writers bump it and API processes poll it."""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def bump(self):
+        await self.collection.update_one({"_id": VERSION_ID}, {"$inc": {"version": 1}}, upsert=True)
+
+    async def current(self) -> int:
+        document = await self.collection.find_one({"_id": VERSION_ID})
+        return document["version"] if document else 0
+
+
+async def poll_version(cache: ResponseCache, version: CacheVersion, interval: float = 1.0):
+    """Invalidate `cache` whenever the shared version changes (runs until cancelled)."""
+    while True:
+        try:
+            cache.invalidate(await version.current())
+        except Exception as e:
+            # Keep serving; entries still expire after the TTL
+            logger.error(f"Failed to read the cache version: {str(e)}")
+        await asyncio.sleep(interval)
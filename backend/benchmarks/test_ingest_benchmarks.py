@@ -0,0 +1,52 @@
+"""Search ingestion hot path: parse a results page, build listing documents and write them."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from backend.database.raw_store import fingerprint, raw_document, split_listing
+from backend.utils.job_search import parse_job_response, prepare_job_documents
+
+
+def test_parse_job_response(benchmark, within_baseline, search_page):
+    parsed = benchmark(parse_job_response, search_page)
+    assert len(parsed.jobs) == len(search_page["jobs"])
+    within_baseline(benchmark)
+
+
+def test_job_listing_model_dump(benchmark, within_baseline, parsed_page):
+    dumped = benchmark(lambda: [job.model_dump() for job in parsed_page.jobs])
+    assert dumped[0]["apply_links"][0]["source"] == "Dice"
+    within_baseline(benchmark)
+
+
+def test_prepare_job_documents(benchmark, within_baseline, parsed_page):
+    documents = benchmark(prepare_job_documents, parsed_page)
+    assert documents[1]["title_family"] == "ml-engineer"
+    within_baseline(benchmark)
+
+
+def test_fingerprint_listings(benchmark, within_baseline, job_documents):
+    def split_and_fingerprint():
+        return [fingerprint(split_listing(document)[1]) for document in job_documents]
+
+    fingerprints = benchmark(split_and_fingerprint)
+    assert len(set(fingerprints)) == len(job_documents)
+    within_baseline(benchmark)
+
+
+def test_raw_document(benchmark, within_baseline, job_documents):
+    """Body compression for newly seen listings."""
+    bodies = [split_listing(document)[1] for document in job_documents]
+    documents = benchmark(lambda: [raw_document(body) for body in bodies])
+    assert documents[0]["codec"] == "zstd"
+    within_baseline(benchmark)
+
+
+def test_upsert_jobs(benchmark, within_baseline, ingest_repository, job_documents):
+    """Re-ingesting a page: the listing and body bulk writes (upserts after the first round)."""
+    inserted = ingest_repository.upsert_jobs([dict(document) for document in job_documents])
+    assert len(inserted) == len(job_documents)
+
+    benchmark(lambda: ingest_repository.upsert_jobs([dict(document) for document in job_documents]))
+    within_baseline(benchmark)
@@ -0,0 +1,50 @@
+"""Elevation hot path: extraction serialization and workflow state construction."""
+
+from datetime import datetime, UTC
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from backend.models.job_description_workflow_state import JobDescriptionProcessingState
+
+CREATED_AT = datetime(2024, 12, 12, 22, 49, 41, tzinfo=UTC)
+
+
+def test_job_description_model_dump_json(benchmark, within_baseline, structured_job):
+    dumped = benchmark(structured_job.model_dump, mode="json")
+    assert dumped["role_summary"]["title"] == "AI Engineer"
+    within_baseline(benchmark)
+
+
+def test_processing_state_construction(benchmark, within_baseline, job_documents):
+    """The initial state built for every listing the elevation workflow picks up."""
+    raw_job_data = dict(job_documents[0], _id="675c8a12bb620b427e9f009d")
+
+    def build():
+        return JobDescriptionProcessingState(
+            job_id="675c8a12bb620b427e9f009d", raw_job_data=raw_job_data,
+            created_at=CREATED_AT, updated_at=CREATED_AT
+        )
+
+    state = benchmark(build)
+    assert state.status == "extracting"
+    within_baseline(benchmark)
+
+
+def test_processing_state_from_graph_result(benchmark, within_baseline, job_documents, structured_job):
+    """The final state revalidated from the graph's dict result (structured job and grade included)."""
+    result = {
+        "job_id": "675c8a12bb620b427e9f009d",
+        "raw_job_data": dict(job_documents[0], _id="675c8a12bb620b427e9f009d"),
+        "structured_job": structured_job.model_dump(),
+        "grader_output": {"overall_quality_score": 0.92, "overall_feedback": "Complete and accurate."},
+        "attempts": 1,
+        "status": "completed",
+        "created_at": CREATED_AT,
+        "updated_at": CREATED_AT,
+    }
+
+    state = benchmark(lambda: JobDescriptionProcessingState(**result))
+    assert state.structured_job.role_summary.title == "AI Engineer"
+    within_baseline(benchmark)
@@ -1 +1,30 @@
-from .mongodb import get_jobs_collection, get_elevated_jobs_collection, get_searches_collection, mongodb 
\ No newline at end of file
+"""
+Database package exposing the MongoDB connection manager and collection accessors.
+"""
+
+from backend.database.mongodb import (
+    mongodb,
+    DB_NAME,
+    get_jobs_collection,
+    get_searches_collection,
+    get_elevated_jobs_collection,
+    get_model_tier_stats_collection,
+    get_rollups_collection,
+    get_raw_jobs_collection,
+    get_trigger_state_collection,
+    get_cache_versions_collection,
+    get_profiles_collection,
+    get_notifications_collection,
+    get_jobs_collection_sync,
+    get_searches_collection_sync,
+    get_elevated_jobs_collection_sync,
+    get_raw_jobs_collection_sync,
+)
+
+__all__ = [
+    'mongodb', 'DB_NAME', 'get_jobs_collection', 'get_searches_collection', 'get_elevated_jobs_collection',
+    'get_model_tier_stats_collection', 'get_rollups_collection', 'get_raw_jobs_collection', 'get_trigger_state_collection',
+    'get_cache_versions_collection', 'get_profiles_collection', 'get_notifications_collection',
+    'get_jobs_collection_sync', 'get_searches_collection_sync', 'get_elevated_jobs_collection_sync',
+    'get_raw_jobs_collection_sync'
+]
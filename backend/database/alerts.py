@@ -0,0 +1,229 @@
+"""
+Standing-query job alerts for saved resumes and interview profiles.
+Each saved profile stores the skill terms it mentions in a multikey-indexed
+`terms` array, which serves as the inverted index from skill to profiles.
+When a new elevated job is saved, only profiles sharing at least one of its
+requirement terms are read and scored, so the cost follows the job's term
+overlap rather than the number of saved profiles. Matches at or above a
+profile's threshold are written to `notifications`.
+
+Usage:
+    python -m backend.database.alerts add-profile resume.json [--interview profile.json] [--min-score 0.6]
+    python -m backend.database.alerts reindex
+    python -m backend.database.alerts notifications <profile_id> [--unread]
+"""
+
+from typing import Dict, List, Optional, Set
+from datetime import datetime, UTC
+import os
+
+from backend.database.mongodb import mongodb, get_profiles_collection, get_notifications_collection
+from backend.models.resume_models import Resume, InterviewProfile
+from backend.logging_config import get_logger
+
+logger = get_logger()
+
+# Default share of a job's weighted requirements a profile must cover to be alerted
+DEFAULT_MIN_SCORE = float(os.getenv("ALERT_MIN_SCORE", "0.6"))
+
+
+def profile_terms(
+    resume: Optional[Resume] = None,
+    interview_profile: Optional[InterviewProfile] = None,
+    vocabulary: Optional[Dict[str, int]] = None
+) -> Set[str]:
+    """
+    Skill terms of a profile: listed skills and project technologies as given,
+    plus vocabulary phrases mentioned in experience, projects and interview answers.
+    """
+    from backend.search.matching import MAX_PHRASE_TOKENS, extract_terms, normalize_term, resume_texts
+
+    vocabulary = vocabulary or {}
+    terms = set()
+    if resume is not None:
+        listed = list(resume.skills)
+        for project in resume.projects:
+            listed.extend((project.technologies or "").split(","))
+        terms |= {term for term in map(normalize_term, listed) if term and len(term.split()) <= MAX_PHRASE_TOKENS}
+        for text in resume_texts(resume):
+            terms |= extract_terms(text, vocabulary)
+    if interview_profile is not None:
+        for responses in interview_profile.responses.values():
+            for response in responses:
+                terms |= extract_terms(response.answer, vocabulary)
+    return terms
+
+
+class AlertsRepository:
+    """Saved profiles (`profiles`) and the job alerts raised for them (`notifications`)."""
+
+    def __init__(self, profiles_collection, notifications_collection):
+        self.profiles = profiles_collection
+        self.notifications = notifications_collection
+
+    async def ensure_indexes(self):
+        """Create the term index used to find candidate profiles and the notification indexes."""
+        from pymongo import ASCENDING, DESCENDING
+
+        await self.profiles.create_index([("terms", ASCENDING)], name="terms")
+        await self.notifications.create_index(
+            [("profile_id", ASCENDING), ("elevated_job_id", ASCENDING)], name="profile_job", unique=True
+        )
+        await self.notifications.create_index(
+            [("profile_id", ASCENDING), ("read", ASCENDING), ("created_at", DESCENDING)], name="profile_inbox"
+        )
+
+    async def save_profile(
+        self,
+        resume: Optional[Resume] = None,
+        interview_profile: Optional[InterviewProfile] = None,
+        min_score: float = DEFAULT_MIN_SCORE,
+        profile_id: Optional[str] = None
+    ) -> str:
+        """
+        Save (or replace) a profile and index its skill terms.
+
+        Returns:
+            str: ID of the profile
+        """
+        from bson import ObjectId
+        from backend.search.matching import get_match_index
+
+        terms = profile_terms(resume, interview_profile, get_match_index().vocabulary)
+        _id = ObjectId(profile_id) if profile_id else ObjectId()
+        await self.profiles.replace_one({"_id": _id}, {
+            "resume": resume.model_dump() if resume else None,
+            "interview_profile": interview_profile.model_dump() if interview_profile else None,
+            "terms": sorted(terms),
+            "min_score": min_score,
+            "updated_at": datetime.now(UTC)
+        }, upsert=True)
+        return str(_id)
+
+    async def reindex(self) -> int:
+        """Recompute every profile's terms, e.g. after the match vocabulary is rebuilt."""
+        from backend.search.matching import get_match_index
+
+        vocabulary = get_match_index().vocabulary
+        count = 0
+        async for profile in self.profiles.find({}, {"resume": 1, "interview_profile": 1}):
+            resume = Resume.model_validate(profile["resume"]) if profile.get("resume") else None
+            interview = (
+                InterviewProfile.model_validate(profile["interview_profile"])
+                if profile.get("interview_profile") else None
+            )
+            terms = profile_terms(resume, interview, vocabulary)
+            await self.profiles.update_one({"_id": profile["_id"]}, {"$set": {"terms": sorted(terms)}})
+            count += 1
+        return count
+
+    async def match_new_job(self, elevated_job: Dict) -> int:
+        """
+        Score the profiles sharing terms with a newly saved job and record alerts.
+
+        Returns:
+            int: Number of notifications written
+        """
+        from pymongo import UpdateOne
+        from backend.search.matching import get_match_index
+
+        weights = get_match_index().requirement_weights(elevated_job)
+        if not weights:
+            return 0
+
+        role = (elevated_job.get("structured_job") or {}).get("role_summary") or {}
+        ordered = sorted(weights, key=weights.get, reverse=True)
+        now = datetime.now(UTC)
+        operations = []
+        async for profile in self.profiles.find({"terms": {"$in": list(weights)}}, {"terms": 1, "min_score": 1}):
+            covered = set(profile["terms"]) & weights.keys()
+            score = sum(weights[term] for term in covered)
+            if score < profile.get("min_score", DEFAULT_MIN_SCORE):
+                continue
+            operations.append(UpdateOne(
+                {"profile_id": profile["_id"], "elevated_job_id": elevated_job["_id"]},
+                {"$setOnInsert": {
+                    "original_job_id": elevated_job.get("original_job_id"),
+                    "title": role.get("title"),
+                    "score": round(score, 4),
+                    "matched_terms": [term for term in ordered if term in covered],
+                    "missing_terms": [term for term in ordered if term not in covered],
+                    "read": False,
+                    "created_at": now
+                }},
+                upsert=True
+            ))
+
+        if not operations:
+            return 0
+        result = await self.notifications.bulk_write(operations, ordered=False)
+        logger.info("Raised job alerts", metadata={
+            "elevated_job_id": str(elevated_job["_id"]),
+            "notifications": result.upserted_count
+        })
+        return result.upserted_count
+
+    async def notifications_for(self, profile_id: str, unread_only: bool = False, limit: int = 50) -> List[Dict]:
+        """Newest alerts for a profile."""
+        from bson import ObjectId
+
+        query = {"profile_id": ObjectId(profile_id)}
+        if unread_only:
+            query["read"] = False
+        return await self.notifications.find(query).sort("created_at", -1).to_list(length=limit)
+
+    async def mark_read(self, profile_id: str, notification_ids: List[str]) -> int:
+        """Mark a profile's alerts as read."""
+        from bson import ObjectId
+
+        result = await self.notifications.update_many(
+            {"profile_id": ObjectId(profile_id), "_id": {"$in": [ObjectId(_id) for _id in notification_ids]}},
+            {"$set": {"read": True}}
+        )
+        return result.modified_count
+
+
+async def get_alerts_repository() -> AlertsRepository:
+    """Repository over the async `profiles` and `notifications` collections."""
+    return AlertsRepository(await get_profiles_collection(), await get_notifications_collection())
+
+
+async def _main(args) -> int:
+    from pathlib import Path
+
+    async with mongodb:
+        alerts = await get_alerts_repository()
+        await alerts.ensure_indexes()
+        if args.command == "add-profile":
+            resume = Resume.model_validate_json(Path(args.target).read_text())
+            interview = InterviewProfile.model_validate_json(Path(args.interview).read_text()) if args.interview else None
+            print(await alerts.save_profile(resume, interview, args.min_score))
+        elif args.command == "reindex":
+            logger.info("Reindexed profiles", metadata={"profiles": await alerts.reindex()})
+        else:
+            for notification in await alerts.notifications_for(args.target, args.unread):
+                print(f"{notification['score']:6.3f}  {notification['elevated_job_id']}  {notification.get('title')}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point for saving profiles and reading their alerts."""
+    import argparse
+    import asyncio
+    from backend.logging_config import setup_logging
+
+    parser = argparse.ArgumentParser(description="Job alerts for saved profiles")
+    parser.add_argument("command", choices=["add-profile", "reindex", "notifications"])
+    parser.add_argument("target", nargs="?", help="Resume JSON file (add-profile) or profile ID (notifications)")
+    parser.add_argument("--interview", help="Interview profile JSON file")
+    parser.add_argument("--min-score", type=float, default=DEFAULT_MIN_SCORE, help="Alert threshold (0-1)")
+    parser.add_argument("--unread", action="store_true", help="Only unread notifications")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    return asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
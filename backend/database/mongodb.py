@@ -1,84 +1,185 @@
 """
 MongoDB connection and collection management module.
 Provides singleton connection manager and collection access functions.
+
+A single `MongoDB` instance owns every client in the process:
+- one pooled Motor client per event loop (Motor clients are bound to the loop
+  they first run on, so scripts that call `asyncio.run` repeatedly and notebooks
+  using nest_asyncio each get their own)
+- one pooled PyMongo client for synchronous callers (ingest, notebooks)
+Both are built from the same URI and pool settings.
 """
 
-from typing import Optional
-from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo.server_api import ServerApi
-from pymongo.collection import Collection
-from pymongo.database import Database
-from dotenv import load_dotenv
-import os
-from logfire import Logfire, configure
-from os import getenv
-from backend.logging_config import setup_logging
+from typing import Dict, Optional, TYPE_CHECKING
 import asyncio
+import os
+from backend.logging_config import get_logger, setup_logging
 
-setup_logging()  # Call this before any logger usage
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+    from pymongo import MongoClient
+    from pymongo.collection import Collection
 
 # Initialize logging
-logger = Logfire()
+logger = get_logger()
+
+DB_NAME = 'jobs_db'
 
 class MongoDB:
     """
     MongoDB connection manager implementing singleton pattern.
-    
-    Manages database connection and provides access to collections.
-    Ensures single database connection is maintained throughout the application.
+
+    Manages database connections and provides access to collections.
+    Pool sizes default to the MONGODB_MAX_POOL_SIZE / MONGODB_MIN_POOL_SIZE /
+    MONGODB_MAX_IDLE_TIME_MS environment variables and can be changed with
+    `configure()` before the first connection.
+
+    Usage as an async context manager closes every client on exit:
+        async with mongodb:
+            jobs = await get_jobs_collection()
     """
     _instance: Optional['MongoDB'] = None
-    _client: Optional[AsyncIOMotorClient] = None
-    
+
     def __new__(cls):
         """Singleton pattern to ensure single database connection"""
         if cls._instance is None:
             cls._instance = super(MongoDB, cls).__new__(cls)
+            cls._instance._async_clients = {}
+            cls._instance._sync_client = None
+            cls._instance._pool_options = {}
         return cls._instance
-    
+
+    def configure(
+        self,
+        max_pool_size: Optional[int] = None,
+        min_pool_size: Optional[int] = None,
+        max_idle_time_ms: Optional[int] = None
+    ):
+        """
+        Set connection pool sizing for clients created after this call.
+
+        Args:
+            max_pool_size: Maximum connections per client (default 50)
+            min_pool_size: Connections kept open when idle (default 0)
+            max_idle_time_ms: Idle time before a pooled connection is closed
+        """
+        options = {
+            "maxPoolSize": max_pool_size,
+            "minPoolSize": min_pool_size,
+            "maxIdleTimeMS": max_idle_time_ms,
+        }
+        self._pool_options.update({key: value for key, value in options.items() if value is not None})
+
+    def _client_options(self) -> Dict:
+        """Connection URI and keyword arguments shared by the async and sync clients."""
+        from pymongo.server_api import ServerApi
+
+        setup_logging()  # Loads .env and configures Logfire once per process
+
+        uri = os.getenv('MONGODB_URI')
+        if not uri:
+            raise ValueError("MongoDB URI not found in environment variables")
+
+        options = {
+            "server_api": ServerApi('1'),
+            "serverSelectionTimeoutMS": 5000,
+            "maxPoolSize": int(os.getenv('MONGODB_MAX_POOL_SIZE', '50')),
+            "minPoolSize": int(os.getenv('MONGODB_MIN_POOL_SIZE', '0')),
+        }
+        if os.getenv('MONGODB_MAX_IDLE_TIME_MS'):
+            options["maxIdleTimeMS"] = int(os.getenv('MONGODB_MAX_IDLE_TIME_MS'))
+        options.update(self._pool_options)
+        return {"uri": uri, **options}
+
+    def _masked(self, uri: str) -> str:
+        """URI with the password hidden for logging."""
+        password = os.getenv('MONGODB_PASSWORD')
+        return uri.replace(password, '***') if password else uri
+
+    @property
+    def _client(self) -> Optional['AsyncIOMotorClient']:
+        """Motor client for the running event loop, if one has been created."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        return self._async_clients.get(loop)
+
     async def connect(self):
-        """Async connection initialization"""
+        """Async connection initialization for the running event loop"""
         if self._client is None:
             await self._connect()
-    
+
     async def _connect(self):
         """Async MongoDB connection setup"""
-        load_dotenv()
-        
-        uri = os.getenv('MONGODB_URI')
-        if not uri:
-            raise ValueError("MongoDB URI not found in environment variables")
-        
-        masked_uri = uri.replace(os.getenv('MONGODB_PASSWORD', ''), '***')
-        logger.info(f"Attempting to connect with URI: {masked_uri}")
-        
+        # Driver imports are deferred so importing this module stays cheap
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        options = self._client_options()
+        uri = options.pop("uri")
+        logger.info(f"Attempting to connect with URI: {self._masked(uri)}", metadata={
+            "max_pool_size": options["maxPoolSize"],
+            "min_pool_size": options["minPoolSize"]
+        })
+
         try:
-            self._client = AsyncIOMotorClient(
-                uri,
-                server_api=ServerApi('1'),
-                serverSelectionTimeoutMS=5000
-            )
-            
+            loop = asyncio.get_running_loop()
+            # Drop clients whose loops have been closed (e.g. after asyncio.run returned)
+            for stale_loop in [known for known in self._async_clients if known.is_closed()]:
+                self._async_clients.pop(stale_loop).close()
+
+            client = AsyncIOMotorClient(uri, io_loop=loop, **options)
+
             # Test connection
-            await self._client.admin.command('ping')
+            await client.admin.command('ping')
+            # Concurrent first callers may race here; keep one client per loop
+            if self._async_clients.setdefault(loop, client) is not client:
+                client.close()
+                return
             logger.info("Successfully connected to MongoDB!")
-            
+
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {str(e)}")
             raise
-    
-    async def get_collection(self, db_name: str, collection_name: str):
+
+    async def get_collection(self, db_name: str, collection_name: str) -> 'AsyncIOMotorCollection':
         """Get MongoDB collection with async connection handling"""
         if not self._client:
             await self.connect()
         return self._client[db_name][collection_name]
-    
+
+    @property
+    def sync_client(self) -> 'MongoClient':
+        """Pooled synchronous PyMongo client, created on first use."""
+        if self._sync_client is None:
+            from pymongo import MongoClient
+
+            options = self._client_options()
+            uri = options.pop("uri")
+            logger.info(f"Creating synchronous MongoDB client for: {self._masked(uri)}")
+            self._sync_client = MongoClient(uri, **options)
+        return self._sync_client
+
+    def get_sync_collection(self, db_name: str, collection_name: str) -> 'Collection':
+        """Get MongoDB collection for synchronous callers"""
+        return self.sync_client[db_name][collection_name]
+
     def close(self):
-        """Close MongoDB connection and cleanup resources."""
-        if self._client:
-            self._client.close()
-            self._client = None
-            logger.info("MongoDB connection closed")
+        """Close all MongoDB connections and cleanup resources."""
+        for client in self._async_clients.values():
+            client.close()
+        self._async_clients.clear()
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+        logger.info("MongoDB connection closed")
+
+    async def __aenter__(self) -> 'MongoDB':
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
 
 # Create singleton instance
 mongodb = MongoDB()
@@ -86,29 +187,141 @@ mongodb = MongoDB()
 async def get_jobs_collection():
     """
     Get the jobs collection from MongoDB.
-    
+
     Returns:
         Collection: MongoDB collection for storing job listings
     """
-    return await mongodb.get_collection('jobs_db', 'job_listings')
+    return await mongodb.get_collection(DB_NAME, 'job_listings')
 
 async def get_searches_collection():
     """
     Get the searches collection from MongoDB.
-    
+
     Returns:
         Collection: MongoDB collection for storing job search metadata
     """
-    return await mongodb.get_collection('jobs_db', 'job_searches')
+    return await mongodb.get_collection(DB_NAME, 'job_searches')
 
 async def get_elevated_jobs_collection():
     """
     Get the elevated jobs collection from MongoDB.
     Stores standardized and enriched job descriptions after processing.
-    
+
     Returns:
         Collection: MongoDB collection for storing processed job listings
     """
-    return await mongodb.get_collection('jobs_db', 'elevated_jobs')
+    return await mongodb.get_collection(DB_NAME, 'elevated_jobs')
+
+async def get_model_tier_stats_collection():
+    """
+    Get the model tier statistics collection from MongoDB.
+    Stores per company / source success counts used by the extraction model cascade.
+
+    Returns:
+        Collection: MongoDB collection for model cascade statistics
+    """
+    return await mongodb.get_collection(DB_NAME, 'model_tier_stats')
+
+async def get_rollups_collection():
+    """
+    Get the rollups collection from MongoDB.
+    Stores per title / location / month analytics aggregated from elevated jobs.
+
+    Returns:
+        Collection: MongoDB collection for analytics rollups
+    """
+    return await mongodb.get_collection(DB_NAME, 'job_rollups')
+
+async def get_raw_jobs_collection():
+    """
+    Get the raw jobs collection from MongoDB.
+    Stores zstd-compressed job listing bodies keyed by content fingerprint.
+
+    Returns:
+        Collection: MongoDB collection for cold job listing bodies
+    """
+    return await mongodb.get_collection(DB_NAME, 'job_listings_raw')
+
+async def get_trigger_state_collection():
+    """
+    Get the trigger state collection from MongoDB.
+    Stores change stream resume tokens and polling positions for event-driven workers.
+
+    Returns:
+        Collection: MongoDB collection for trigger checkpoints
+    """
+    return await mongodb.get_collection(DB_NAME, 'trigger_state')
+
+async def get_cache_versions_collection():
+    """
+    Get the cache versions collection from MongoDB.
+    Holds the data version that writers bump to invalidate API response caches.
+
+    Returns:
+        Collection: MongoDB collection for cache versions
+    """
+    return await mongodb.get_collection(DB_NAME, 'cache_versions')
+
+async def get_profiles_collection():
+    """
+    Get the profiles collection from MongoDB.
+    Stores saved resumes and interview profiles with the skill terms used for job alerts.
+
+    Returns:
+        Collection: MongoDB collection for saved profiles
+    """
+    return await mongodb.get_collection(DB_NAME, 'profiles')
+
+async def get_notifications_collection():
+    """
+    Get the notifications collection from MongoDB.
+    Stores job alerts raised when a new elevated job matches a saved profile.
+
+    Returns:
+        Collection: MongoDB collection for job alert notifications
+    """
+    return await mongodb.get_collection(DB_NAME, 'notifications')
+
+def get_jobs_collection_sync():
+    """
+    Get the jobs collection for synchronous callers (ingest, notebooks).
+
+    Returns:
+        Collection: PyMongo collection for job listings
+    """
+    return mongodb.get_sync_collection(DB_NAME, 'job_listings')
+
+def get_searches_collection_sync():
+    """
+    Get the searches collection for synchronous callers.
+
+    Returns:
+        Collection: PyMongo collection for job search metadata
+    """
+    return mongodb.get_sync_collection(DB_NAME, 'job_searches')
+
+def get_elevated_jobs_collection_sync():
+    """
+    Get the elevated jobs collection for synchronous callers.
+
+    Returns:
+        Collection: PyMongo collection for processed job listings
+    """
+    return mongodb.get_sync_collection(DB_NAME, 'elevated_jobs')
+
+def get_raw_jobs_collection_sync():
+    """
+    Get the raw jobs collection for synchronous callers.
+
+    Returns:
+        Collection: PyMongo collection for cold job listing bodies
+    """
+    return mongodb.get_sync_collection(DB_NAME, 'job_listings_raw')
 
-__all__ = ['mongodb', 'get_jobs_collection', 'get_searches_collection', 'get_elevated_jobs_collection'] 
\ No newline at end of file
+__all__ = [
+    'mongodb', 'DB_NAME', 'get_jobs_collection', 'get_searches_collection', 'get_elevated_jobs_collection',
+    'get_model_tier_stats_collection', 'get_rollups_collection', 'get_raw_jobs_collection', 'get_trigger_state_collection',
+    'get_cache_versions_collection', 'get_profiles_collection', 'get_notifications_collection',
+    'get_jobs_collection_sync', 'get_searches_collection_sync', 'get_elevated_jobs_collection_sync',
+    'get_raw_jobs_collection_sync'
+]
@@ -0,0 +1,76 @@
+"""
+Keyset (cursor) pagination helpers.
+Pages are ordered by `(created_at, _id)` descending and continue from the last
+document of the previous page, so every page is a bounded index range scan
+instead of a `skip` over all earlier documents.
+"""
+
+from typing import Dict, List, Optional
+from datetime import datetime
+import base64
+import json
+from pydantic import BaseModel, Field
+
+# Sort order served by the `(created_at desc, _id desc)` index
+KEYSET_SORT = [("created_at", -1), ("_id", -1)]
+
+
+class Page(BaseModel):
+    """One page of results and the token for the next page."""
+    items: List[Dict] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(None, description="Opaque continuation token; None on the last page")
+
+
+def encode_cursor(document: Dict) -> str:
+    """Encode the keyset position of a document as an opaque URL-safe token."""
+    position = {"t": document["created_at"].isoformat(), "id": str(document["_id"])}
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Dict:
+    """
+    Decode a continuation token.
+
+    Returns:
+        Dict: `created_at` and `_id` of the last document on the previous page
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    from bson import ObjectId
+
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return {"created_at": datetime.fromisoformat(position["t"]), "_id": ObjectId(position["id"])}
+    except Exception as e:
+        raise ValueError(f"Invalid continuation token: {token!r}") from e
+
+
+def keyset_query(query: Dict, cursor: Optional[str] = None) -> Dict:
+    """Restrict a query to documents after the cursor position."""
+    if not cursor:
+        return query
+    position = decode_cursor(cursor)
+    after = {"$or": [
+        {"created_at": {"$lt": position["created_at"]}},
+        {"created_at": position["created_at"], "_id": {"$lt": position["_id"]}}
+    ]}
+    return {"$and": [query, after]} if query else after
+
+
+def page_projection(fields: Optional[List[str]] = None) -> Optional[Dict]:
+    """Projection for the requested fields, always keeping the keyset fields."""
+    if not fields:
+        return None
+    return {field: 1 for field in [*fields, "created_at", "_id"]}
+
+
+def make_page(documents: List[Dict], limit: int) -> Page:
+    """
+    Build a page from up to `limit + 1` documents; the extra document only
+    signals that another page exists.
+    """
+    items = documents[:limit]
+    has_more = len(documents) > limit
+    return Page(items=items, next_cursor=encode_cursor(items[-1]) if has_more and items else None)
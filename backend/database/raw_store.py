@@ -0,0 +1,117 @@
+"""
+Hot/cold split of job listing storage.
+`job_listings` keeps a slim hot document per listing (identity, status,
+normalized fields and a `fingerprint`), while the bulky body fields are stored
+once per distinct body in `job_listings_raw`, zstd-compressed and keyed by the
+fingerprint (a hash of the body). Readers that need the text merge the body
+back in; listings written before the split still carry their body inline and
+are read as-is.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime, UTC
+import hashlib
+import json
+
+from backend.database.mongodb import get_raw_jobs_collection_sync
+
+# Fields moved to the cold collection
+COLD_FIELDS = ("description", "job_highlights", "apply_links", "sharing_link")
+
+# Projection that leaves the body (and its text-index terms) out of hot reads
+HOT_PROJECTION = {field: 0 for field in (*COLD_FIELDS, "search_terms")}
+
+# A listing as fetched: the SearchAPI fields and the search it came from. Everything
+# else on a stored listing is derived at ingest (normalized, geo, skill, title,
+# priority and link-check fields) or elevation bookkeeping.
+SOURCE_FIELDS = frozenset({
+    "_id", "position", "title", "company_name", "location", "via", "extensions", "detected_extensions",
+    "apply_link", *COLD_FIELDS, "search_id", "search_query", "search_location", "fetched_at",
+})
+
+CODEC = "zstd"
+COMPRESSION_LEVEL = 6
+
+
+def split_listing(job: Dict) -> Tuple[Dict, Dict]:
+    """Split a listing into its hot fields and its body."""
+    hot = {key: value for key, value in job.items() if key not in COLD_FIELDS}
+    body = {field: job[field] for field in COLD_FIELDS if field in job}
+    return hot, body
+
+
+def source_listing(job: Dict) -> Dict:
+    """The fetched fields of a listing, as given to the extraction and grading prompts."""
+    return {key: value for key, value in job.items() if key in SOURCE_FIELDS}
+
+
+def fingerprint(body: Dict) -> str:
+    """Stable content hash of a body (canonical JSON, SHA-256)."""
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def compress_body(body: Dict) -> bytes:
+    import zstandard
+
+    payload = json.dumps(body, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+    return zstandard.ZstdCompressor(level=COMPRESSION_LEVEL).compress(payload)
+
+
+def decompress_body(data: bytes) -> Dict:
+    import zstandard
+
+    return json.loads(zstandard.ZstdDecompressor().decompress(data))
+
+
+def raw_document(body: Dict) -> Dict:
+    """
+    Cold document fields for a body, upserted under `_id: fingerprint(body)` with
+    `$setOnInsert` so identical bodies are stored (and compressed) once.
+    """
+    from bson import Binary
+
+    data = compress_body(body)
+    return {"codec": CODEC, "body": Binary(data), "size": len(data), "created_at": datetime.now(UTC)}
+
+
+def merge_body(job: Dict, raw: Optional[Dict]) -> Dict:
+    """Listing with its body fields restored (unchanged if the body is inline or missing)."""
+    if raw is None:
+        return job
+    return {**job, **decompress_body(raw["body"])}
+
+
+def with_raw_bodies(documents: Iterable[Dict], raw_collection=None, batch_size: int = 500) -> Iterator[Dict]:
+    """
+    Stream listings with their bodies merged back in, fetching the bodies of
+    each batch in one query. Documents need their `fingerprint` projected.
+    """
+    raw_collection = raw_collection if raw_collection is not None else get_raw_jobs_collection_sync()
+    batch: List[Dict] = []
+
+    def flush() -> Iterator[Dict]:
+        fingerprints = list({job["fingerprint"] for job in batch if job.get("fingerprint")})
+        bodies = {raw["_id"]: raw for raw in raw_collection.find({"_id": {"$in": fingerprints}})} if fingerprints else {}
+        for job in batch:
+            yield merge_body(job, bodies.get(job.get("fingerprint")))
+
+    for document in documents:
+        batch.append(document)
+        if len(batch) >= batch_size:
+            yield from flush()
+            batch = []
+    if batch:
+        yield from flush()
+
+
+async def load_raw_body(job: Dict, jobs_collection, raw_collection) -> Dict:
+    """
+    Full listing for elevation: the body from `job_listings_raw`, or for
+    listings stored before the split, the inline body fields.
+    """
+    if job.get("fingerprint"):
+        raw = await raw_collection.find_one({"_id": job["fingerprint"]})
+        return merge_body(job, raw)
+    inline = await jobs_collection.find_one({"_id": job["_id"]}, {field: 1 for field in COLD_FIELDS})
+    return {**job, **{key: value for key, value in (inline or {}).items() if key != "_id"}}
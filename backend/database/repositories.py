@@ -0,0 +1,621 @@
+"""
+Typed repository methods for the hot MongoDB queries.
+Repositories wrap a collection handle from `backend.database.mongodb` so the
+query shapes (and the indexes that serve them) live in one place.
+"""
+
+from typing import Callable, Dict, List, Optional
+from datetime import datetime, timedelta, UTC
+import re
+
+# Driver imports (bson, pymongo) are deferred to the methods that use them so
+# importing this module stays cheap for CLI entry points
+from backend.database.mongodb import (
+    get_jobs_collection,
+    get_elevated_jobs_collection,
+    get_raw_jobs_collection,
+    get_jobs_collection_sync,
+    get_searches_collection_sync,
+    get_raw_jobs_collection_sync,
+)
+from backend.database.pagination import KEYSET_SORT, Page, keyset_query, make_page, page_projection
+from backend.database.raw_store import HOT_PROJECTION, fingerprint, load_raw_body, raw_document, split_listing
+from backend.search.tokens import body_terms
+from backend.utils.geocoding import EARTH_RADIUS_MILES, get_gazetteer
+from backend.utils.titles import get_title_canonicalizer
+
+# Fields that identify a job listing across repeated searches
+JOB_IDENTITY_FIELDS = ('title', 'company_name', 'location', 'apply_link')
+
+# Equality, then sort/range fields (see backend.utils.normalization)
+NORMALIZED_INDEX = [("is_remote", 1), ("posted_date", -1), ("salary_min", -1)]
+# Radius queries on the geocoded point, region queries on the state code (see backend.utils.geocoding)
+GEO_INDEX = [("location_geo", "2dsphere")]
+REGION_INDEX = [("location_region", 1), ("location_city", 1)]
+DEFAULT_RADIUS_MILES = 25
+# Canonical title family and seniority (see backend.utils.titles)
+TITLE_FAMILY_INDEX = [("title_family", 1), ("title_seniority", 1)]
+
+# Text index fields and weights per collection (one text index per collection). Split
+# listings keep the distinct terms of their compressed body in `search_terms`.
+LISTINGS_TEXT_WEIGHTS = {"title": 10, "job_highlights.items": 3, "description": 1, "search_terms": 1}
+ELEVATED_TEXT_WEIGHTS = {
+    "structured_job.role_summary.title": 10,
+    "structured_job.responsibilities_and_qualifications.tools_and_technologies": 5,
+    "structured_job.responsibilities_and_qualifications.required_qualifications": 3,
+    "structured_job.responsibilities_and_qualifications.preferred_qualifications": 3,
+    "structured_job.responsibilities_and_qualifications.responsibilities": 2,
+    "structured_job.company_overview.about": 1,
+}
+
+
+# Server error codes for an index name reused with other options or keys
+INDEX_CONFLICT_CODES = (85, 86)
+
+
+def text_index_spec(weights: Dict[str, int]) -> List:
+    return [(field, "text") for field in weights]
+
+
+async def ensure_text_index(collection, weights: Dict[str, int], name: str):
+    """Create the collection's text index, replacing one built with other fields or weights."""
+    from pymongo.errors import OperationFailure
+
+    try:
+        await collection.create_index(text_index_spec(weights), weights=weights, name=name)
+    except OperationFailure as error:
+        if error.code not in INDEX_CONFLICT_CODES:
+            raise
+        await collection.drop_index(name)
+        await collection.create_index(text_index_spec(weights), weights=weights, name=name)
+
+
+async def text_search(collection, query: str, limit: int = 20, projection: Optional[Dict] = None) -> List[Dict]:
+    """
+    Ranked `$text` search; quoted phrases in `query` must match exactly.
+    Results carry their relevance as `score`.
+    """
+    projection = {**(projection or {}), "score": {"$meta": "textScore"}}
+    return await collection.find({"$text": {"$search": query}}, projection) \
+        .sort([("score", {"$meta": "textScore"})]) \
+        .limit(limit) \
+        .to_list(length=limit)
+
+
+def normalized_filters(
+    min_salary: Optional[int] = None,
+    posted_within_days: Optional[int] = None,
+    is_remote: Optional[bool] = None
+) -> Dict:
+    """
+    Filters on the normalized salary / posting date / remote fields, served by
+    the `remote_posted_salary` index on both job collections.
+
+    Args:
+        min_salary: Minimum annualized salary floor
+        posted_within_days: Only jobs posted in the last N days
+        is_remote: Only remote (True) or non-remote (False) jobs
+    """
+    query: Dict = {}
+    if is_remote is not None:
+        query["is_remote"] = is_remote
+    if posted_within_days is not None:
+        query["posted_date"] = {"$gte": datetime.now(UTC) - timedelta(days=posted_within_days)}
+    if min_salary is not None:
+        query["salary_min"] = {"$gte": min_salary}
+    return query
+
+
+def location_filters(
+    near: Optional[str] = None,
+    within_miles: Optional[float] = None,
+    region: Optional[str] = None
+) -> Dict:
+    """
+    Filters on the geocoded location fields, served by the `location_geo`
+    (2dsphere) and `location_region` indexes on both job collections.
+
+    Args:
+        near: Place the radius is centered on, e.g. "Seattle, WA"
+        within_miles: Radius around `near` (default `DEFAULT_RADIUS_MILES`)
+        region: State code or name, e.g. "WA" or "Washington"
+
+    Raises:
+        ValueError: If `near` or `region` isn't in the gazetteer
+    """
+    query: Dict = {}
+    if near:
+        center = get_gazetteer().geocode(near)
+        if center is None or center.point() is None:
+            raise ValueError(f"Unknown location: {near}")
+        radius = within_miles if within_miles is not None else DEFAULT_RADIUS_MILES
+        # $geoWithin (unlike $near) leaves the sort order alone, so keyset pagination still applies
+        query["location_geo"] = {
+            "$geoWithin": {"$centerSphere": [center.point()["coordinates"], radius / EARTH_RADIUS_MILES]}
+        }
+    if region:
+        code = get_gazetteer().region_code(region)
+        if code is None:
+            raise ValueError(f"Unknown region: {region}")
+        query["location_region"] = code
+    return query
+
+
+class JobListingsRepository:
+    """Async access to `job_listings` (and their bodies in `job_listings_raw`) for the elevation workflow."""
+
+    def __init__(self, collection, raw_collection=None):
+        self.collection = collection
+        self.raw_collection = raw_collection
+
+    async def ensure_indexes(self):
+        """
+        Create the indexes backing the pending-jobs, normalized-field, location,
+        title-family, export and link-check queries.
+        """
+        from pymongo import ASCENDING, DESCENDING
+
+        await self.collection.create_index(
+            [
+                ("extracted", ASCENDING),
+                ("elevation_status", ASCENDING),
+                ("next_eligible_at", ASCENDING),
+                ("_id", DESCENDING)
+            ],
+            name="pending_elevation"
+        )
+        await self.collection.create_index(NORMALIZED_INDEX, name="remote_posted_salary")
+        await self.collection.create_index(GEO_INDEX, name="location_geo")
+        await self.collection.create_index(REGION_INDEX, name="location_region")
+        await self.collection.create_index(TITLE_FAMILY_INDEX, name="title_family")
+        await ensure_text_index(self.collection, LISTINGS_TEXT_WEIGHTS, "listing_text")
+        # Range scans for incremental exports
+        await self.collection.create_index([("fetched_at", ASCENDING)], name="fetched_at")
+        # Body lookups when pruning unreferenced raw bodies
+        await self.collection.create_index([("fingerprint", ASCENDING)], name="fingerprint", sparse=True)
+        # Only eligible jobs carry a priority key, so the next job is the first entry of this index;
+        # `job_titles` batches walk the title and family variants instead
+        for name, fields in [("pending_priority", []), ("pending_priority_title", ["title"]),
+                             ("pending_priority_family", ["title_family"])]:
+            await self.collection.create_index(
+                [*((field, ASCENDING) for field in fields), ("priority_key", ASCENDING)],
+                name=name,
+                partialFilterExpression={"priority_key": {"$exists": True}}
+            )
+        # Jobs waiting to be scored: new listings, retries after their backoff, requeued dead letters
+        await self.collection.create_index(
+            [("priority_due_at", ASCENDING)],
+            name="priority_due",
+            partialFilterExpression={"priority_due_at": {"$exists": True}}
+        )
+        await self.collection.create_index([("duplicate_key", ASCENDING)], name="duplicate_key", sparse=True)
+        # Apply link checks due (unchecked listings index as null)
+        await self.collection.create_index([("link_check.next_check_at", ASCENDING)], name="link_check_due")
+
+    async def search(self, query: str, limit: int = 20, projection: Optional[Dict] = None) -> List[Dict]:
+        """Keyword search over titles, highlights and descriptions (body terms of split listings)."""
+        return await text_search(self.collection, query, limit, projection)
+
+    @staticmethod
+    def pending_query(job_titles: Optional[List[str]] = None) -> Dict:
+        """
+        Query for jobs eligible for elevation: not yet extracted, not dead-lettered,
+        not expired (dead apply links) and past their retry backoff (or never failed).
+        `job_titles` match their exact title or any title in the same family.
+        """
+        query = {
+            "extracted": {"$ne": True},
+            "elevation_status": {"$ne": "dead_letter"},
+            "expired": {"$ne": True},
+            "next_eligible_at": {"$not": {"$gt": datetime.now(UTC)}}
+        }
+        if job_titles:
+            families = sorted(get_title_canonicalizer().families_for(job_titles))
+            query["$or"] = [{"title": {"$in": job_titles}}, {"title_family": {"$in": families}}]
+        return query
+
+    async def find_pending(self, limit: int, job_titles: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Eligible jobs in priority order (lowest `priority_key` first), up to
+        `limit`; jobs are scored by `assign_priorities`. Only hot fields are
+        returned; use `load_raw` for the body of a job that is actually being elevated.
+        """
+        query = {**self.pending_query(job_titles), "priority_key": {"$exists": True}}
+        return await self.collection.find(query, HOT_PROJECTION) \
+            .sort("priority_key", 1) \
+            .limit(limit) \
+            .to_list(length=limit)
+
+    async def assign_priorities(self, policy, limit: int = 500, rescore: bool = False) -> int:
+        """
+        Score pending jobs whose `priority_due_at` has passed (new listings,
+        retries at the end of their backoff, requeued dead letters) and pending
+        listings stored before ingest marked them due (neither field set), or
+        every pending job with `rescore`. The enqueue time is the listing's
+        insertion time (its ObjectId), so fetching a listing again doesn't reset its aging.
+
+        Args:
+            policy: `backend.utils.priority.PriorityPolicy`
+            limit: Most jobs scored (0 for no limit)
+            rescore: Recompute keys that already exist (after changing the weights)
+
+        Returns:
+            int: Number of jobs scored
+        """
+        from pymongo import UpdateOne
+        from backend.utils.priority import duplicate_key
+
+        query = self.pending_query()
+        if not rescore:
+            query["$or"] = [
+                # Served by the `priority_due` index
+                {"priority_due_at": {"$lte": datetime.now(UTC)}},
+                # Listings stored before ingest marked them due; once scored they no longer match
+                {"priority_due_at": {"$exists": False}, "priority_key": {"$exists": False}},
+            ]
+        projection = {"title": 1, "company_name": 1, "posted_date": 1, "fetched_at": 1, "duplicate_key": 1}
+        scored = 0
+
+        async def flush(jobs: List[Dict]) -> int:
+            keys = {job["_id"]: duplicate_key(job) for job in jobs}
+            pipeline = [
+                {"$match": {"duplicate_key": {"$in": list(set(keys.values()))}}},
+                {"$group": {"_id": "$duplicate_key", "count": {"$sum": 1}}},
+            ]
+            groups = await self.collection.aggregate(pipeline).to_list(length=None)
+            sizes = {group["_id"]: group["count"] for group in groups}
+            # Jobs keyed in this pass aren't counted by the aggregation yet
+            for job in jobs:
+                if job.get("duplicate_key") != keys[job["_id"]]:
+                    sizes[keys[job["_id"]]] = sizes.get(keys[job["_id"]], 0) + 1
+            now = datetime.now(UTC)
+            operations = []
+            for job in jobs:
+                score = policy.score(job, sizes[keys[job["_id"]]], now)
+                operations.append(UpdateOne({"_id": job["_id"]}, {
+                    "$set": {
+                        "duplicate_key": keys[job["_id"]],
+                        "priority_key": policy.key(job["_id"].generation_time, score),
+                    },
+                    "$unset": {"priority_due_at": ""}
+                }))
+            await self.collection.bulk_write(operations, ordered=False)
+            return len(operations)
+
+        batch: List[Dict] = []
+        async for job in self.collection.find(query, projection).limit(limit):
+            batch.append(job)
+            if len(batch) >= 500:
+                scored += await flush(batch)
+                batch = []
+        if batch:
+            scored += await flush(batch)
+        return scored
+
+    async def find_pending_by_ids(self, job_ids: List[str], job_titles: Optional[List[str]] = None) -> List[Dict]:
+        """The given jobs that are still eligible for elevation (hot fields only)."""
+        from bson import ObjectId
+
+        query = {**self.pending_query(job_titles), "_id": {"$in": [ObjectId(job_id) for job_id in job_ids]}}
+        return await self.collection.find(query, HOT_PROJECTION).to_list(length=len(job_ids))
+
+    async def get(self, job_id: str, full: bool = False) -> Optional[Dict]:
+        """One listing by ID; hot fields only unless `full`."""
+        from bson import ObjectId
+
+        job = await self.collection.find_one({"_id": ObjectId(job_id)}, HOT_PROJECTION)
+        return await self.load_raw(job) if job is not None and full else job
+
+    async def load_raw(self, job: Dict) -> Dict:
+        """A pending job with its description, highlights and links restored."""
+        return await load_raw_body(job, self.collection, self.raw_collection)
+
+    async def mark_elevated(self, job_id: str, elevated_job_id: str):
+        """Flag a job as extracted and link it to its elevated document."""
+        from bson import ObjectId
+
+        await self.collection.update_one(
+            {"_id": ObjectId(job_id)},
+            {
+                "$set": {
+                    "extracted": True,
+                    "elevated_job_id": elevated_job_id,
+                    "elevation_status": "elevated"
+                },
+                "$unset": {"next_eligible_at": "", "priority_key": "", "priority_due_at": ""}
+            }
+        )
+
+    async def record_failure(
+        self,
+        job_id: str,
+        error_message: Optional[str],
+        quality_score: Optional[float],
+        max_failures: int,
+        retry_delay: Callable[[int], timedelta]
+    ) -> Optional[Dict]:
+        """
+        Persist a failed elevation: bump the failure count, store the last error
+        and score, and either schedule the next attempt or dead-letter the job.
+
+        Args:
+            job_id: Job listing ID
+            error_message: Last error
+            quality_score: Last grader score, if grading ran
+            max_failures: Failures after which the job is dead-lettered
+            retry_delay: Backoff for a given failure count
+
+        Returns:
+            Optional[Dict]: The fields set on the job, or None if it no longer exists
+        """
+        from bson import ObjectId
+        from pymongo import ReturnDocument
+
+        now = datetime.now(UTC)
+        job = await self.collection.find_one_and_update(
+            {"_id": ObjectId(job_id)},
+            {
+                "$inc": {"elevation_failures": 1},
+                "$set": {
+                    "elevation_last_error": error_message,
+                    "elevation_last_score": quality_score,
+                    "elevation_failed_at": now
+                }
+            },
+            projection={"elevation_failures": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        if job is None:
+            return None
+
+        failures = job["elevation_failures"]
+        if failures >= max_failures:
+            update = {"elevation_status": "dead_letter", "next_eligible_at": None}
+            # Dead letters leave the priority queue; a requeue scores them again
+            operations = {"$set": update, "$unset": {"priority_key": "", "priority_due_at": ""}}
+        else:
+            update = {"elevation_status": "retry", "next_eligible_at": now + retry_delay(failures)}
+            # Out of the priority queue while backing off, scored again once the backoff ends
+            operations = {
+                "$set": {**update, "priority_due_at": update["next_eligible_at"]},
+                "$unset": {"priority_key": ""}
+            }
+        await self.collection.update_one({"_id": job["_id"]}, operations)
+        return {"elevation_failures": failures, **update}
+
+    async def requeue_dead_letters(self, job_ids: Optional[List[str]] = None) -> int:
+        """Return dead-lettered jobs to the pending pool; returns the number requeued."""
+        from bson import ObjectId
+
+        query = {"elevation_status": "dead_letter"}
+        if job_ids:
+            query["_id"] = {"$in": [ObjectId(job_id) for job_id in job_ids]}
+        result = await self.collection.update_many(
+            query,
+            {
+                "$set": {"priority_due_at": datetime.now(UTC)},
+                "$unset": {"elevation_status": "", "elevation_failures": "", "next_eligible_at": ""}
+            }
+        )
+        return result.modified_count
+
+
+def elevated_jobs_query(
+    title: Optional[str] = None,
+    title_family: Optional[str] = None,
+    seniority: Optional[str] = None,
+    industry: Optional[str] = None,
+    remote: Optional[str] = None,
+    has_salary: Optional[bool] = None,
+    min_salary: Optional[int] = None,
+    posted_within_days: Optional[int] = None,
+    is_remote: Optional[bool] = None,
+    near: Optional[str] = None,
+    within_miles: Optional[float] = None,
+    region: Optional[str] = None
+) -> Dict:
+    """
+    Filter for browsing elevated jobs.
+
+    Args:
+        title: Case-insensitive substring of the role title
+        title_family: Canonical title family (a slug such as "ml-engineer", or any
+            title in the family, e.g. "Sr. ML Engineer")
+        seniority: Canonical seniority level, e.g. "senior"
+        industry: Industry, matched case-insensitively
+        remote: Remote option such as "remote" or "hybrid", matched case-insensitively
+        has_salary: Only jobs with (True) or without (False) a stated salary range
+        min_salary, posted_within_days, is_remote: See `normalized_filters`
+        near, within_miles, region: See `location_filters`
+
+    Raises:
+        ValueError: If the title family or a location filter is unknown
+    """
+    query: Dict = {"created_at": {"$exists": True}}
+    if title:
+        query["structured_job.role_summary.title"] = {"$regex": re.escape(title), "$options": "i"}
+    if title_family:
+        canonicalizer = get_title_canonicalizer()
+        family = title_family if title_family in canonicalizer.labels else canonicalizer.canonicalize(title_family).family
+        if family is None:
+            raise ValueError(f"Unknown title family: {title_family}")
+        query["title_family"] = family
+    if seniority:
+        query["title_seniority"] = seniority.lower()
+    if industry:
+        query["structured_job.company_overview.industry"] = {"$regex": f"^{re.escape(industry)}$", "$options": "i"}
+    if remote:
+        query["structured_job.role_summary.remote_options"] = {"$regex": re.escape(remote), "$options": "i"}
+    if has_salary is not None:
+        salary_field = "structured_job.compensation_and_benefits.salary_range"
+        query[salary_field] = {"$nin": [None, ""]} if has_salary else {"$in": [None, ""]}
+    query.update(normalized_filters(min_salary, posted_within_days, is_remote))
+    query.update(location_filters(near, within_miles, region))
+    return query
+
+
+class ElevatedJobsRepository:
+    """Async access to `elevated_jobs`."""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def ensure_indexes(self):
+        """Create the keyset index used for browsing and the normalized-field, location and title-family indexes."""
+        from pymongo import DESCENDING
+
+        await self.collection.create_index(
+            [("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="created_at_id"
+        )
+        await self.collection.create_index(NORMALIZED_INDEX, name="remote_posted_salary")
+        await self.collection.create_index(GEO_INDEX, name="location_geo")
+        await self.collection.create_index(REGION_INDEX, name="location_region")
+        await self.collection.create_index(TITLE_FAMILY_INDEX, name="title_family")
+        await ensure_text_index(self.collection, ELEVATED_TEXT_WEIGHTS, "elevated_text")
+
+    async def search(self, query: str, limit: int = 20, projection: Optional[Dict] = None) -> List[Dict]:
+        """Keyword search over titles, tools, qualifications and responsibilities."""
+        return await text_search(self.collection, query, limit, projection)
+
+    async def browse(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        **filters
+    ) -> Page:
+        """
+        Newest elevated jobs first, one keyset page at a time.
+
+        Args:
+            limit: Page size
+            cursor: `next_cursor` from the previous page
+            fields: Dotted field paths to return (whole documents if omitted)
+            **filters: Filters accepted by `elevated_jobs_query`
+
+        Returns:
+            Page: Items and the continuation token for the next page
+
+        Raises:
+            ValueError: If the cursor is malformed or a location filter is unknown
+        """
+        query = keyset_query(elevated_jobs_query(**filters), cursor)
+        documents = await self.collection.find(query, page_projection(fields)) \
+            .sort(KEYSET_SORT) \
+            .limit(limit + 1) \
+            .to_list(length=limit + 1)
+        return make_page(documents, limit)
+
+    async def insert(self, elevated_job: Dict) -> str:
+        """Insert an elevated job, returning its ID as a string."""
+        result = await self.collection.insert_one(elevated_job)
+        return str(result.inserted_id)
+
+    async def get(self, elevated_job_id: str, projection: Optional[Dict] = None) -> Optional[Dict]:
+        """Fetch one elevated job by ID."""
+        from bson import ObjectId
+
+        return await self.collection.find_one({"_id": ObjectId(elevated_job_id)}, projection)
+
+    async def find_by_original_job_id(self, job_id: str) -> Optional[Dict]:
+        """Fetch the elevated version of a job listing, if any."""
+        return await self.collection.find_one({"original_job_id": job_id})
+
+
+def browse_elevated_jobs(
+    collection,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    **filters
+) -> Page:
+    """
+    Synchronous counterpart of `ElevatedJobsRepository.browse` for notebooks
+    and scripts using `get_elevated_jobs_collection_sync()`.
+    """
+    query = keyset_query(elevated_jobs_query(**filters), cursor)
+    documents = list(
+        collection.find(query, page_projection(fields)).sort(KEYSET_SORT).limit(limit + 1)
+    )
+    return make_page(documents, limit)
+
+
+class JobIngestRepository:
+    """
+    Synchronous writes for search ingestion (called from the search workers).
+    With a raw collection, listing bodies are stored there and the listing keeps
+    only its hot fields and body fingerprint.
+    """
+
+    def __init__(self, jobs_collection, searches_collection, raw_collection=None):
+        self.jobs_collection = jobs_collection
+        self.searches_collection = searches_collection
+        self.raw_collection = raw_collection
+
+    def upsert_search(self, search_dict: Dict):
+        """Store search metadata keyed by the SearchAPI search ID."""
+        self.searches_collection.update_one(
+            {'search_metadata.id': search_dict['search_metadata']['id']},
+            {'$set': search_dict},
+            upsert=True
+        )
+
+    def upsert_jobs(self, job_dicts: List[Dict]) -> Dict[int, str]:
+        """
+        Upsert job listings in a single bulk write (plus one for their bodies when split).
+
+        Returns:
+            Dict[int, str]: Position in `job_dicts` -> ID of each newly inserted job
+        """
+        from pymongo import UpdateOne
+
+        if not job_dicts:
+            return {}
+        if self.raw_collection is None:
+            updates = [{'$set': job_dict} for job_dict in job_dicts]
+        else:
+            updates, raw_operations = [], {}
+            for job_dict in job_dicts:
+                hot, body = split_listing(job_dict)
+                hot['fingerprint'] = fingerprint(body)
+                hot['search_terms'] = body_terms(body)
+                # Unchanged bodies are a no-op; listings stored before the split lose their inline copy
+                raw_operations.setdefault(hot['fingerprint'], UpdateOne(
+                    {'_id': hot['fingerprint']},
+                    {'$setOnInsert': raw_document(body)},
+                    upsert=True
+                ))
+                update = {'$set': hot}
+                if body:
+                    update['$unset'] = {field: '' for field in body}
+                updates.append(update)
+            # Bodies first, so a hot document never references a missing body
+            self.raw_collection.bulk_write(list(raw_operations.values()), ordered=False)
+
+        # New listings wait to be scored by `JobListingsRepository.assign_priorities`
+        for job_dict, update in zip(job_dicts, updates):
+            update['$setOnInsert'] = {'priority_due_at': job_dict.get('fetched_at') or datetime.now(UTC)}
+        operations = [
+            UpdateOne(
+                {field: job_dict[field] for field in JOB_IDENTITY_FIELDS},
+                update,
+                upsert=True
+            )
+            for job_dict, update in zip(job_dicts, updates)
+        ]
+        result = self.jobs_collection.bulk_write(operations, ordered=False)
+        return {position: str(job_id) for position, job_id in result.upserted_ids.items()}
+
+
+async def get_job_listings_repository() -> JobListingsRepository:
+    """Repository over the async `job_listings` and `job_listings_raw` collections."""
+    return JobListingsRepository(await get_jobs_collection(), await get_raw_jobs_collection())
+
+async def get_elevated_jobs_repository() -> ElevatedJobsRepository:
+    """Repository over the async `elevated_jobs` collection."""
+    return ElevatedJobsRepository(await get_elevated_jobs_collection())
+
+def get_job_ingest_repository() -> JobIngestRepository:
+    """Repository over the synchronous ingest collections."""
+    return JobIngestRepository(get_jobs_collection_sync(), get_searches_collection_sync(), get_raw_jobs_collection_sync())
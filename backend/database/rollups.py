@@ -0,0 +1,276 @@
+"""
+Materialized analytics rollups over elevated jobs.
+Each rollup document aggregates the jobs for one (normalized title, normalized
+location, month) key: skill and benefit frequencies, remote/on-site mix,
+industry counts and a salary histogram. Rollups also carry the canonical
+`title_family` stored on their elevated jobs so a family's title variants can
+be summarized together. Documents are updated with `$inc` as
+jobs are saved, so dashboard queries read a handful of rollups instead of
+scanning `elevated_jobs`.
+"""
+
+from typing import Dict, Iterable, List, Optional
+from collections import Counter
+from datetime import datetime, UTC
+import re
+
+from backend.database.mongodb import get_rollups_collection, get_elevated_jobs_collection, get_jobs_collection
+from backend.logging_config import get_logger
+from backend.utils.normalization import parse_salary
+
+# Initialize logging
+logger = get_logger()
+
+# Width of a salary histogram band in annual USD
+SALARY_BAND_WIDTH = 25_000
+
+# Counter fields merged by `summarize`
+COUNTER_FIELDS = ("skills", "benefits", "remote", "industries", "salary_histogram")
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """Lowercase, drop parenthetical qualifiers and collapse whitespace."""
+    title = re.sub(r"\(.*?\)", " ", title or "")
+    title = re.sub(r"\s+", " ", title).strip(" -,|").lower()
+    return title or "unknown"
+
+
+def normalize_location(location: Optional[str]) -> str:
+    """Lowercase and collapse whitespace; drops suffixes such as "(+2 others)"."""
+    location = re.sub(r"\(.*?\)", " ", location or "")
+    location = re.sub(r"\s+", " ", location).strip(" ,").lower()
+    return location or "unknown"
+
+
+def time_bucket(timestamp: Optional[datetime]) -> str:
+    """Month bucket, e.g. "2024-11"."""
+    return (timestamp or datetime.now(UTC)).strftime("%Y-%m")
+
+
+def counter_key(value: str) -> str:
+    """Make a value safe to use as a MongoDB field name."""
+    return re.sub(r"\s+", " ", value).strip().lower().replace(".", "_").lstrip("$") or "unknown"
+
+
+def remote_mode(remote_options: Optional[str]) -> str:
+    """Bucket a free-text remote option into remote / hybrid / on-site / unknown."""
+    text = (remote_options or "").lower()
+    if "hybrid" in text:
+        return "hybrid"
+    if "remote" in text:
+        return "remote"
+    if "on-site" in text or "onsite" in text or "in office" in text or "in-office" in text:
+        return "on-site"
+    return "unknown"
+
+
+def salary_band(salary_range: Optional[str] = None, salary_min: Optional[float] = None) -> Optional[str]:
+    """
+    Histogram band for the annualized salary floor, e.g. "$94,500-$139,000"
+    falls in "75000-99999". Uses `salary_min` when already normalized.
+    """
+    if salary_min is None:
+        salary = parse_salary(salary_range)
+        salary_min = salary and (salary["salary_min"] or salary["salary_max"])
+    if not salary_min:
+        return None
+    low = int(salary_min // SALARY_BAND_WIDTH * SALARY_BAND_WIDTH)
+    return f"{low}-{low + SALARY_BAND_WIDTH - 1}"
+
+
+def rollup_key(elevated_job: Dict, location: Optional[str] = None) -> Dict:
+    """Rollup key fields for an elevated job."""
+    structured = elevated_job.get("structured_job") or {}
+    company = structured.get("company_overview") or {}
+    return {
+        "title": normalize_title((structured.get("role_summary") or {}).get("title")),
+        "location": normalize_location(location or company.get("locations")),
+        "bucket": time_bucket(elevated_job.get("created_at"))
+    }
+
+
+def rollup_increments(elevated_job: Dict) -> Dict[str, int]:
+    """`$inc` counters contributed by a single elevated job."""
+    structured = elevated_job.get("structured_job") or {}
+    role = structured.get("role_summary") or {}
+    company = structured.get("company_overview") or {}
+    details = structured.get("responsibilities_and_qualifications") or {}
+    compensation = structured.get("compensation_and_benefits") or {}
+
+    increments = Counter({"jobs": 1})
+    # Canonical taxonomy skills when tagged, otherwise the raw extracted tools
+    skills = elevated_job.get("skills") or details.get("tools_and_technologies") or []
+    for skill in set(map(counter_key, skills)):
+        increments[f"skills.{skill}"] += 1
+    for benefit in set(map(counter_key, compensation.get("benefits_and_perks") or [])):
+        increments[f"benefits.{benefit}"] += 1
+
+    mode = remote_mode(role.get("remote_options"))
+    industry = counter_key(company.get("industry") or "unknown")
+    increments[f"remote.{mode}"] += 1
+    increments[f"industries.{industry}"] += 1
+    increments[f"remote_by_industry.{industry}.{mode}"] += 1
+
+    band = salary_band(compensation.get("salary_range"), elevated_job.get("salary_min"))
+    increments[f"salary_histogram.{band or 'not_stated'}"] += 1
+    return dict(increments)
+
+
+class RollupsRepository:
+    """Incremental maintenance and reads of the `job_rollups` collection."""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def ensure_indexes(self):
+        """Create the indexes used by dashboard reads."""
+        from pymongo import ASCENDING
+
+        await self.collection.create_index(
+            [("title", ASCENDING), ("location", ASCENDING), ("bucket", ASCENDING)],
+            name="title_location_bucket",
+            unique=True
+        )
+        await self.collection.create_index(
+            [("title_family", ASCENDING), ("bucket", ASCENDING)], name="title_family_bucket"
+        )
+
+    async def apply(self, elevated_job: Dict, location: Optional[str] = None):
+        """Add one elevated job to its rollup, which takes the job's stored `title_family` when it has one."""
+        key = rollup_key(elevated_job, location)
+        fields = {"updated_at": datetime.now(UTC)}
+        if elevated_job.get("title_family"):
+            fields["title_family"] = elevated_job["title_family"]
+        await self.collection.update_one(
+            key, {"$inc": rollup_increments(elevated_job), "$set": fields}, upsert=True
+        )
+
+    async def rebuild(self, batch_size: int = 500) -> int:
+        """
+        Recompute every rollup from `elevated_jobs`.
+        Locations are taken from the original job listings, as in `apply`.
+        Run while the elevation workflow is idle; rollups written during the
+        rebuild are replaced.
+
+        Returns:
+            int: Number of elevated jobs rolled up
+        """
+        from bson import ObjectId
+
+        elevated_jobs = await get_elevated_jobs_collection()
+        jobs = await get_jobs_collection()
+        totals: Dict[tuple, Counter] = {}
+        families: Dict[tuple, Optional[str]] = {}
+        processed = 0
+
+        async def flush(batch: List[Dict]):
+            ids = [ObjectId(doc["original_job_id"]) for doc in batch if ObjectId.is_valid(doc.get("original_job_id"))]
+            locations = {
+                str(job["_id"]): job.get("location")
+                async for job in jobs.find({"_id": {"$in": ids}}, {"location": 1})
+            }
+            for doc in batch:
+                group = tuple(rollup_key(doc, locations.get(doc.get("original_job_id"))).values())
+                totals.setdefault(group, Counter()).update(rollup_increments(doc))
+                families[group] = doc.get("title_family") or families.get(group)
+
+        batch = []
+        async for doc in elevated_jobs.find({}, {
+            "structured_job": 1, "original_job_id": 1, "created_at": 1, "salary_min": 1, "skills": 1,
+            "title_family": 1
+        }):
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                await flush(batch)
+                processed += len(batch)
+                batch = []
+        if batch:
+            await flush(batch)
+            processed += len(batch)
+
+        now = datetime.now(UTC)
+        documents = [
+            {
+                **_nest(counts), "title": title, "location": location, "bucket": bucket,
+                "title_family": families[(title, location, bucket)], "updated_at": now
+            }
+            for (title, location, bucket), counts in totals.items()
+        ]
+        await self.collection.delete_many({})
+        if documents:
+            await self.collection.insert_many(documents)
+        logger.info("Rebuilt job rollups", metadata={"jobs": processed, "rollups": len(documents)})
+        return processed
+
+    async def summarize(
+        self,
+        title: Optional[str] = None,
+        location: Optional[str] = None,
+        since_bucket: Optional[str] = None,
+        top: int = 10,
+        title_family: Optional[str] = None
+    ) -> Dict:
+        """
+        Merge the rollups matching a title / location / time range.
+
+        Args:
+            title: Job title (normalized before matching)
+            location: Location (normalized before matching)
+            since_bucket: Earliest month bucket to include, e.g. "2024-09"
+            top: Number of skills and benefits to return
+            title_family: Canonical title family, e.g. "ml-engineer" (all of its title variants)
+
+        Returns:
+            Dict: Job count, top skills and benefits, remote mix, industries,
+            remote mix per industry and the salary histogram
+        """
+        query = {}
+        if title:
+            query["title"] = normalize_title(title)
+        if location:
+            query["location"] = normalize_location(location)
+        if title_family:
+            query["title_family"] = title_family
+        if since_bucket:
+            query["bucket"] = {"$gte": since_bucket}
+        return merge_rollups([doc async for doc in self.collection.find(query)], top)
+
+
+def merge_rollups(documents: Iterable[Dict], top: int = 10) -> Dict:
+    """Combine rollup documents into a single summary."""
+    jobs = 0
+    counters = {field: Counter() for field in COUNTER_FIELDS}
+    remote_by_industry: Dict[str, Counter] = {}
+    for doc in documents:
+        jobs += doc.get("jobs", 0)
+        for field in COUNTER_FIELDS:
+            counters[field].update(doc.get(field) or {})
+        for industry, modes in (doc.get("remote_by_industry") or {}).items():
+            remote_by_industry.setdefault(industry, Counter()).update(modes)
+
+    return {
+        "jobs": jobs,
+        "top_skills": counters["skills"].most_common(top),
+        "top_benefits": counters["benefits"].most_common(top),
+        "remote": dict(counters["remote"]),
+        "industries": dict(counters["industries"]),
+        "remote_by_industry": {industry: dict(modes) for industry, modes in remote_by_industry.items()},
+        "salary_histogram": dict(sorted(counters["salary_histogram"].items()))
+    }
+
+
+def _nest(increments: Dict[str, int]) -> Dict:
+    """Turn dotted `$inc` paths into nested documents for bulk inserts."""
+    nested: Dict = {}
+    for path, value in increments.items():
+        *parents, leaf = path.split(".")
+        target = nested
+        for part in parents:
+            target = target.setdefault(part, {})
+        target[leaf] = value
+    return nested
+
+
+async def get_rollups_repository() -> RollupsRepository:
+    """Repository over the async `job_rollups` collection."""
+    return RollupsRepository(await get_rollups_collection())
@@ -1,19 +1,57 @@
-from logfire import configure
 from os import getenv
 import os
 from dotenv import load_dotenv
 
+# Process-wide guards so repeated calls from entry points and modules are free
+_environment_loaded = False
+_logging_configured = False
+
+class LazyLogger:
+    """
+    Stand-in for `Logfire()` that imports Logfire and creates the real logger
+    on first use, keeping it off the import path of CLI entry points.
+    """
+    def __init__(self):
+        self._logger = None
+    
+    def __getattr__(self, name):
+        if self._logger is None:
+            from logfire import Logfire
+            self._logger = Logfire()
+        return getattr(self._logger, name)
+
+def get_logger() -> LazyLogger:
+    """Return a lazily-initialized Logfire logger."""
+    return LazyLogger()
+
+def load_environment():
+    """Load variables from .env once per process."""
+    global _environment_loaded
+    if not _environment_loaded:
+        load_dotenv()
+        _environment_loaded = True
+
 def setup_logging():
-    """Configure logging with fallback options."""
-    load_dotenv()
+    """
+    Configure logging with fallback options.
+    Idempotent: only the first call per process loads .env and configures Logfire.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+    
+    load_environment()
     try:
         api_key = getenv("LOGFIRE_API_KEY")
         if not api_key:
             raise ValueError("LOGFIRE_API_KEY not found in environment")
-            
+        
+        # Imported here so merely importing this module stays cheap
+        from logfire import configure
         configure(
             token=api_key,
         )
     except Exception as e:
         print(f"Warning: Failed to configure Logfire: {e}")
-        os.environ["LOGFIRE_IGNORE_NO_CONFIG"] = "1" 
\ No newline at end of file
+        os.environ["LOGFIRE_IGNORE_NO_CONFIG"] = "1"
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Literal
+from typing import Optional, Dict, List, Literal
 from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from backend.models.job_description_models import JobDescription, GraderOutput
@@ -16,6 +16,13 @@ class JobDescriptionProcessingState(BaseModel):
     attempts: int = Field(default=0, ge=0)
     max_attempts: int = Field(default=3, ge=1)
     status: Literal["extracting", "grading", "completed", "failed"] = Field(default="extracting")
+    model_tier: Literal["fast", "large"] = Field(default="fast", description="Extraction model tier for the next attempt")
+    extraction_calls: List[Dict] = Field(
+        default_factory=list,
+        description="Per-call extraction record: tier, model, latency, token usage and cost"
+    )
+    num_candidates: int = Field(default=1, ge=1, description="Concurrent extraction candidates in the first round")
+    candidate_stats: Optional[Dict] = Field(default=None, description="Outcome of the parallel candidate round")
     created_at: datetime
     updated_at: datetime
     error_message: Optional[str] = None
\ No newline at end of file
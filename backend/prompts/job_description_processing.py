@@ -89,4 +89,18 @@ SCORING GUIDELINES:
 Remember: Your role is to evaluate the extraction quality based solely on 
 available source information. A perfect score is possible even with many empty 
 fields, as long as all information present in the original was correctly extracted.
-"""
\ No newline at end of file
+"""
+
+# Extra instructions appended to the extraction request. Parallel candidates
+# use different variants so their outputs differ in more than sampling noise.
+extraction_prompt_variants: dict = {
+    "default": "",
+    "sectioned": """
+            Work through the schema one section at a time. Before moving on, re-read the
+            raw job data and make sure every detail belonging to that section was captured.
+            """,
+    "verbatim": """
+            Prefer the posting's own wording. Copy responsibilities, qualifications and
+            benefits as close to verbatim as possible, one list item per source bullet.
+            """,
+}
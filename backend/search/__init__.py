@@ -0,0 +1,9 @@
+"""
+Search package: tokenization, embeddings and similar-job matching. Keyword
+search uses the MongoDB text indexes (see `backend.database.repositories`).
+"""
+
+from backend.search.tokens import body_terms, tokenize
+from backend.search.indexes import elevated_fields, index_dir
+
+__all__ = ['body_terms', 'tokenize', 'elevated_fields', 'index_dir']
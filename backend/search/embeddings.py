@@ -0,0 +1,203 @@
+"""
+CPU-only text encoders for the semantic vector index.
+Uses a local sentence-transformers model when the package is installed and
+otherwise falls back to LSA: hashed TF-IDF features projected onto a
+truncated SVD basis computed with NumPy. Both produce unit-length float32
+vectors, so cosine similarity is a dot product.
+"""
+
+from typing import Dict, List, Optional
+from collections import Counter
+from pathlib import Path
+import json
+import os
+import zlib
+import numpy as np
+
+from backend.search.tokens import tokenize
+
+DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (zero rows stay zero)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return (vectors / np.maximum(norms, 1e-12)).astype(np.float32)
+
+
+class SentenceTransformerEncoder:
+    """Local sentence-transformers model pinned to the CPU."""
+
+    kind = "sentence_transformers"
+
+    def __init__(self, model_name: str = DEFAULT_MODEL, batch_size: int = 64):
+        from sentence_transformers import SentenceTransformer
+
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    @property
+    def is_fitted(self) -> bool:
+        return True
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        vectors = self.model.encode(
+            texts, batch_size=self.batch_size, normalize_embeddings=True, convert_to_numpy=True
+        )
+        return vectors.astype(np.float32)
+
+    def config(self) -> Dict:
+        return {"kind": self.kind, "model_name": self.model_name, "dim": self.dim}
+
+
+class LsaEncoder:
+    """
+    Hashed TF-IDF (unigrams and bigrams) followed by a truncated SVD projection.
+
+    The SVD is computed with a randomized range finder over a sparse CSR matrix
+    held as NumPy arrays, so fitting needs no SciPy. Terms are hashed with
+    CRC32, which is stable across processes (unlike `hash`).
+
+    Args:
+        n_features: Hashed feature space size
+        dim: Output dimension
+    """
+
+    kind = "lsa"
+
+    def __init__(self, n_features: int = 2 ** 15, dim: int = 128):
+        self.n_features = n_features
+        self.dim = dim
+        self.idf: Optional[np.ndarray] = None
+        self.components: Optional[np.ndarray] = None  # (dim, n_features)
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.components is not None
+
+    def _features(self, text: str) -> Counter:
+        tokens = tokenize(text)
+        terms = tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+        return Counter(zlib.crc32(term.encode()) % self.n_features for term in terms)
+
+    def _csr(self, texts: List[str], weighted: bool = True):
+        """Sublinear TF(-IDF) rows, L2-normalized, as (data, indices, indptr)."""
+        data, indices, indptr = [], [], [0]
+        for text in texts:
+            counts = self._features(text)
+            columns = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+            values = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+            if weighted and self.idf is not None:
+                values = values * self.idf[columns]
+            norm = np.linalg.norm(values)
+            data.append(values / norm if norm else values)
+            indices.append(columns)
+            indptr.append(indptr[-1] + len(columns))
+        empty = np.empty(0)
+        return (
+            np.concatenate(data).astype(np.float32) if data else empty.astype(np.float32),
+            np.concatenate(indices) if indices else empty.astype(np.int64),
+            np.asarray(indptr, dtype=np.int64)
+        )
+
+    @staticmethod
+    def _row_chunks(csr, rows: int = 256):
+        """Yield (first row, data, indices, row ids) per block of rows to bound memory."""
+        data, indices, indptr = csr
+        for first in range(0, len(indptr) - 1, rows):
+            last = min(first + rows, len(indptr) - 1)
+            start, end = indptr[first], indptr[last]
+            row_ids = np.repeat(np.arange(last - first), np.diff(indptr[first:last + 1]))
+            yield first, data[start:end], indices[start:end], row_ids
+
+    def _csr_dot(self, csr, dense: np.ndarray) -> np.ndarray:
+        """Sparse (n x F) @ dense (F x m)."""
+        out = np.zeros((len(csr[2]) - 1, dense.shape[1]), dtype=np.float32)
+        for first, data, indices, row_ids in self._row_chunks(csr):
+            np.add.at(out[first:], row_ids, data[:, None] * dense[indices])
+        return out
+
+    def _csr_t_dot(self, csr, dense: np.ndarray) -> np.ndarray:
+        """Sparse.T (F x n) @ dense (n x m)."""
+        out = np.zeros((self.n_features, dense.shape[1]), dtype=np.float32)
+        for first, data, indices, row_ids in self._row_chunks(csr):
+            np.add.at(out, indices, data[:, None] * dense[first + row_ids])
+        return out
+
+    def fit(self, texts: List[str], oversample: int = 10, power_iterations: int = 2, seed: int = 0) -> "LsaEncoder":
+        """Learn IDF weights and the SVD basis from a corpus sample."""
+        document_frequency = np.zeros(self.n_features, dtype=np.float32)
+        for text in texts:
+            document_frequency[list(self._features(text))] += 1
+        self.idf = (np.log((1 + len(texts)) / (1 + document_frequency)) + 1).astype(np.float32)
+
+        csr = self._csr(texts)
+        rank = min(self.dim + oversample, len(texts))
+        rng = np.random.default_rng(seed)
+        # Randomized range finder on A^T A, then an exact SVD of the small projected matrix
+        basis = self._csr_dot(csr, rng.standard_normal((self.n_features, rank)).astype(np.float32))
+        for _ in range(power_iterations):
+            basis, _ = np.linalg.qr(basis)
+            basis = self._csr_dot(csr, self._csr_t_dot(csr, basis))
+        basis, _ = np.linalg.qr(basis)
+        projected = self._csr_t_dot(csr, basis).T  # (rank, F) = Q^T A
+        _, _, vt = np.linalg.svd(projected, full_matrices=False)
+        self.components = np.ascontiguousarray(vt[:self.dim], dtype=np.float32)
+        self.dim = self.components.shape[0]
+        return self
+
+    def encode(self, texts: List[str], batch_size: int = 1024) -> np.ndarray:
+        if not self.is_fitted:
+            raise ValueError("LSA encoder must be fitted before encoding")
+        batches = [
+            self._csr_dot(self._csr(texts[start:start + batch_size]), self.components.T)
+            for start in range(0, len(texts), batch_size)
+        ]
+        return normalize_rows(np.vstack(batches)) if batches else np.zeros((0, self.dim), np.float32)
+
+    def config(self) -> Dict:
+        return {"kind": self.kind, "n_features": self.n_features, "dim": self.dim}
+
+    def save(self, directory: Path):
+        np.savez(directory / "lsa.npz", idf=self.idf, components=self.components)
+
+    @classmethod
+    def load(cls, directory: Path, config: Dict) -> "LsaEncoder":
+        encoder = cls(n_features=config["n_features"], dim=config["dim"])
+        state = np.load(directory / "lsa.npz")
+        encoder.idf, encoder.components = state["idf"], state["components"]
+        return encoder
+
+
+def create_encoder(prefer: Optional[str] = None):
+    """
+    New encoder: sentence-transformers if available (model from EMBEDDING_MODEL),
+    otherwise an unfitted LSA encoder. `prefer="lsa"` forces the fallback.
+    """
+    if prefer != "lsa":
+        try:
+            return SentenceTransformerEncoder(os.getenv("EMBEDDING_MODEL", DEFAULT_MODEL))
+        except ImportError:
+            pass
+    return LsaEncoder()
+
+
+def save_encoder(encoder, directory: Path):
+    """Persist the encoder configuration (and LSA weights) next to the vectors."""
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "encoder.json").write_text(json.dumps(encoder.config()))
+    if encoder.kind == LsaEncoder.kind:
+        encoder.save(directory)
+
+
+def load_encoder(directory: Path):
+    """Load the encoder saved with the vectors, or None if there is none."""
+    path = directory / "encoder.json"
+    if not path.exists():
+        return None
+    config = json.loads(path.read_text())
+    if config["kind"] == LsaEncoder.kind:
+        return LsaEncoder.load(directory, config)
+    return SentenceTransformerEncoder(config["model_name"])
@@ -0,0 +1,37 @@
+"""
+Shared location and document fields of the on-disk search indexes (the
+embedding vectors and the similar-job matcher). Keyword search uses the
+MongoDB text indexes instead (see `backend.database.repositories`).
+"""
+
+from typing import Dict, Iterable, Optional
+from pathlib import Path
+import os
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def index_dir() -> Path:
+    """Directory holding the index files (SEARCH_INDEX_DIR, default backend/data/search_index)."""
+    return Path(os.getenv("SEARCH_INDEX_DIR", PROJECT_ROOT / "backend" / "data" / "search_index"))
+
+
+def _join(items: Optional[Iterable[str]]) -> str:
+    return "\n".join(item for item in (items or []) if item)
+
+
+def elevated_fields(elevated_job: Dict) -> Dict[str, str]:
+    """Text fields of an elevated job."""
+    structured = elevated_job.get("structured_job") or {}
+    role = structured.get("role_summary") or {}
+    company = structured.get("company_overview") or {}
+    details = structured.get("responsibilities_and_qualifications") or {}
+    return {
+        "title": role.get("title"),
+        "description": "\n".join(filter(None, [company.get("about"), company.get("mission_and_values")])),
+        "responsibilities": _join(details.get("responsibilities")),
+        "qualifications": _join(
+            (details.get("required_qualifications") or []) + (details.get("preferred_qualifications") or [])
+        ),
+        "tools": _join(details.get("tools_and_technologies")),
+    }
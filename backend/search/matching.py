@@ -0,0 +1,340 @@
+"""
+Resume-to-job match scoring.
+Skills and tools from elevated jobs form a shared vocabulary of short phrases.
+Each job becomes a sparse row of requirement weights (tools and required
+qualifications count fully, preferred ones half, scaled by IDF and normalized
+so a job's weights sum to 1). The matrix is stored column-wise (CSC) in
+memory-mapped .npy files, so scoring a resume only reads the columns of its own
+terms: the score is the share of the job's requirement weight it covers.
+
+Usage:
+    python -m backend.search.matching build [--min-df N]
+    python -m backend.search.matching match resume.json [-k N]
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from collections import Counter
+from pathlib import Path
+import json
+import numpy as np
+from pydantic import BaseModel, Field
+
+from backend.models.resume_models import Resume
+from backend.search.tokens import tokenize
+from backend.search.indexes import index_dir
+from backend.search.vectors import top_k
+from backend.logging_config import get_logger
+
+logger = get_logger()
+
+# Longest skill phrase kept in the vocabulary, in tokens
+MAX_PHRASE_TOKENS = 4
+
+# Requirement weight per section of ResponsibilitiesAndQualifications
+SECTION_WEIGHTS: Dict[str, float] = {
+    "tools_and_technologies": 1.0,
+    "required_qualifications": 1.0,
+    "preferred_qualifications": 0.5,
+}
+
+
+class RequirementMatch(BaseModel):
+    """How one requirement line of a job is covered by a resume."""
+    section: str
+    requirement: str
+    matched_terms: List[str] = Field(default_factory=list)
+    missing_terms: List[str] = Field(default_factory=list)
+
+
+class JobMatch(BaseModel):
+    """A scored job with the vocabulary terms the resume covers and misses."""
+    job_id: str
+    score: float = Field(..., description="Share of the job's weighted requirements covered (0-1)")
+    matched_terms: List[str] = Field(default_factory=list)
+    missing_terms: List[str] = Field(default_factory=list)
+    requirements: Optional[List[RequirementMatch]] = None
+
+
+def normalize_term(text: Optional[str]) -> str:
+    """Canonical form of a skill phrase ("Node.js " -> "node.js", "Machine-Learning" stays hyphenated)."""
+    return " ".join(tokenize(text))
+
+
+def extract_terms(text: Optional[str], vocabulary: Dict[str, int]) -> Set[str]:
+    """Vocabulary phrases (up to MAX_PHRASE_TOKENS tokens) occurring in `text`."""
+    tokens = tokenize(text)
+    found = set()
+    for start in range(len(tokens)):
+        for end in range(start + 1, min(start + MAX_PHRASE_TOKENS, len(tokens)) + 1):
+            phrase = " ".join(tokens[start:end])
+            if phrase in vocabulary:
+                found.add(phrase)
+    return found
+
+
+def job_sections(elevated_job: Dict) -> Dict[str, List[str]]:
+    """Requirement lines of an elevated job, by ResponsibilitiesAndQualifications section."""
+    details = (elevated_job.get("structured_job") or {}).get("responsibilities_and_qualifications") or {}
+    return {section: [item for item in details.get(section) or [] if item] for section in SECTION_WEIGHTS}
+
+
+def resume_texts(resume: Resume) -> Iterable[str]:
+    """Resume text that can mention skills: skills, project technologies and descriptions, experience."""
+    yield from resume.skills
+    for project in resume.projects:
+        yield from (project.technologies or "").split(",")
+        yield project.description or ""
+    for experience in resume.work_experience:
+        yield experience.description or ""
+        yield from experience.notable_contributions or []
+
+
+def resume_terms(resume: Resume, vocabulary: Dict[str, int]) -> Set[str]:
+    """Vocabulary terms mentioned anywhere in the resume."""
+    terms = set()
+    for text in resume_texts(resume):
+        terms |= extract_terms(text, vocabulary)
+    return terms
+
+
+def build_vocabulary(jobs: Iterable[Dict], min_df: int = 2) -> List[str]:
+    """Tool and technology phrases used by at least `min_df` jobs, most common first."""
+    document_frequency = Counter()
+    for job in jobs:
+        document_frequency.update({
+            term for term in map(normalize_term, job_sections(job)["tools_and_technologies"])
+            if term and len(term.split()) <= MAX_PHRASE_TOKENS
+        })
+    return [term for term, count in document_frequency.most_common() if count >= min_df]
+
+
+def job_weights(elevated_job: Dict, vocabulary: Dict[str, int]) -> Dict[str, float]:
+    """Unnormalized requirement weight per vocabulary term (highest section weight wins)."""
+    weights: Dict[str, float] = {}
+    for section, lines in job_sections(elevated_job).items():
+        for line in lines:
+            for term in extract_terms(line, vocabulary):
+                weights[term] = max(weights.get(term, 0.0), SECTION_WEIGHTS[section])
+    return weights
+
+
+class MatchIndex:
+    """
+    Job-by-term requirement matrix stored as CSC arrays, with a CSR copy for
+    listing a job's own terms when explaining a match.
+
+    Args:
+        directory: Index directory (defaults to `<SEARCH_INDEX_DIR>/matching`)
+    """
+
+    ARRAYS = ("col_indptr", "col_rows", "col_data", "row_indptr", "row_columns", "row_data", "idf")
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory or index_dir() / "matching")
+        self.terms: List[str] = []
+        self.vocabulary: Dict[str, int] = {}
+        self.ids: List[str] = []
+        self.arrays: Dict[str, np.ndarray] = {}
+        if (self.directory / "vocabulary.json").exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _load(self):
+        self.terms = json.loads((self.directory / "vocabulary.json").read_text())
+        self.vocabulary = {term: column for column, term in enumerate(self.terms)}
+        self.ids = (self.directory / "ids.txt").read_text().splitlines()
+        self.arrays = {name: np.load(self.directory / f"{name}.npy", mmap_mode="r") for name in self.ARRAYS}
+
+    def build(self, jobs: List[Dict], min_df: int = 2):
+        """Build the vocabulary and requirement matrix from elevated jobs and write them to disk."""
+        self.terms = build_vocabulary(jobs, min_df)
+        self.vocabulary = {term: column for column, term in enumerate(self.terms)}
+
+        rows, columns, data = [], [], []
+        for row, job in enumerate(jobs):
+            weights = job_weights(job, self.vocabulary)
+            rows.extend([row] * len(weights))
+            columns.extend(self.vocabulary[term] for term in weights)
+            data.extend(weights.values())
+        rows = np.asarray(rows, dtype=np.int32)
+        columns = np.asarray(columns, dtype=np.int32)
+        data = np.asarray(data, dtype=np.float32)
+
+        # IDF over jobs, then normalize each job's weights to sum to 1
+        document_frequency = np.bincount(columns, minlength=len(self.terms))
+        idf = np.log((1 + len(jobs)) / (1 + document_frequency)).astype(np.float32) + 1
+        data = data * idf[columns]
+        totals = np.bincount(rows, weights=data, minlength=len(jobs))
+        data = (data / totals[rows]).astype(np.float32) if len(data) else data
+
+        self.ids = [str(job["_id"]) for job in jobs]
+        self.arrays = {"idf": idf}
+        for prefix, major, minor, size in (("col", columns, rows, len(self.terms)), ("row", rows, columns, len(jobs))):
+            order = np.lexsort((minor, major))
+            indptr = np.zeros(size + 1, dtype=np.int64)
+            np.cumsum(np.bincount(major, minlength=size), out=indptr[1:])
+            self.arrays[f"{prefix}_indptr"] = indptr
+            self.arrays[f"{prefix}_{'rows' if prefix == 'col' else 'columns'}"] = minor[order]
+            self.arrays[f"{prefix}_data"] = data[order]
+        self._save()
+
+    def _save(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for name, array in self.arrays.items():
+            np.save(self.directory / f"{name}.npy", array)
+        (self.directory / "ids.txt").write_text("".join(f"{doc_id}\n" for doc_id in self.ids))
+        (self.directory / "vocabulary.json").write_text(json.dumps(self.terms))
+        self._load()
+        logger.info("Built match index", metadata={"jobs": len(self.ids), "terms": len(self.terms)})
+
+    def requirement_weights(self, elevated_job: Dict) -> Dict[str, float]:
+        """
+        Normalized requirement weights of a single job, scored the same way as
+        the matrix rows. Tools missing from the vocabulary (new since the last
+        build) are kept with the highest IDF so new jobs can still be matched.
+        """
+        vocabulary = dict(self.vocabulary)
+        for tool in job_sections(elevated_job)["tools_and_technologies"]:
+            term = normalize_term(tool)
+            if term and len(term.split()) <= MAX_PHRASE_TOKENS:
+                vocabulary.setdefault(term, -1)
+
+        idf = self.arrays.get("idf")
+        unseen_idf = float(np.log(1 + len(self.ids)) + 1)
+        weights = {
+            term: weight * (float(idf[self.vocabulary[term]]) if term in self.vocabulary else unseen_idf)
+            for term, weight in job_weights(elevated_job, vocabulary).items()
+        }
+        total = sum(weights.values())
+        return {term: weight / total for term, weight in weights.items()} if total else {}
+
+    def columns_for(self, terms: Iterable[str]) -> np.ndarray:
+        return np.array(sorted(self.vocabulary[term] for term in terms if term in self.vocabulary), dtype=np.int64)
+
+    def scores(self, columns: np.ndarray) -> np.ndarray:
+        """Score every job against a resume's term columns: one pass over those columns only."""
+        indptr, rows, data = self.arrays["col_indptr"], self.arrays["col_rows"], self.arrays["col_data"]
+        slices = [slice(indptr[column], indptr[column + 1]) for column in columns]
+        if not slices:
+            return np.zeros(len(self.ids), dtype=np.float64)
+        return np.bincount(
+            np.concatenate([rows[part] for part in slices]),
+            weights=np.concatenate([data[part] for part in slices]),
+            minlength=len(self.ids)
+        )
+
+    def job_terms(self, row: int) -> List[Tuple[str, float]]:
+        """A job's vocabulary terms and weights, heaviest first."""
+        indptr = self.arrays["row_indptr"]
+        part = slice(indptr[row], indptr[row + 1])
+        pairs = zip(self.arrays["row_columns"][part], self.arrays["row_data"][part])
+        return sorted(((self.terms[column], float(weight)) for column, weight in pairs), key=lambda pair: -pair[1])
+
+    def match(self, resume: Resume, k: int = 10) -> List[JobMatch]:
+        """Top-k jobs for a resume, with the job terms it covers and misses."""
+        terms = resume_terms(resume, self.vocabulary)
+        scores = self.scores(self.columns_for(terms))
+        candidates = np.flatnonzero(scores)
+        results = []
+        for row in candidates[top_k(scores[candidates], k)]:
+            job_terms = self.job_terms(row)
+            results.append(JobMatch(
+                job_id=self.ids[row],
+                score=round(float(scores[row]), 4),
+                matched_terms=[term for term, _ in job_terms if term in terms],
+                missing_terms=[term for term, _ in job_terms if term not in terms]
+            ))
+        return results
+
+
+def explain(resume: Resume, elevated_job: Dict, vocabulary: Dict[str, int]) -> List[RequirementMatch]:
+    """Per-requirement coverage of an elevated job's tools and qualifications by a resume."""
+    terms = resume_terms(resume, vocabulary)
+    explanations = []
+    for section, lines in job_sections(elevated_job).items():
+        for line in lines:
+            required = sorted(extract_terms(line, vocabulary))
+            explanations.append(RequirementMatch(
+                section=section,
+                requirement=line,
+                matched_terms=[term for term in required if term in terms],
+                missing_terms=[term for term in required if term not in terms]
+            ))
+    return explanations
+
+
+_match_index: Optional[MatchIndex] = None
+
+
+def get_match_index() -> MatchIndex:
+    """Match index for elevated jobs, loaded once per process."""
+    global _match_index
+    if _match_index is None:
+        _match_index = MatchIndex()
+    return _match_index
+
+
+def match_resume(resume: Resume, k: int = 10, explain_requirements: bool = False) -> List[JobMatch]:
+    """
+    Top-k elevated jobs for a resume.
+
+    Args:
+        resume: Resume to match
+        k: Number of jobs to return
+        explain_requirements: Also load each job and explain every requirement line
+    """
+    index = get_match_index()
+    matches = index.match(resume, k)
+    if explain_requirements and matches:
+        from bson import ObjectId
+        from backend.database import get_elevated_jobs_collection_sync
+
+        documents = {
+            str(document["_id"]): document
+            for document in get_elevated_jobs_collection_sync().find(
+                {"_id": {"$in": [ObjectId(match.job_id) for match in matches]}},
+                {"structured_job.responsibilities_and_qualifications": 1}
+            )
+        }
+        for match in matches:
+            if match.job_id in documents:
+                match.requirements = explain(resume, documents[match.job_id], index.vocabulary)
+    return matches
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point for building the match index and matching a resume."""
+    import argparse
+    from backend.logging_config import setup_logging
+
+    parser = argparse.ArgumentParser(description="Resume-to-job match scoring")
+    parser.add_argument("command", choices=["build", "match"])
+    parser.add_argument("resume", nargs="?", help="Resume JSON file for the match command")
+    parser.add_argument("--min-df", type=int, default=2, help="Minimum jobs listing a tool for it to enter the vocabulary")
+    parser.add_argument("-k", type=int, default=10, help="Number of jobs")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    if args.command == "build":
+        from backend.database import get_elevated_jobs_collection_sync
+
+        jobs = list(get_elevated_jobs_collection_sync().find(
+            {}, {"structured_job.responsibilities_and_qualifications": 1}
+        ))
+        MatchIndex().build(jobs, args.min_df)
+    else:
+        resume = Resume.model_validate_json(Path(args.resume).read_text())
+        for match in match_resume(resume, args.k, explain_requirements=True):
+            print(f"{match.score:6.3f}  {match.job_id}  missing: {', '.join(match.missing_terms) or '-'}")
+            for requirement in match.requirements or []:
+                if requirement.matched_terms or requirement.missing_terms:
+                    mark = "x" if not requirement.missing_terms else " "
+                    print(f"    [{mark}] {requirement.requirement}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
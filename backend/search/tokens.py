@@ -0,0 +1,30 @@
+"""
+Word tokens shared by the embedding, matching and skill-tagging code, and the
+term list that keeps the bodies of split listings searchable.
+"""
+
+from typing import Dict, List, Optional
+import re
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[+#]+|(?:[.\-][a-z0-9]+)*)")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or our that the this to we with will you your".split()
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase word tokens, keeping terms such as "c++", "c#" and "node.js" intact."""
+    return [token for token in TOKEN_PATTERN.findall((text or "").lower()) if token not in STOPWORDS]
+
+
+def body_terms(body: Dict) -> str:
+    """
+    Distinct tokens of a listing's description and highlights, in first-seen
+    order. Split listings keep these on the hot document for the text index,
+    since the body itself is stored compressed.
+    """
+    texts = [body.get("description")]
+    for highlight in body.get("job_highlights") or []:
+        texts.extend(highlight.get("items") or [])
+    return " ".join(dict.fromkeys(token for text in texts for token in tokenize(text)))
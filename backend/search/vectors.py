@@ -0,0 +1,490 @@
+"""
+Semantic vector index over elevated jobs.
+Vectors live in a memory-mapped float32 matrix that grows in place; an IVF
+(inverted file) index clusters them with spherical k-means so a query only
+scores the rows in its nearest clusters. Exact NumPy brute force over the
+same matrix is kept as the baseline for recall checks. New vectors are
+assigned to their nearest existing cluster, so adds never need a rebuild.
+
+Several workflow processes add to the same index, so every write holds an
+exclusive `flock` on `index.lock` in the index directory and every read a
+shared one. Each process re-reads the rows, assignments and build generation
+other processes wrote before it touches the files.
+
+Usage:
+    python -m backend.search.vectors build [--lsa] [--nlist N]
+    python -m backend.search.vectors query "ML research engineer" [-k N] [--nprobe N] [--exact]
+    python -m backend.search.vectors recall [-k N] [--nprobe N] [--queries N]
+"""
+
+from typing import Dict, List, Optional, Tuple
+from contextlib import contextmanager
+from pathlib import Path
+import fcntl
+import os
+import threading
+import uuid
+import numpy as np
+
+from backend.search.embeddings import create_encoder, load_encoder, save_encoder, normalize_rows
+from backend.search.indexes import index_dir, elevated_fields
+from backend.logging_config import get_logger
+
+logger = get_logger()
+
+
+def elevated_text(elevated_job: Dict) -> str:
+    """Text embedded for an elevated job: title first, then tools, qualifications and responsibilities."""
+    fields = elevated_fields(elevated_job)
+    return "\n".join(filter(None, [
+        fields["title"], fields["tools"], fields["qualifications"], fields["responsibilities"]
+    ]))
+
+
+@contextmanager
+def file_lock(path: Path, exclusive: bool):
+    """Hold an exclusive (writers) or shared (readers) `flock` on `path` across processes."""
+    with path.open("a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class VectorStore:
+    """
+    Append-only float32 matrix in a memory-mapped file, with row IDs in a text file.
+    Capacity doubles by extending the file, so existing rows are never copied.
+    Not safe across processes on its own: `VectorIndex` serializes writers.
+    """
+
+    def __init__(self, directory: Path, dim: int, initial_capacity: int = 1024):
+        self.directory = Path(directory)
+        self.dim = dim
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.matrix_path = self.directory / "vectors.f32"
+        self.ids_path = self.directory / "ids.txt"
+
+        ids = self.ids_path.read_bytes() if self.ids_path.exists() else b""
+        # Bytes of `ids.txt` read so far; rows other processes append are read from here on
+        self._ids_offset = len(ids)
+        self.ids: List[str] = ids.decode().splitlines()
+        self.rows: Dict[str, int] = {doc_id: row for row, doc_id in enumerate(self.ids)}
+        if not self.matrix_path.exists():
+            self._resize(max(initial_capacity, len(self.ids)))
+        self._open()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def capacity(self) -> int:
+        return self.matrix_path.stat().st_size // (4 * self.dim)
+
+    def _resize(self, rows: int):
+        with self.matrix_path.open("ab") as matrix_file:
+            matrix_file.truncate(rows * self.dim * 4)
+
+    def _open(self):
+        self._matrix = np.memmap(self.matrix_path, dtype=np.float32, mode="r+", shape=(self.capacity, self.dim))
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """The stored vectors (a view onto the memory map)."""
+        return self._matrix[:len(self.ids)]
+
+    def refresh(self):
+        """Pick up rows other processes appended since this store last read the files."""
+        if self.ids_path.exists() and self.ids_path.stat().st_size > self._ids_offset:
+            with self.ids_path.open("rb") as ids_file:
+                ids_file.seek(self._ids_offset)
+                appended = ids_file.read()
+            self._ids_offset += len(appended)
+            for doc_id in appended.decode().splitlines():
+                self.rows[doc_id] = len(self.ids)
+                self.ids.append(doc_id)
+        if self.capacity != len(self._matrix):
+            del self._matrix
+            self._open()
+
+    def append(self, doc_ids: List[str], vectors: np.ndarray) -> np.ndarray:
+        """
+        Store vectors, overwriting rows for IDs already present.
+
+        Returns:
+            np.ndarray: Row number of each vector
+        """
+        new_ids = [doc_id for doc_id in dict.fromkeys(doc_ids) if doc_id not in self.rows]
+        needed = len(self.ids) + len(new_ids)
+        if needed > self.capacity:
+            self._matrix.flush()
+            del self._matrix
+            self._resize(max(needed, 2 * self.capacity))
+            self._open()
+
+        for doc_id in new_ids:
+            self.rows[doc_id] = len(self.ids)
+            self.ids.append(doc_id)
+        rows = np.array([self.rows[doc_id] for doc_id in doc_ids], dtype=np.int64)
+        self._matrix[rows] = vectors
+        self._matrix.flush()
+        if new_ids:
+            appended = "".join(f"{doc_id}\n" for doc_id in new_ids).encode()
+            with self.ids_path.open("ab") as ids_file:
+                ids_file.write(appended)
+            self._ids_offset += len(appended)
+        return rows
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest scores, best first (argpartition, then sort only k)."""
+    if len(scores) <= k:
+        return np.argsort(-scores)
+    candidates = np.argpartition(-scores, k)[:k]
+    return candidates[np.argsort(-scores[candidates])]
+
+
+def exact_search(vectors: np.ndarray, query: np.ndarray, k: int, chunk_rows: int = 65536) -> Tuple[np.ndarray, np.ndarray]:
+    """Brute-force cosine top-k over unit vectors, scanning the matrix in chunks."""
+    best_rows = np.empty(0, dtype=np.int64)
+    best_scores = np.empty(0, dtype=np.float32)
+    for start in range(0, len(vectors), chunk_rows):
+        scores = np.asarray(vectors[start:start + chunk_rows]) @ query
+        keep = top_k(scores, k)
+        best_rows = np.concatenate([best_rows, keep + start])
+        best_scores = np.concatenate([best_scores, scores[keep]])
+    order = top_k(best_scores, k)
+    return best_rows[order], best_scores[order]
+
+
+class IvfIndex:
+    """
+    Inverted-file ANN index: centroids from spherical k-means, one row list per centroid.
+
+    Args:
+        directory: Where `centroids.npy` and `assignments.i32` are kept
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.centroids_path = self.directory / "centroids.npy"
+        self.assignments_path = self.directory / "assignments.i32"
+        self.centroids: Optional[np.ndarray] = None
+        self.lists: List[List[int]] = []
+        # Cluster per row (-1 for unassigned), mirrored in `assignments.i32`
+        self.assignments = np.empty(0, dtype=np.int32)
+        # (inode, size) of `assignments.i32` as last read or written
+        self._seen: Optional[Tuple[int, int]] = None
+        if self.centroids_path.exists():
+            self.centroids = np.load(self.centroids_path)
+            self.lists = [[] for _ in range(len(self.centroids))]
+            self.refresh()
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.assignments_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size
+
+    def _extend(self, assignments: np.ndarray):
+        start = len(self.assignments)
+        self.assignments = np.concatenate([self.assignments, assignments])
+        for row, centroid in enumerate(assignments, start=start):
+            if centroid >= 0:
+                self.lists[centroid].append(row)
+
+    def refresh(self):
+        """
+        Pick up assignments other processes wrote. Appends keep the file's
+        inode, so only the new tail is read; a rewrite replaces the file.
+        """
+        if not self.is_trained:
+            return
+        stat = self._stat()
+        if stat == self._seen:
+            return
+        if stat is not None and self._seen is not None and stat[0] == self._seen[0] and stat[1] > self._seen[1]:
+            with self.assignments_path.open("rb") as assignments_file:
+                assignments_file.seek(self._seen[1])
+                self._extend(np.frombuffer(assignments_file.read(), dtype=np.int32))
+        else:
+            self.assignments = np.empty(0, dtype=np.int32)
+            self.lists = [[] for _ in range(len(self.centroids))]
+            if stat is not None:
+                self._extend(np.fromfile(self.assignments_path, dtype=np.int32))
+        self._seen = stat
+
+    def train(self, vectors: np.ndarray, nlist: int, iterations: int = 15, sample_size: int = 50_000, seed: int = 0):
+        """Cluster (a sample of) the vectors and assign every row to its nearest centroid."""
+        rng = np.random.default_rng(seed)
+        nlist = max(1, min(nlist, len(vectors)))
+        sample = np.asarray(vectors[rng.choice(len(vectors), min(sample_size, len(vectors)), replace=False)])
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(nlist):
+                members = sample[labels == cluster]
+                if len(members):
+                    centroids[cluster] = members.sum(axis=0)
+            centroids = normalize_rows(centroids)
+
+        self.centroids = centroids
+        self.directory.mkdir(parents=True, exist_ok=True)
+        np.save(self.centroids_path, centroids)
+        self.lists = [[] for _ in range(nlist)]
+        self.assignments = np.empty(0, dtype=np.int32)
+        self.assignments_path.unlink(missing_ok=True)
+        self._seen = None
+        for start in range(0, len(vectors), 65536):
+            self.add(np.arange(start, min(start + 65536, len(vectors))), np.asarray(vectors[start:start + 65536]))
+
+    def add(self, rows: np.ndarray, vectors: np.ndarray):
+        """Assign new rows to their nearest centroid (no retraining)."""
+        if not rows.size:
+            return
+        labels = np.argmax(vectors @ self.centroids.T, axis=1).astype(np.int32)
+        known = len(self.assignments)
+        if rows.max() >= known:
+            self.assignments = np.concatenate([self.assignments, np.full(rows.max() + 1 - known, -1, np.int32)])
+        for row, label in zip(rows, labels):
+            previous = self.assignments[row]
+            if previous >= 0 and previous != label:
+                self.lists[previous].remove(int(row))
+            if previous != label:
+                self.lists[label].append(int(row))
+        self.assignments[rows] = labels
+
+        if rows.min() >= known:
+            # Only new rows: append to the file instead of rewriting it
+            with self.assignments_path.open("ab") as assignments_file:
+                self.assignments[known:].tofile(assignments_file)
+        else:
+            # Replaced rather than rewritten in place, so readers see a new inode
+            partial = self.assignments_path.with_suffix(".i32.tmp")
+            self.assignments.tofile(partial)
+            os.replace(partial, self.assignments_path)
+        self._seen = self._stat()
+
+    def search(self, vectors: np.ndarray, query: np.ndarray, k: int, nprobe: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+        """Score only the rows in the `nprobe` clusters nearest to the query."""
+        probes = top_k(self.centroids @ query, nprobe)
+        candidates = np.fromiter(
+            (row for cluster in probes for row in self.lists[cluster]), dtype=np.int64
+        )
+        if not candidates.size:
+            return candidates, np.empty(0, dtype=np.float32)
+        candidates.sort()  # Sequential reads from the memory map
+        scores = np.asarray(vectors[candidates]) @ query
+        order = top_k(scores, k)
+        return candidates[order], scores[order]
+
+
+class VectorIndex:
+    """
+    Encoder, memory-mapped vector store and IVF index for one collection.
+
+    Args:
+        directory: Index directory (defaults to `<SEARCH_INDEX_DIR>/vectors/elevated_jobs`)
+        encoder: Encoder to use; loaded from the directory when omitted
+    """
+
+    def __init__(self, directory: Optional[Path] = None, encoder=None):
+        self.directory = Path(directory or index_dir() / "vectors" / "elevated_jobs")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.lock_path = self.directory / "index.lock"
+        self.generation_path = self.directory / "generation"
+        self._lock = threading.Lock()
+        with self._lock, file_lock(self.lock_path, exclusive=False):
+            self._load(encoder)
+
+    def _load(self, encoder=None):
+        """Load the encoder, vectors and IVF index of the current build."""
+        self.generation = self._read_generation()
+        self.encoder = encoder or load_encoder(self.directory)
+        self.store: Optional[VectorStore] = None
+        self.ivf = IvfIndex(self.directory)
+        if self.encoder is not None and getattr(self.encoder, "is_fitted", True):
+            self.store = VectorStore(self.directory, self.encoder.dim)
+
+    def _read_generation(self) -> Optional[str]:
+        return self.generation_path.read_text() if self.generation_path.exists() else None
+
+    def _sync(self):
+        """Catch up with other processes (call with the file lock held): reload after a rebuild, else read new rows."""
+        if self._read_generation() != self.generation:
+            self._load()
+        elif self.store is not None:
+            self.store.refresh()
+            self.ivf.refresh()
+
+    @property
+    def is_ready(self) -> bool:
+        """True once an encoder is available to embed new documents."""
+        return self.store is not None
+
+    def build(self, doc_ids: List[str], texts: List[str], nlist: Optional[int] = None, fit_sample: int = 20_000):
+        """
+        Create the index from scratch: fit the encoder if needed, encode all
+        documents and train the IVF clusters (about sqrt(N) lists by default).
+        """
+        with self._lock, file_lock(self.lock_path, exclusive=True):
+            if self.encoder is None:
+                self.encoder = create_encoder()
+            if not self.encoder.is_fitted:
+                rng = np.random.default_rng(0)
+                sample = rng.choice(len(texts), min(fit_sample, len(texts)), replace=False)
+                self.encoder.fit([texts[i] for i in sample])
+
+            for stale in ("vectors.f32", "ids.txt", "centroids.npy", "assignments.i32"):
+                (self.directory / stale).unlink(missing_ok=True)
+            save_encoder(self.encoder, self.directory)
+            self.store = VectorStore(self.directory, self.encoder.dim, initial_capacity=max(len(texts), 1024))
+            for start in range(0, len(texts), 1024):
+                self.store.append(doc_ids[start:start + 1024], self.encoder.encode(texts[start:start + 1024]))
+            self.ivf = IvfIndex(self.directory)
+            if len(self.store):
+                self.ivf.train(self.store.vectors, nlist or int(np.sqrt(len(self.store))) or 1)
+            # Other processes reload everything when the generation changes
+            self.generation = uuid.uuid4().hex
+            self.generation_path.write_text(self.generation)
+            logger.info("Built vector index", metadata={
+                "documents": len(self.store),
+                "dim": self.encoder.dim,
+                "encoder": self.encoder.kind,
+                "nlist": len(self.ivf.lists)
+            })
+
+    def add(self, doc_ids: List[str], texts: List[str]):
+        """Encode and add documents in one batch, assigning them to existing clusters."""
+        if not doc_ids:
+            return
+        if not self.is_ready:
+            raise ValueError("Vector index has no fitted encoder; run `python -m backend.search.vectors build`")
+        encoder = self.encoder
+        # Encoded before taking the lock, so other processes' writes don't wait on the model
+        vectors = encoder.encode(texts)
+        with self._lock, file_lock(self.lock_path, exclusive=True):
+            self._sync()
+            if self.encoder is not encoder:
+                # Rebuilt meanwhile (possibly with another encoder)
+                vectors = self.encoder.encode(texts)
+            rows = self.store.append(doc_ids, vectors)
+            if self.ivf.is_trained:
+                self.ivf.add(rows, vectors)
+
+    def search(self, text: str, k: int = 10, nprobe: int = 8, exact: bool = False) -> List[Tuple[str, float]]:
+        """Top-k most similar documents to `text` as (document ID, cosine similarity)."""
+        if not self.is_ready:
+            return []
+        encoder = self.encoder
+        query = encoder.encode([text])[0]
+        with self._lock, file_lock(self.lock_path, exclusive=False):
+            # Row count re-read, so rows other processes added are searched and none is read past the end
+            self._sync()
+            if not len(self.store):
+                return []
+            if self.encoder is not encoder:
+                query = self.encoder.encode([text])[0]
+            if exact or not self.ivf.is_trained:
+                rows, scores = exact_search(self.store.vectors, query, k)
+            else:
+                rows, scores = self.ivf.search(self.store.vectors, query, k, nprobe)
+            return [(self.store.ids[row], float(score)) for row, score in zip(rows, scores)]
+
+    def recall_at_k(self, k: int = 10, nprobe: int = 8, queries: int = 100, seed: int = 0) -> float:
+        """Mean recall of IVF top-k against exact search, using stored vectors as queries."""
+        with self._lock, file_lock(self.lock_path, exclusive=False):
+            self._sync()
+            vectors = self.store.vectors
+            rng = np.random.default_rng(seed)
+            sample = rng.choice(len(vectors), min(queries, len(vectors)), replace=False)
+            recalls = []
+            for row in sample:
+                query = np.asarray(vectors[row])
+                exact_rows, _ = exact_search(vectors, query, k)
+                approximate_rows, _ = self.ivf.search(vectors, query, k, nprobe)
+                recalls.append(len(set(exact_rows) & set(approximate_rows)) / max(len(exact_rows), 1))
+        return float(np.mean(recalls)) if recalls else 0.0
+
+
+_vector_index: Optional[VectorIndex] = None
+_pending: List[Tuple[str, str]] = []
+_pending_lock = threading.Lock()
+
+
+def get_vector_index() -> VectorIndex:
+    """Vector index for elevated jobs, loaded once per process."""
+    global _vector_index
+    if _vector_index is None:
+        _vector_index = VectorIndex()
+    return _vector_index
+
+
+def queue_elevated_job(elevated_job: Dict):
+    """Queue a saved elevated job for the next batch encode (see `flush_pending`)."""
+    with _pending_lock:
+        _pending.append((str(elevated_job["_id"]), elevated_text(elevated_job)))
+
+
+def flush_pending() -> int:
+    """
+    Encode and add all queued elevated jobs in one batch.
+
+    Returns:
+        int: Number of jobs added (0 if the index has not been built yet)
+    """
+    with _pending_lock:
+        batch = list(_pending)
+        _pending.clear()
+    if not batch:
+        return 0
+    index = get_vector_index()
+    if not index.is_ready:
+        logger.warning(f"Vector index not built; skipped {len(batch)} jobs")
+        return 0
+    doc_ids, texts = zip(*batch)
+    index.add(list(doc_ids), list(texts))
+    return len(batch)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point for building and querying the vector index."""
+    import argparse
+    from backend.logging_config import setup_logging
+
+    parser = argparse.ArgumentParser(description="Semantic vector index over elevated jobs")
+    parser.add_argument("command", choices=["build", "query", "recall"])
+    parser.add_argument("query", nargs="?", help="Query text for the query command")
+    parser.add_argument("--lsa", action="store_true", help="Use the TF-IDF + SVD encoder even if a model is installed")
+    parser.add_argument("--nlist", type=int, help="IVF cluster count (default sqrt(N))")
+    parser.add_argument("--nprobe", type=int, default=8, help="Clusters scanned per query")
+    parser.add_argument("--queries", type=int, default=100, help="Sample queries for the recall check")
+    parser.add_argument("--exact", action="store_true", help="Brute-force search instead of IVF")
+    parser.add_argument("-k", type=int, default=10, help="Number of results")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    if args.command == "build":
+        from backend.database import get_elevated_jobs_collection_sync
+
+        documents = list(get_elevated_jobs_collection_sync().find({}, {"structured_job": 1}))
+        index = VectorIndex(encoder=create_encoder("lsa" if args.lsa else None))
+        index.build([str(doc["_id"]) for doc in documents], [elevated_text(doc) for doc in documents], args.nlist)
+    elif args.command == "query":
+        for doc_id, score in get_vector_index().search(args.query or "", args.k, args.nprobe, args.exact):
+            print(f"{score:6.3f}  {doc_id}")
+    else:
+        recall = get_vector_index().recall_at_k(args.k, args.nprobe, args.queries)
+        print(f"recall@{args.k} (nprobe={args.nprobe}): {recall:.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+from bson import ObjectId
+
+import search.matching as matching
+from database.alerts import AlertsRepository, profile_terms
+from models.resume_models import ContactInfo, InterviewProfile, InterviewResponse, PersonalDetails, Project, Resume
+from search.matching import MatchIndex
+
+
+class FakeProfiles:
+    """Profiles stand-in that records the term queries it serves."""
+
+    def __init__(self, profiles):
+        self.profiles = profiles
+        self.queries = []
+
+    async def find(self, query, projection=None):
+        self.queries.append(query)
+        wanted = set(query["terms"]["$in"])
+        for profile in self.profiles:
+            if wanted & set(profile["terms"]):
+                yield profile
+
+
+class FakeNotifications:
+    def __init__(self):
+        self.operations = []
+
+    async def bulk_write(self, operations, ordered=True):
+        self.operations.extend(operations)
+        return SimpleNamespace(upserted_count=len(operations))
+
+
+def resume(*skills, technologies=None):
+    return Resume(
+        personal_details=PersonalDetails(full_name="Ada", contact_info=ContactInfo()),
+        skills=list(skills),
+        projects=[Project(technologies=technologies)] if technologies else []
+    )
+
+
+def test_profile_terms_from_resume_and_interview():
+    interview = InterviewProfile(responses={"technical": [
+        InterviewResponse(question="Stack?", answer="Mostly Kubernetes and Terraform these days")
+    ]})
+    terms = profile_terms(resume("Python", technologies="PyTorch, AWS"), interview, {"kubernetes": 0})
+    assert terms == {"python", "pytorch", "aws", "kubernetes"}
+
+
+async def test_new_job_alerts_only_overlapping_profiles_above_threshold(tmp_path, monkeypatch):
+    monkeypatch.setattr(matching, "_match_index", MatchIndex(tmp_path))
+    strong, weak, unrelated = ObjectId(), ObjectId(), ObjectId()
+    profiles = FakeProfiles([
+        {"_id": strong, "terms": ["python", "pytorch", "sql"], "min_score": 0.6},
+        {"_id": weak, "terms": ["python"], "min_score": 0.6},
+        {"_id": unrelated, "terms": ["react"], "min_score": 0.1},
+    ])
+    notifications = FakeNotifications()
+    alerts = AlertsRepository(profiles, notifications)
+
+    job = {"_id": ObjectId(), "original_job_id": "raw", "structured_job": {
+        "role_summary": {"title": "ML Engineer"},
+        "responsibilities_and_qualifications": {"tools_and_technologies": ["Python", "PyTorch", "AWS"]}
+    }}
+    assert await alerts.match_new_job(job) == 1
+
+    assert set(profiles.queries[0]["terms"]["$in"]) == {"python", "pytorch", "aws"}
+    alert = notifications.operations[0]
+    assert alert._filter == {"profile_id": strong, "elevated_job_id": job["_id"]}
+    assert alert._doc["$setOnInsert"]["missing_terms"] == ["aws"]
+    assert round(alert._doc["$setOnInsert"]["score"], 2) == 0.67
@@ -0,0 +1,71 @@
+from datetime import datetime, UTC
+
+import httpx
+from bson import ObjectId
+
+from api.app import create_app
+from api.cache import ResponseCache
+from database.pagination import Page
+
+JOB_ID = ObjectId()
+JOB = {"_id": JOB_ID, "created_at": datetime(2024, 10, 1, tzinfo=UTC), "structured_job": {"summary": "x" * 2000}}
+
+
+class FakeElevatedJobs:
+    def __init__(self):
+        self.calls = 0
+
+    async def get(self, job_id, projection=None):
+        self.calls += 1
+        return JOB if job_id == str(JOB_ID) else None
+
+    async def browse(self, limit, cursor, fields, **filters):
+        if cursor == "bad":
+            raise ValueError("Invalid continuation token")
+        return Page(items=[JOB], next_cursor=None)
+
+    async def search(self, query, limit):
+        return [JOB]
+
+
+def client_for(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def test_job_lookup_is_cached_and_revalidated():
+    jobs = FakeElevatedJobs()
+    app = create_app(elevated_jobs=jobs, listings=object())
+    async with client_for(app) as client:
+        first = await client.get(f"/jobs/{JOB_ID}", headers={"Accept-Encoding": "gzip"})
+        assert first.status_code == 200
+        assert first.headers["content-encoding"] == "gzip"
+        assert first.json()["created_at"] == "2024-10-01T00:00:00+00:00"
+
+        second = await client.get(f"/jobs/{JOB_ID}", headers={"If-None-Match": first.headers["etag"]})
+        assert second.status_code == 304
+        assert jobs.calls == 1
+
+        # A data version change drops the cache
+        app.state.cache.invalidate(7)
+        assert (await client.get(f"/jobs/{JOB_ID}")).status_code == 200
+        assert jobs.calls == 2
+
+
+async def test_errors_are_not_cached():
+    app = create_app(elevated_jobs=FakeElevatedJobs(), listings=object())
+    async with client_for(app) as client:
+        assert (await client.get("/jobs/not-an-id")).status_code == 404
+        assert (await client.get(f"/jobs/{ObjectId()}")).status_code == 404
+        assert (await client.get("/jobs", params={"cursor": "bad"})).status_code == 400
+        assert (await client.get("/jobs", params={"title": "ml"})).json()["items"][0]["_id"] == str(JOB_ID)
+    assert len(app.state.cache.entries) == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2, ttl=60)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    cache.get("a")
+    cache.put("c", b"3")
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.get("a").etag == cache.put("d", b"1").etag
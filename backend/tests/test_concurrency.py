@@ -0,0 +1,130 @@
+import asyncio
+import pytest
+
+from utils.concurrency import AdaptiveConcurrencyLimiter, classify_error
+
+
+def test_classify_error():
+    """Throttling and timeouts are distinguished from ordinary failures."""
+    assert classify_error(None) == "success"
+    assert classify_error("Error code: 429 - rate limit exceeded") == "throttled"
+    assert classify_error("Request timed out.") == "throttled"
+    assert classify_error(asyncio.TimeoutError()) == "throttled"
+    assert classify_error("Max attempts reached. Final quality score: 0.5") == "error"
+
+
+async def test_additive_increase_and_ceiling():
+    """Healthy completions raise the limit by about one slot per round, capped at the ceiling."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=1, max_limit=4)
+
+    for _ in range(50):
+        await limiter.acquire()
+        await limiter.release(latency=1.0)
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+async def test_multiplicative_decrease_and_floor():
+    """429s halve the limit but never go below the floor."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=2, max_limit=8)
+
+    await limiter.acquire()
+    await limiter.release(latency=1.0, outcome="throttled")
+    assert limiter.limit == 4
+
+    await limiter.acquire()
+    await limiter.release(latency=1.0, outcome="throttled")
+    await limiter.acquire()
+    await limiter.release(latency=1.0, outcome="throttled")
+    assert limiter.limit == 2
+
+
+async def test_latency_spike_decreases_limit():
+    """A completion far slower than the healthy baseline counts as congestion."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, min_limit=1, max_limit=8)
+
+    await limiter.acquire()
+    await limiter.release(latency=0.0001)
+    before = limiter.limit
+
+    await limiter.acquire()
+    await limiter.release(latency=10.0)
+    assert limiter.limit < before
+
+
+async def test_retried_work_is_normalized_by_units():
+    """Multi-round jobs are compared per round, so they do not register as spikes."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, min_limit=1, max_limit=8)
+
+    await limiter.acquire()
+    await limiter.release(latency=1.0)
+    before = limiter.limit
+
+    await limiter.acquire()
+    await limiter.release(latency=3.0, units=3)
+    assert limiter.limit >= before
+
+
+async def test_slot_enforces_limit():
+    """No more than `limit` workers run at once."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=1, max_limit=2)
+    running = 0
+    peak = 0
+
+    async def worker():
+        nonlocal running, peak
+        async with limiter.slot():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(worker() for _ in range(10)))
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+async def test_slot_classifies_exceptions():
+    """Exceptions raised inside a slot release it and feed the controller."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, min_limit=1, max_limit=8)
+
+    with pytest.raises(RuntimeError):
+        async with limiter.slot():
+            raise RuntimeError("Error code: 429")
+
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
+
+
+def test_invalid_bounds():
+    """Floor must be at least one and not above the ceiling."""
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(min_limit=0)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(min_limit=4, max_limit=2)
+
+
+async def test_search_api_429_cuts_the_search_limit(monkeypatch):
+    """A SearchAPI 429 reaches the limiter as throttling instead of a generic failure."""
+    import requests
+    from workflows import jobs_to_mongo
+
+    def throttled(**kwargs):
+        raise requests.HTTPError("429 Client Error: Too Many Requests for url: https://www.searchapi.io/api/v1/search")
+
+    limiters = []
+
+    class RecordingLimiter(AdaptiveConcurrencyLimiter):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            limiters.append(self)
+
+    monkeypatch.setattr(jobs_to_mongo, "fetch_and_parse_jobs", throttled)
+    monkeypatch.setattr(jobs_to_mongo, "AdaptiveConcurrencyLimiter", RecordingLimiter)
+
+    successful, failed = await jobs_to_mongo.process_job_searches(
+        ["AI Engineer"], ["Remote"], max_concurrent=8, calls_per_minute=6000, max_retries=1
+    )
+    assert (successful, failed) == (0, 1)
+    assert limiters[0].limit == 1
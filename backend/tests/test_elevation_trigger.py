@@ -0,0 +1,138 @@
+import asyncio
+from types import SimpleNamespace
+
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+
+from workflows.elevation_trigger import NOT_REPLICA_SET, STATE_ID, ElevationTrigger
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, key, direction):
+        self.documents = sorted(self.documents, key=lambda document: document[key], reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.documents = self.documents[:count]
+        return self
+
+    async def to_list(self, length):
+        return self.documents[:length]
+
+
+class FakeStream:
+    """Change stream yielding queued insert events, then idling."""
+
+    def __init__(self, events):
+        self.events = list(events)
+        self.resume_token = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def try_next(self):
+        if not self.events:
+            return None
+        event = self.events.pop(0)
+        self.resume_token = event["_id"]
+        return event
+
+
+class FakeListings:
+    def __init__(self, ids, replica_set=True):
+        self.ids = ids
+        self.replica_set = replica_set
+        self.watch_calls = []
+
+    def find(self, query, projection):
+        low = query.get("_id", {}).get("$gte")
+        return FakeCursor([{"_id": _id} for _id in self.ids if low is None or _id >= low])
+
+    def watch(self, pipeline, resume_after=None, max_await_time_ms=None):
+        self.watch_calls.append(resume_after)
+        if not self.replica_set:
+            raise OperationFailure("The $changeStream stage is only supported on replica sets", NOT_REPLICA_SET)
+        return FakeStream({"_id": {"_data": str(_id)}, "documentKey": {"_id": _id}} for _id in self.ids)
+
+
+class FakeState:
+    def __init__(self):
+        self.documents = {}
+
+    async def find_one(self, query):
+        return self.documents.get(query["_id"])
+
+    async def update_one(self, query, update, upsert=False):
+        self.documents.setdefault(query["_id"], {"_id": query["_id"]}).update(update["$set"])
+
+
+class FakeWorkflow:
+    def __init__(self, listings, stop, expected):
+        self.jobs = SimpleNamespace(collection=listings)
+        self.stop = stop
+        self.expected = expected
+        self.batches = []
+
+    async def process_job_ids(self, job_ids, job_titles=None):
+        self.batches.append(job_ids)
+        if sum(len(batch) for batch in self.batches) >= self.expected:
+            self.stop.set()
+        return {"total": len(job_ids), "successful": len(job_ids), "failed": 0}
+
+
+async def test_stream_checkpoints_resume_token_after_batches():
+    """Inserts are elevated in batches and the token of the last processed event is stored."""
+    ids = [ObjectId() for _ in range(3)]
+    stop, state = asyncio.Event(), FakeState()
+    listings = FakeListings(ids)
+    workflow = FakeWorkflow(listings, stop, expected=3)
+
+    await ElevationTrigger(workflow, state, batch_size=2).run(stop)
+    assert workflow.batches == [[str(ids[0]), str(ids[1])], [str(ids[2])]]
+    assert state.documents[STATE_ID]["resume_token"] == {"_data": str(ids[2])}
+
+    # A restarted trigger resumes after the stored token
+    stop.clear()
+    await ElevationTrigger(FakeWorkflow(listings, stop, expected=3), state).run(stop)
+    assert listings.watch_calls[-1] == {"_data": str(ids[2])}
+
+
+async def test_polling_fallback_on_standalone_server():
+    """Without a replica set, listings not handed over yet are polled in `_id` order."""
+    ids = [ObjectId() for _ in range(5)]
+    stop, state = asyncio.Event(), FakeState()
+    state.documents[STATE_ID] = {"_id": STATE_ID, "last_id": ids[1], "recent_ids": ids[:2]}
+    workflow = FakeWorkflow(FakeListings(ids, replica_set=False), stop, expected=3)
+
+    trigger = ElevationTrigger(workflow, state, batch_size=2, poll_interval=0.01)
+    await trigger.run(stop)
+    assert trigger.mode == "poll"
+    assert workflow.batches == [[str(ids[2]), str(ids[3])], [str(ids[4])]]
+    assert state.documents[STATE_ID]["last_id"] == ids[4]
+
+
+async def test_polling_picks_up_late_lower_ids():
+    """A listing that becomes visible after one with a greater `_id` is still elevated."""
+    ids = [ObjectId() for _ in range(3)]
+    stop, state = asyncio.Event(), FakeState()
+    state.documents[STATE_ID] = {"_id": STATE_ID, "last_id": ids[0], "recent_ids": ids[:1]}
+    listings = FakeListings([ids[0], ids[2]], replica_set=False)
+    workflow = FakeWorkflow(listings, stop, expected=2)
+    dispatch = workflow.process_job_ids
+
+    async def insert_late(job_ids, job_titles=None):
+        # ids[1] was generated before ids[2] but its insert lands afterwards
+        listings.ids = sorted({*listings.ids, ids[1]})
+        return await dispatch(job_ids, job_titles)
+
+    workflow.process_job_ids = insert_late
+    await ElevationTrigger(workflow, state, poll_interval=0.01, mode="poll").run(stop)
+    assert workflow.batches == [[str(ids[2])], [str(ids[1])]]
+    assert state.documents[STATE_ID]["last_id"] == ids[2]
+    assert state.documents[STATE_ID]["recent_ids"] == ids
@@ -0,0 +1,58 @@
+from datetime import datetime, UTC
+
+import pytest
+
+from workflows.export_jobs import COLLECTIONS, export_collection, flatten_document, partition_of
+
+ELEVATED = {
+    "_id": "e1",
+    "original_job_id": "j1",
+    "created_at": datetime(2024, 10, 1, 12, tzinfo=UTC),
+    "structured_job": {
+        "role_summary": {"title": "Senior ML Engineer (Remote)", "remote_options": "remote"},
+        "responsibilities_and_qualifications": {"tools_and_technologies": ["PyTorch", "AWS"]},
+        "compensation_and_benefits": None,
+    },
+    "grader_output": {"overall_quality_score": 0.9},
+    "salary_min": 150000,
+    "skills": ["PyTorch", "AWS"],
+    "title_family": "ml-engineer",
+    "title_seniority": "senior",
+}
+
+
+def test_flatten_nested_models_into_columns():
+    row = flatten_document(ELEVATED, COLLECTIONS["elevated_jobs"]["columns"])
+    assert row["role_summary__title"] == "Senior ML Engineer (Remote)"
+    assert row["responsibilities_and_qualifications__tools_and_technologies"] == ["PyTorch", "AWS"]
+    assert row["compensation_and_benefits__salary_range"] is None
+    assert row["quality_score"] == 0.9
+    assert row["salary_min"] == 150000.0
+
+
+def test_listing_highlights_kept_as_json():
+    listing = {"_id": "j1", "title": "AI Engineer", "job_highlights": [{"title": "Qualifications", "items": ["Python"]}]}
+    row = flatten_document(listing, COLLECTIONS["job_listings"]["columns"])
+    assert row["job_highlights"] == '[{"title": "Qualifications", "items": ["Python"]}]'
+    assert row["detected_extensions__salary"] is None
+
+
+def test_partition_by_date_and_title_family():
+    row = flatten_document(ELEVATED, COLLECTIONS["elevated_jobs"]["columns"])
+    assert partition_of(row, "created_at") == ("2024-10-01", "ml-engineer")
+    assert row["title_seniority"] == "senior"
+    # The partition is the stored family, not one derived from the title
+    row = flatten_document({**ELEVATED, "title_family": None}, COLLECTIONS["elevated_jobs"]["columns"])
+    assert partition_of(row, "created_at") == ("2024-10-01", "unknown")
+    assert row["title_family"] == "unknown"
+
+
+def test_export_writes_hive_partitions(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    rows = export_collection("elevated_jobs", tmp_path, documents=[ELEVATED, {**ELEVATED, "_id": "e2"}])
+    assert rows == 2
+    files = list((tmp_path / "elevated_jobs" / "fetch_date=2024-10-01" / "title_family=ml-engineer").glob("*.parquet"))
+    assert len(files) == 1
+    assert pq.read_table(files[0]).column("_id").to_pylist() == ["e1", "e2"]
+    assert (tmp_path / "_watermarks.json").exists()
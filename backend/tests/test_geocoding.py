@@ -0,0 +1,67 @@
+import pytest
+
+from database.repositories import elevated_jobs_query, location_filters
+from utils.geocoding import EARTH_RADIUS_MILES, Gazetteer, geo_fields, get_gazetteer
+from utils.normalization import normalize_elevated_job, normalize_job_listing
+
+
+@pytest.mark.parametrize("text, city, region, precision", [
+    ("Palo Alto, CA", "Palo Alto", "CA", "city"),
+    ("Mountain View CA", "Mountain View", "CA", "city"),
+    ("New York, NY, United States (+2 others)", "New York", "NY", "city"),
+    ("Northern Virginia", "Northern Virginia", "VA", "area"),
+    ("Greater Seattle Area", "Seattle", "WA", "city"),
+    ("Hybrid work in Austin, TX", "Austin", "TX", "city"),
+    ("New Orleans, LA", "New Orleans", "LA", "city"),
+    ("Washington, DC", "Washington", "DC", "city"),
+    ("Washington", None, "WA", "region"),
+    ("Smallville, Kansas", None, "KS", "region"),
+])
+def test_geocode_canonical_places(text, city, region, precision):
+    location = get_gazetteer().geocode(text)
+    assert (location.city, location.region, location.precision) == (city, region, precision)
+    assert location.point()["type"] == "Point"
+
+
+def test_remote_and_unknown_locations():
+    gazetteer = get_gazetteer()
+    remote = gazetteer.geocode("Remote")
+    assert remote.remote and remote.point() is None
+    assert gazetteer.geocode("Seattle, WA (Remote)").remote
+    assert gazetteer.geocode("United States").country == "US"
+    assert gazetteer.geocode("Somewhere else") is None
+
+    # A remote listing isn't placed at the location its search was run for
+    assert geo_fields("Anywhere", "Seattle, WA")["location_geo"] is None
+    assert geo_fields("Unknown", "Seattle, WA")["location_city"] == "Seattle"
+
+
+def test_lookups_are_cached():
+    gazetteer = Gazetteer.from_file()
+    first = gazetteer.geocode("Palo Alto, CA")
+    assert gazetteer.geocode("Palo Alto, CA") is first
+    assert gazetteer.cache_info().hits == 1
+
+
+def test_normalized_documents_carry_geojson():
+    listing = normalize_job_listing({"location": "Seattle, WA"})
+    assert listing["location_geo"] == {"type": "Point", "coordinates": [-122.3321, 47.6062]}
+    assert listing["location_region"] == "WA"
+
+    # Elevated jobs fall back to the company's locations
+    elevated = normalize_elevated_job({"company_overview": {"locations": "Redmond, WA; Dublin, Ireland"}}, {})
+    assert elevated["location_city"] == "Redmond"
+
+
+def test_location_filters():
+    query = location_filters(near="Seattle, WA", within_miles=30, region="washington")
+    center, radius = query["location_geo"]["$geoWithin"]["$centerSphere"]
+    assert center == [-122.3321, 47.6062]
+    assert radius == pytest.approx(30 / EARTH_RADIUS_MILES)
+    assert query["location_region"] == "WA"
+    assert elevated_jobs_query(region="CA")["location_region"] == "CA"
+
+    with pytest.raises(ValueError):
+        location_filters(near="Atlantis")
+    with pytest.raises(ValueError):
+        location_filters(region="Narnia")
@@ -0,0 +1,14 @@
+import os
+import pytest
+
+from utils.import_time import ENTRY_POINT_BUDGETS_MS, check_import_budget
+
+# Slow CI machines can scale the budgets, e.g. IMPORT_TIME_BUDGET_SCALE=2
+BUDGET_SCALE = float(os.getenv("IMPORT_TIME_BUDGET_SCALE", "1"))
+
+
+@pytest.mark.parametrize("module,budget_ms", sorted(ENTRY_POINT_BUDGETS_MS.items()))
+def test_entry_point_import_budget(module, budget_ms):
+    """CLI entry points import within budget and defer LangChain, Logfire and Motor."""
+    result = check_import_budget(module, budget_ms * BUDGET_SCALE)
+    assert result["violations"] == []
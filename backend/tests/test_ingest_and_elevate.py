@@ -0,0 +1,59 @@
+import asyncio
+from types import SimpleNamespace
+
+import workflows.ingest_and_elevate as pipeline_module
+from utils.concurrency import AdaptiveConcurrencyLimiter
+from workflows.ingest_and_elevate import IngestElevatePipeline
+
+
+class FakeWorkflow:
+    """Records which listings were extracted and saved."""
+
+    def __init__(self):
+        self.max_concurrent = 2
+        self.limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        self.started, self.saved = [], []
+
+    async def process_job(self, job_id, raw_job_data):
+        self.started.append(raw_job_data["title"])
+        await asyncio.sleep(0.01)
+        self.saved.append(job_id)
+        return SimpleNamespace(status="completed", attempts=1, error_message=None)
+
+    async def flush_vectors(self):
+        pass
+
+
+async def test_listings_flow_from_search_to_elevation(monkeypatch):
+    """New listings are elevated once their write resolves; already stored ones are never extracted."""
+    pages = {
+        "p1": [{"title": "AI Engineer"}, {"title": "ML Engineer"}],
+        "p2": [{"title": "Data Scientist"}],
+    }
+    persisted = {"p1": {0: "job-1"}, "p2": {0: "job-3"}}
+    depths = []
+
+    def persist(page, job_dicts):
+        return persisted[page]
+
+    async def searches(titles, locations, store, **kwargs):
+        for page in pages:
+            assert await store(page)
+            depths.append(pipeline.queue.qsize())
+        return len(pages), 0
+
+    monkeypatch.setattr(pipeline_module, "prepare_job_documents", lambda page: pages[page])
+    monkeypatch.setattr(pipeline_module, "persist_job_results", persist)
+    monkeypatch.setattr(pipeline_module, "process_job_searches", searches)
+
+    workflow = FakeWorkflow()
+    pipeline = IngestElevatePipeline(workflow, queue_size=1)
+    summary = await pipeline.run(["AI Engineer"], ["Seattle WA"])
+
+    assert sorted(workflow.saved) == ["job-1", "job-3"]
+    assert sorted(workflow.started) == ["AI Engineer", "Data Scientist"]
+    assert summary["fetched"] == 3 and summary["new"] == 2 and summary["known"] == 1
+    assert summary["successful"] == 2 and summary["searches_successful"] == 2
+    assert "fetch_to_elevated_p95_s" in summary
+    # The bounded queue never holds more than `queue_size` listings
+    assert summary["max_queue_depth"] <= 1 and max(depths) <= 1
@@ -0,0 +1,164 @@
+import asyncio
+from datetime import datetime, timedelta, UTC
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from utils.link_checker import LinkChecker, classify, next_check
+from workflows.check_apply_links import check_apply_links, link_update
+
+NOW = datetime(2024, 11, 1, tzinfo=UTC)
+
+
+async def stand_in_server():
+    """Local job board: live, gone, redirected and HEAD-rejecting postings."""
+    active = {"now": 0, "max": 0}
+
+    async def live(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.Response(text="Apply now", headers={"ETag": '"v1"'})
+
+    async def slow(request):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.02)
+        active["now"] -= 1
+        return web.Response(text="ok")
+
+    async def no_head(request):
+        if request.method == "HEAD":
+            return web.Response(status=405)
+        return web.Response(text="ok")
+
+    def respond(status=200, location=None):
+        async def handler(request):
+            if location:
+                raise web.HTTPFound(location)
+            return web.Response(status=status, text="ok")
+        return handler
+
+    app = web.Application()
+    app.router.add_route("*", "/jobs/live", live)
+    app.router.add_route("*", "/jobs/gone", respond(410))
+    app.router.add_route("*", "/jobs/moved", respond(location="/jobs/live"))
+    app.router.add_route("*", "/jobs/closed", respond(location="/"))
+    app.router.add_route("*", "/", respond())
+    app.router.add_route("*", "/jobs/no-head", no_head)
+    app.router.add_route("*", "/jobs/busy", respond(503))
+    app.router.add_route("GET", "/jobs/slow/{n}", slow)
+    server = TestServer(app)
+    await server.start_server()
+    return server, active
+
+
+async def test_checks_against_stand_in_server():
+    server, _ = await stand_in_server()
+    url = lambda path: str(server.make_url(path))
+    try:
+        async with LinkChecker(concurrency=10, per_host=4) as checker:
+            assert (await checker.check(url("/jobs/live")))["etag"] == '"v1"'
+            assert (await checker.check(url("/jobs/live"), etag='"v1"'))["http_status"] == 304
+            assert (await checker.check(url("/jobs/gone")))["status"] == "dead"
+            assert (await checker.check(url("/jobs/moved")))["status"] == "live"
+            assert (await checker.check(url("/jobs/closed")))["status"] == "dead"
+            assert (await checker.check(url("/jobs/no-head")))["status"] == "live"
+            assert (await checker.check(url("/jobs/busy")))["status"] == "unknown"
+            assert (await checker.check("http://127.0.0.1:1/jobs/refused"))["status"] == "unknown"
+            # Falls back to an alternative link when the primary one is gone
+            assert (await checker.check_any([url("/jobs/gone"), url("/jobs/live")]))["url"] == url("/jobs/live")
+            assert checker.stats["head_fallbacks"] >= 1 and checker.stats["not_modified"] == 1
+    finally:
+        await server.close()
+
+
+async def test_per_host_cap():
+    server, active = await stand_in_server()
+    try:
+        async with LinkChecker(concurrency=50, per_host=3) as checker:
+            # HEAD is not routed for /jobs/slow, so each check falls back to GET
+            results = await asyncio.gather(*(checker.check(str(server.make_url(f"/jobs/slow/{n}"))) for n in range(30)))
+        assert all(result["status"] == "live" for result in results)
+        assert active["max"] == 3
+    finally:
+        await server.close()
+
+
+class SlowWriteCollection:
+    """Listings collection whose bulk writes are sent at once and acknowledged a while later."""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.written = []
+
+    def find(self, *args, **kwargs):
+        jobs = list(self.jobs)
+
+        class Cursor:
+            async def to_list(self, length):
+                batch, jobs[:] = jobs[:length], jobs[length:]
+                return batch
+
+        return Cursor()
+
+    async def bulk_write(self, operations, ordered=True):
+        sent = [operation._filter["_id"] for operation in operations]
+        await asyncio.sleep(0.05)
+        self.written += sent
+
+
+async def test_updates_finishing_during_a_write_are_kept():
+    server, _ = await stand_in_server()
+    jobs = [{"_id": n, "apply_link": str(server.make_url(f"/jobs/slow/{n}"))} for n in range(40)]
+    collection = SlowWriteCollection(jobs)
+    try:
+        stats = await check_apply_links(collection, batch_size=5, concurrency=4, per_host=4)
+    finally:
+        await server.close()
+    assert stats["checked"] == 40
+    assert sorted(collection.written) == list(range(40))
+
+
+async def test_failing_checks_are_counted_and_the_rest_written():
+    server, _ = await stand_in_server()
+    jobs = [{"_id": n, "apply_link": str(server.make_url(f"/jobs/slow/{n}"))} for n in range(10)]
+    # Malformed alternative links make the listing's check raise
+    jobs[3] = {"_id": 3, "apply_link": None, "apply_links": ["https://board.example/jobs/3"]}
+    collection = SlowWriteCollection(jobs)
+    try:
+        stats = await check_apply_links(collection, batch_size=5, concurrency=1, per_host=1)
+    finally:
+        await server.close()
+    assert stats["errors"] == 1 and stats["checked"] == 9
+    assert sorted(collection.written) == [n for n in range(10) if n != 3]
+
+
+def test_recheck_schedule_decays_and_expiry_needs_confirmation():
+    live = {"status": "live", "url": "https://x/1", "http_status": 200, "etag": '"a"'}
+    first = next_check(None, live, NOW)
+    second = next_check(first, {**live, "etag": None, "http_status": 304}, NOW)
+    assert first["next_check_at"] - NOW == timedelta(days=1)
+    assert second["next_check_at"] - NOW == timedelta(days=2) and second["etag"] == '"a"'
+
+    dead = {"status": "dead", "url": "https://x/1", "http_status": 404}
+    suspect = next_check(second, dead, NOW)
+    assert not suspect["expired"] and suspect["live_streak"] == 0
+    update = link_update({"link_check": suspect}, dead, NOW)
+    assert update["$set"]["expired"] is True and update["$unset"] == {"priority_key": "", "priority_due_at": ""}
+    assert update["$set"]["link_check"]["next_check_at"] is None
+
+
+def test_unreachable_links_back_off_without_expiring():
+    """Blocked, throttled and failing hosts stay in capped backoff however long they keep failing."""
+    state = None
+    for http_status in [403, 429, 503, 999, None] * 4:
+        state = next_check(state, {"status": "unknown", "url": "https://x/1", "http_status": http_status}, NOW)
+        assert not state["expired"]
+    assert state["failures"] == 20
+    assert state["next_check_at"] - NOW == timedelta(days=1)
+
+
+def test_redirect_to_front_page_is_dead():
+    assert classify(200, "https://board.example/jobs/1", "https://board.example/") == "dead"
+    assert classify(200, "https://board.example/", "https://board.example/") == "live"
+    assert classify(429, "https://board.example/jobs/1", None) == "unknown"
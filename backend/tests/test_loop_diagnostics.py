@@ -0,0 +1,57 @@
+import argparse
+import asyncio
+import pstats
+import time
+
+from utils.loop_diagnostics import LoopDiagnostics, add_diagnostics_arguments, percentile
+
+
+def blocking_fetch():
+    time.sleep(0.4)
+
+
+async def test_stall_is_reported_with_the_blocking_stack():
+    async with LoopDiagnostics("test", lag_threshold=0.1) as diagnostics:
+        await asyncio.sleep(0.1)
+        blocking_fetch()
+        await asyncio.sleep(0.1)
+        await asyncio.to_thread(blocking_fetch)
+        await asyncio.sleep(0.1)
+
+    monitor = diagnostics.monitor
+    assert monitor.stall_count == 1
+    [stall] = monitor.stalls
+    assert stall["lag_ms"] >= 300
+    assert "blocking_fetch" in "".join(stall["stack"])
+    assert diagnostics.slow_callbacks.count >= 1
+    assert not asyncio.get_running_loop().get_debug()
+
+
+async def test_profile_window_is_written(tmp_path):
+    async with LoopDiagnostics("test", profile="cprofile", profile_window=0.05, output_dir=tmp_path) as diagnostics:
+        await asyncio.sleep(0.2)
+
+    [path] = tmp_path.glob("test-*.prof")
+    assert diagnostics.summary()["profile"] == str(path)
+    assert pstats.Stats(str(path)).total_tt < 0.2
+
+
+async def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("LOOP_DIAGNOSTICS", raising=False)
+    monkeypatch.delenv("LOOP_PROFILER", raising=False)
+    parser = argparse.ArgumentParser()
+    add_diagnostics_arguments(parser)
+
+    async with LoopDiagnostics.from_args("test", parser.parse_args([])) as diagnostics:
+        assert diagnostics.monitor is None
+
+    args = parser.parse_args(["--diagnostics", "--lag-threshold-ms", "250"])
+    assert LoopDiagnostics.from_args("test", args).monitor.threshold == 0.25
+
+    monkeypatch.setenv("LOOP_DIAGNOSTICS", "1")
+    assert LoopDiagnostics.from_args("test", parser.parse_args([])).enabled
+
+
+def test_percentile():
+    assert percentile([], 0.99) == 0.0
+    assert percentile([0.3, 0.1, 0.2], 0.5) == 0.2
@@ -0,0 +1,61 @@
+from models.resume_models import PersonalDetails, ContactInfo, Project, Resume, WorkExperience
+from search.matching import MatchIndex, explain, extract_terms, resume_terms
+
+
+def elevated(job_id, tools, required=(), preferred=()):
+    return {"_id": job_id, "structured_job": {"responsibilities_and_qualifications": {
+        "tools_and_technologies": list(tools),
+        "required_qualifications": list(required),
+        "preferred_qualifications": list(preferred),
+    }}}
+
+
+JOBS = [
+    elevated("ml", ["Python", "PyTorch", "AWS"], ["3+ years of Python and PyTorch"], ["Experience with Kubernetes"]),
+    elevated("web", ["TypeScript", "React", "AWS"], ["Strong TypeScript skills"]),
+    elevated("data", ["Python", "SQL", "Apache Spark"], ["SQL and Apache Spark at scale"]),
+    elevated("ops", ["Kubernetes", "Terraform"], ["Kubernetes in production"]),
+]
+
+RESUME = Resume(
+    personal_details=PersonalDetails(full_name="Ada", contact_info=ContactInfo()),
+    skills=["Python", "SQL"],
+    projects=[Project(name="Recs", technologies="PyTorch, FastAPI")],
+    work_experience=[WorkExperience(description="Ran Spark jobs on AWS; moved pipelines to Apache Spark")],
+)
+
+
+def build(tmp_path) -> MatchIndex:
+    index = MatchIndex(tmp_path)
+    index.build(JOBS, min_df=1)
+    return index
+
+
+def test_extract_terms_matches_multi_word_phrases():
+    vocabulary = {"apache spark": 0, "spark": 1, "python": 2}
+    assert extract_terms("Apache Spark and Python", vocabulary) == {"apache spark", "spark", "python"}
+
+
+def test_resume_terms_come_from_skills_projects_and_experience(tmp_path):
+    index = build(tmp_path)
+    assert resume_terms(RESUME, index.vocabulary) == {"python", "sql", "pytorch", "aws", "apache spark"}
+
+
+def test_match_ranks_by_covered_requirement_weight(tmp_path):
+    build(tmp_path)
+    matches = MatchIndex(tmp_path).match(RESUME, k=3)
+
+    assert [match.job_id for match in matches][:2] == ["data", "ml"]
+    assert matches[0].score == 1.0
+    assert matches[1].missing_terms == ["kubernetes"]
+    assert "ops" not in [match.job_id for match in matches]
+
+
+def test_explain_reports_each_requirement(tmp_path):
+    index = build(tmp_path)
+    requirements = explain(RESUME, JOBS[0], index.vocabulary)
+
+    by_line = {requirement.requirement: requirement for requirement in requirements}
+    assert by_line["3+ years of Python and PyTorch"].missing_terms == []
+    assert by_line["Experience with Kubernetes"].missing_terms == ["kubernetes"]
+    assert by_line["Experience with Kubernetes"].section == "preferred_qualifications"
@@ -0,0 +1,72 @@
+import pytest
+
+from agents.model_cascade import (
+    ModelCascadePolicy, estimate_cost, next_tier, validate_extraction
+)
+from models.job_description_models import (
+    JobDescription, CompanyOverview, RoleSummary, ResponsibilitiesAndQualifications
+)
+
+RAW_JOB = {
+    "title": "AI Engineer",
+    "company_name": "Chai",
+    "via": "LinkedIn",
+    "job_highlights": [{"title": "Qualifications", "items": ["Python"]}],
+}
+
+
+def make_job(company: str = "Chai", qualifications=("Python",)) -> JobDescription:
+    return JobDescription(
+        company_overview=CompanyOverview(company_name=company),
+        role_summary=RoleSummary(title="AI Engineer"),
+        responsibilities_and_qualifications=ResponsibilitiesAndQualifications(
+            required_qualifications=list(qualifications) or None
+        ),
+    )
+
+
+def test_tier_escalation_order():
+    """The cascade escalates from the fast tier to the large tier and stops there."""
+    assert next_tier("fast") == "large"
+    assert next_tier("large") is None
+
+
+def test_estimate_cost():
+    """Cost scales with token counts and tier pricing."""
+    assert estimate_cost("fast", 1_000_000, 0) == pytest.approx(0.05)
+    assert estimate_cost("large", 1000, 1000) > estimate_cost("fast", 1000, 1000)
+
+
+def test_validate_extraction():
+    """Local validation flags missing output, company mismatches and empty qualifications."""
+    assert validate_extraction(make_job(), RAW_JOB) == []
+    assert validate_extraction(None, RAW_JOB) == ["No structured job produced"]
+    assert "Company name does not match the listing" in validate_extraction(make_job(company="Other"), RAW_JOB)
+    assert validate_extraction(make_job(qualifications=()), RAW_JOB) == [
+        "No responsibilities or qualifications extracted"
+    ]
+
+
+async def test_policy_learns_per_company():
+    """A company where the fast tier keeps failing starts on the large tier."""
+    policy = ModelCascadePolicy(min_samples=3, explore_rate=0.0)
+    assert policy.choose_tier(RAW_JOB) == "fast"
+
+    for _ in range(3):
+        await policy.record(RAW_JOB, "fast", succeeded=False)
+    assert policy.choose_tier(RAW_JOB) == "large"
+
+    # Same source, different company: falls back to the (also failing) `via` history
+    other = {**RAW_JOB, "company_name": "Acme"}
+    assert policy.choose_tier(other) == "large"
+
+    # Unknown company and source stays on the fast tier
+    assert policy.choose_tier({"company_name": "Acme", "via": "Indeed"}) == "fast"
+
+
+async def test_policy_keeps_fast_tier_when_it_succeeds():
+    """Sources where the fast tier usually succeeds keep starting on it."""
+    policy = ModelCascadePolicy(min_samples=3, explore_rate=0.0)
+    for succeeded in (True, True, True, False):
+        await policy.record(RAW_JOB, "fast", succeeded=succeeded)
+    assert policy.choose_tier(RAW_JOB) == "fast"
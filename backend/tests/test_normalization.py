@@ -0,0 +1,83 @@
+import json
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+
+import pytest
+
+from database.repositories import normalized_filters
+from utils.normalization import (
+    detect_remote, normalize_elevated_job, normalize_job_listing, parse_posted_at, parse_salary
+)
+
+FETCHED_AT = datetime(2024, 12, 12, 22, 0, tzinfo=UTC)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("120K–180K a year", (120_000, 180_000, "USD", "year")),
+    ("$94,500-$139,000", (94_500, 139_000, "USD", "year")),
+    ("$60–$75 an hour", (124_800, 156_000, "USD", "hour")),
+    ("£45,000 - £55,000 per annum", (45_000, 55_000, "GBP", "year")),
+    ("$8,000 a month", (96_000, 96_000, "USD", "month")),
+    ("Up to $200,000", (None, 200_000, "USD", "year")),
+    ("$150k+", (150_000, None, "USD", "year")),
+    ("€60.000 - €80.000", (60_000, 80_000, "EUR", "year")),
+    ("$22.50 an hour", (46_800, 46_800, "USD", "hour")),
+    ("€4.500", (54_000, 54_000, "EUR", "month")),
+    # Stray numbers are neither bounds nor scaled by the salary's "k"
+    ("$200k, 2 weeks PTO", (200_000, 200_000, "USD", "year")),
+    ("Up to $200K + 15% bonus", (None, 200_000, "USD", "year")),
+    ("60 to 75 an hour", (124_800, 156_000, "USD", "hour")),
+])
+def test_parse_salary(text, expected):
+    salary = parse_salary(text)
+    assert (salary["salary_min"], salary["salary_max"], salary["salary_currency"], salary["salary_period"]) == expected
+
+
+def test_unparseable_salary():
+    assert parse_salary("Competitive") is None
+    assert parse_salary(None) is None
+
+
+def test_parse_posted_at():
+    assert parse_posted_at("3 days ago", FETCHED_AT) == FETCHED_AT - timedelta(days=3)
+    assert parse_posted_at("30+ days ago", FETCHED_AT) == FETCHED_AT - timedelta(days=30)
+    assert parse_posted_at("an hour ago", FETCHED_AT) == FETCHED_AT - timedelta(hours=1)
+    assert parse_posted_at("Just posted", FETCHED_AT.replace(tzinfo=None)) == FETCHED_AT
+    assert parse_posted_at("sometime", FETCHED_AT) is None
+
+
+def test_detect_remote():
+    assert detect_remote("Anywhere")
+    assert detect_remote("Seattle, WA", "Work from home")
+    assert not detect_remote("Hybrid remote")
+    assert not detect_remote("Seattle, WA", None)
+
+
+def test_normalize_sample_listing():
+    """The bundled raw listing normalizes to typed salary and posting-date fields."""
+    raw = json.loads((Path(__file__).parents[1] / "data" / "test_raw_job_listing.json").read_text())
+    fields = normalize_job_listing(raw, FETCHED_AT)
+    assert fields["salary_min"] == 120_000
+    assert fields["salary_max"] == 180_000
+    assert fields["posted_date"] == FETCHED_AT - timedelta(days=27)
+    assert fields["is_remote"] is False
+
+
+def test_elevated_job_prefers_extracted_fields():
+    raw = {"location": "Seattle, WA", "detected_extensions": {"salary": "$100K a year", "posted_at": "2 days ago"},
+           "fetched_at": FETCHED_AT}
+    structured = {"compensation_and_benefits": {"salary_range": "$150,000-$190,000"},
+                  "role_summary": {"remote_options": "Remote"}}
+    fields = normalize_elevated_job(structured, raw)
+    assert (fields["salary_min"], fields["is_remote"]) == (150_000, True)
+    assert fields["posted_date"] == FETCHED_AT - timedelta(days=2)
+
+    fallback = normalize_elevated_job({}, raw)
+    assert (fallback["salary_min"], fallback["is_remote"]) == (100_000, False)
+
+
+def test_normalized_filters():
+    query = normalized_filters(min_salary=150_000, posted_within_days=7, is_remote=True)
+    assert query["is_remote"] is True
+    assert query["salary_min"] == {"$gte": 150_000}
+    assert query["posted_date"]["$gte"] <= datetime.now(UTC) - timedelta(days=7)
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from database.pagination import decode_cursor, encode_cursor, keyset_query, make_page, page_projection
+from database.repositories import elevated_jobs_query
+
+
+def make_docs(count: int):
+    return [{"_id": ObjectId(), "created_at": datetime(2024, 11, 1, 12, 0, i)} for i in range(count)]
+
+
+def test_cursor_round_trip():
+    """A continuation token decodes back to the keyset position of its document."""
+    doc = make_docs(1)[0]
+    position = decode_cursor(encode_cursor(doc))
+    assert position == {"created_at": doc["created_at"], "_id": doc["_id"]}
+
+
+def test_invalid_cursor_rejected():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_keyset_query_continues_after_cursor():
+    """The next page starts strictly after the last (created_at, _id) seen."""
+    doc = make_docs(1)[0]
+    query = keyset_query({"created_at": {"$exists": True}}, encode_cursor(doc))
+    base, after = query["$and"]
+    assert base == {"created_at": {"$exists": True}}
+    assert after["$or"][0] == {"created_at": {"$lt": doc["created_at"]}}
+    assert after["$or"][1] == {"created_at": doc["created_at"], "_id": {"$lt": doc["_id"]}}
+    assert keyset_query(base) is base
+
+
+def test_make_page_uses_extra_document_as_has_more():
+    docs = make_docs(4)
+    page = make_page(docs, limit=3)
+    assert page.items == docs[:3]
+    assert decode_cursor(page.next_cursor)["_id"] == docs[2]["_id"]
+    assert make_page(docs[:3], limit=3).next_cursor is None
+
+
+def test_projection_keeps_keyset_fields():
+    assert page_projection(["structured_job.role_summary.title"]) == {
+        "structured_job.role_summary.title": 1, "created_at": 1, "_id": 1
+    }
+    assert page_projection() is None
+
+
+def test_elevated_jobs_query_filters():
+    query = elevated_jobs_query(title="AI (ML) Engineer", industry="tech", remote="remote", has_salary=True)
+    assert query["structured_job.role_summary.title"]["$regex"] == r"AI\ \(ML\)\ Engineer"
+    assert query["structured_job.company_overview.industry"]["$regex"] == "^tech$"
+    assert query["structured_job.compensation_and_benefits.salary_range"] == {"$nin": [None, ""]}
@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta, UTC
+
+from bson import ObjectId
+
+from database.repositories import JobListingsRepository
+from utils.priority import PriorityPolicy, duplicate_key, get_priority_policy
+
+NOW = datetime(2024, 11, 1, tzinfo=UTC)
+
+POLICY = PriorityPolicy({
+    "component_weights": {"recency": 0.4, "title": 0.4, "company": 0.1, "cluster": 0.1},
+    "aging_hours": 48,
+    "recency_half_life_days": 7,
+    "title_weights": {"AI Engineer": 1.0},
+    "default_title_weight": 0.2,
+    "company_weights": {"Chai": 1.0},
+    "default_company_weight": 0.5,
+    "max_cluster_size": 8,
+})
+
+
+def test_fresh_interesting_jobs_score_higher():
+    fresh = {"title": "Senior AI Engineer (Remote)", "company_name": "Chai", "posted_date": NOW}
+    stale = {"title": "Sales Associate", "company_name": "Acme", "posted_date": NOW - timedelta(days=30)}
+    assert POLICY.score(fresh, 1, NOW) > 0.8 > 0.3 > POLICY.score(stale, 1, NOW)
+    assert POLICY.score(stale, 8, NOW) > POLICY.score(stale, 1, NOW)
+    assert duplicate_key(fresh) == "chai|senior ai engineer"
+
+
+def test_aging_bounds_how_long_a_job_waits():
+    """A top score only jumps the queue by `aging_hours`; older low-score jobs come first after that."""
+    old = POLICY.key(NOW, 0.0)
+    assert POLICY.key(NOW + timedelta(hours=47), 1.0) < old < POLICY.key(NOW + timedelta(hours=49), 1.0)
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, key, direction):
+        self.documents = sorted(self.documents, key=lambda document: document[key], reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.documents = self.documents[:count] if count else self.documents
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+    async def to_list(self, length):
+        return self.documents
+
+
+class FakeListings:
+    def __init__(self, documents):
+        self.documents = documents
+        self.updates = {}
+
+    @staticmethod
+    def matches(document, clause):
+        """The `priority_due_at` / `priority_key` conditions of a query (pending filters are not modelled)."""
+        for field, condition in clause.items():
+            if "$exists" in condition and (field in document) != condition["$exists"]:
+                return False
+            if "$lte" in condition and not (field in document and document[field] <= condition["$lte"]):
+                return False
+        return True
+
+    def find(self, query, projection=None):
+        clauses = query.get("$or", [{}])
+        scored = {field: query[field] for field in ("priority_key",) if field in query}
+        return FakeCursor([
+            doc for doc in self.documents
+            if self.matches(doc, scored) and any(self.matches(doc, clause) for clause in clauses)
+        ])
+
+    def aggregate(self, pipeline):
+        keys = pipeline[0]["$match"]["duplicate_key"]["$in"]
+        counts = {}
+        for doc in self.documents:
+            if doc.get("duplicate_key") in keys:
+                counts[doc["duplicate_key"]] = counts.get(doc["duplicate_key"], 0) + 1
+        return FakeCursor([{"_id": key, "count": count} for key, count in counts.items()])
+
+    async def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            assert operation._doc["$unset"] == {"priority_due_at": ""}
+            self.updates[operation._filter["_id"]] = operation._doc["$set"]
+            for document in self.documents:
+                if document["_id"] == operation._filter["_id"]:
+                    document.update(operation._doc["$set"])
+                    document.pop("priority_due_at", None)
+
+
+async def test_assign_priorities_counts_duplicate_clusters():
+    """New jobs join the duplicate clusters of already scored listings."""
+    scored = {"_id": ObjectId(), "title": "AI Engineer", "company_name": "Chai",
+              "duplicate_key": "chai|ai engineer", "priority_key": 1.0}
+    single = {"_id": ObjectId(), "title": "AI Engineer", "company_name": "Acme", "posted_date": NOW,
+              "priority_due_at": NOW}
+    duplicate = {"_id": ObjectId(), "title": "AI Engineer", "company_name": "Chai", "posted_date": NOW,
+                 "priority_due_at": NOW}
+    # Still backing off after a failure: scored once its backoff ends
+    retrying = {"_id": ObjectId(), "title": "AI Engineer", "company_name": "Chai",
+                "priority_due_at": datetime.now(UTC) + timedelta(hours=1)}
+    collection = FakeListings([scored, duplicate, single, retrying])
+
+    assert await JobListingsRepository(collection).assign_priorities(POLICY) == 2
+    assert set(collection.updates) == {duplicate["_id"], single["_id"]}
+    # Same recency and title interest; the cluster of two and the preferred company outrank an earlier job
+    assert collection.updates[duplicate["_id"]]["priority_key"] < collection.updates[single["_id"]]["priority_key"]
+
+
+async def test_legacy_pending_jobs_are_scored_and_served():
+    """Listings stored before ingest marked them due are scored without a manual rescore."""
+    legacy = {"_id": ObjectId(), "title": "AI Engineer", "company_name": "Chai", "posted_date": NOW}
+    collection = FakeListings([legacy])
+    repository = JobListingsRepository(collection)
+    assert await repository.find_pending(10) == []
+
+    assert await repository.assign_priorities(POLICY) == 1
+    assert [job["_id"] for job in await repository.find_pending(10)] == [legacy["_id"]]
+    # Scored once: it has a key now, so the next pass leaves it alone
+    assert await repository.assign_priorities(POLICY) == 0
+
+
+def test_default_weights_load():
+    assert get_priority_policy().title_interest({"title": "Machine Learning Engineer II"}) == 1.0
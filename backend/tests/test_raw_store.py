@@ -0,0 +1,53 @@
+from database.raw_store import (
+    HOT_PROJECTION, compress_body, decompress_body, fingerprint, raw_document, source_listing, split_listing,
+    with_raw_bodies
+)
+from models.jobs_search_models import JobListing
+
+
+class FakeRawCollection:
+    def __init__(self, documents):
+        self.documents = documents
+        self.queries = 0
+
+    def find(self, query):
+        self.queries += 1
+        return [self.documents[_id] for _id in query["_id"]["$in"] if _id in self.documents]
+
+
+LISTING = {
+    "_id": 1, "title": "AI Engineer", "company_name": "Chai", "via": "LinkedIn",
+    "description": "Build agents. " * 200,
+    "job_highlights": [{"title": "Qualifications", "items": ["Python"]}],
+    "sharing_link": "https://share",
+}
+
+
+def test_split_and_compress_round_trip():
+    hot, body = split_listing(LISTING)
+    assert set(hot) == {"_id", "title", "company_name", "via"}
+    assert set(HOT_PROJECTION) >= set(body)
+    assert decompress_body(compress_body(body)) == body
+    assert len(compress_body(body)) < len(body["description"]) / 10
+    assert fingerprint(body) == fingerprint(dict(reversed(list(body.items()))))
+
+
+def test_with_raw_bodies_merges_split_and_legacy_documents():
+    hot, body = split_listing(LISTING)
+    hot["fingerprint"] = fingerprint(body)
+    raw = FakeRawCollection({hot["fingerprint"]: {"_id": hot["fingerprint"], **raw_document(body)}})
+    legacy = {"_id": 2, "title": "Data Scientist", "description": "Inline"}
+
+    merged = list(with_raw_bodies([hot, legacy], raw))
+    assert merged[0]["description"] == LISTING["description"]
+    assert merged[0]["job_highlights"] == LISTING["job_highlights"]
+    assert merged[1] == legacy
+    assert raw.queries == 1
+
+
+def test_source_listing_drops_derived_fields():
+    """Normalized, tagged and bookkeeping fields stay out of the prompts."""
+    stored = {**LISTING, "search_query": "AI Engineer", "salary_min": 1, "skills": ["Python"], "location_geo": {},
+              "title_family": "ai-engineer", "priority_key": "k", "link_check": {}, "fingerprint": "f", "attempts": 1}
+    assert set(source_listing(stored)) == set(LISTING) | {"search_query"}
+    assert {"position", *JobListing.model_fields} <= set(source_listing({key: 1 for key in JobListing.model_fields}))
@@ -0,0 +1,88 @@
+from datetime import timedelta
+from types import SimpleNamespace
+
+from bson import ObjectId
+
+from database.repositories import JobIngestRepository, JobListingsRepository
+
+
+class FakeJobsCollection:
+    """Minimal stand-in recording the calls the repositories make."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.updates = []
+        self.bulk_operations = []
+
+    async def find_one_and_update(self, query, update, projection=None, return_document=None):
+        self.failures += update["$inc"]["elevation_failures"]
+        return {"_id": query["_id"], "elevation_failures": self.failures}
+
+    async def update_one(self, query, update):
+        self.updates.append((query, update))
+
+    def bulk_write(self, operations, ordered=True):
+        self.bulk_operations.extend(operations)
+        return SimpleNamespace(upserted_ids={i: ObjectId() for i in range(len(operations))})
+
+
+def test_pending_query_filters_titles():
+    """Pending jobs exclude extracted and dead-lettered jobs and honour the title (family) filter."""
+    query = JobListingsRepository.pending_query(["AI Engineer"])
+    assert query["extracted"] == {"$ne": True}
+    assert query["elevation_status"] == {"$ne": "dead_letter"}
+    assert query["$or"] == [{"title": {"$in": ["AI Engineer"]}}, {"title_family": {"$in": ["ai-engineer"]}}]
+    assert "$or" not in JobListingsRepository.pending_query()
+
+
+async def test_record_failure_backs_off_then_dead_letters():
+    """Failures schedule a retry until the budget is spent, then dead-letter the job."""
+    collection = FakeJobsCollection()
+    repository = JobListingsRepository(collection)
+    job_id = str(ObjectId())
+
+    first = await repository.record_failure(job_id, "boom", 0.4, 2, lambda n: timedelta(minutes=30 * n))
+    assert first["elevation_status"] == "retry"
+    assert first["next_eligible_at"] is not None
+    # Out of the priority queue while backing off, due to be scored again when it ends
+    _, retry = collection.updates[-1]
+    assert retry["$unset"] == {"priority_key": ""}
+    assert retry["$set"]["priority_due_at"] == first["next_eligible_at"]
+
+    second = await repository.record_failure(job_id, "boom", None, 2, lambda n: timedelta(minutes=30 * n))
+    assert second == {"elevation_failures": 2, "elevation_status": "dead_letter", "next_eligible_at": None}
+
+
+def test_upsert_jobs_uses_single_bulk_write():
+    """Jobs are upserted in one bulk write keyed on the listing identity fields."""
+    collection = FakeJobsCollection()
+    repository = JobIngestRepository(collection, searches_collection=None)
+    jobs = [
+        {"title": "AI Engineer", "company_name": "Chai", "location": "Seattle", "apply_link": f"https://x/{i}"}
+        for i in range(3)
+    ]
+
+    assert sorted(repository.upsert_jobs(jobs)) == [0, 1, 2]
+    assert repository.upsert_jobs([]) == {}
+    assert len(collection.bulk_operations) == 3
+    assert collection.bulk_operations[0]._filter == jobs[0]
+    assert "priority_due_at" in collection.bulk_operations[0]._doc["$setOnInsert"]
+
+
+def test_upsert_jobs_splits_bodies_into_raw_collection():
+    """Bodies go to the raw collection once per fingerprint; listings keep hot fields only."""
+    collection, raw = FakeJobsCollection(), FakeJobsCollection()
+    repository = JobIngestRepository(collection, searches_collection=None, raw_collection=raw)
+    jobs = [
+        {"title": "AI Engineer", "company_name": "Chai", "location": "Seattle", "apply_link": f"https://x/{i}",
+         "description": "Same body", "job_highlights": []}
+        for i in range(2)
+    ]
+    repository.upsert_jobs(jobs)
+
+    assert len(raw.bulk_operations) == 1
+    update = collection.bulk_operations[0]._doc
+    assert "description" not in update["$set"]
+    assert update["$set"]["search_terms"] == "same body"
+    assert update["$set"]["fingerprint"] == raw.bulk_operations[0]._filter["_id"]
+    assert update["$unset"] == {"description": "", "job_highlights": ""}
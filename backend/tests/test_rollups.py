@@ -0,0 +1,70 @@
+from datetime import datetime
+
+from database.rollups import (
+    RollupsRepository, _nest, merge_rollups, normalize_location, normalize_title,
+    rollup_increments, rollup_key, salary_band
+)
+
+ELEVATED_JOB = {
+    "original_job_id": "6740a1b2c3d4e5f601234567",
+    "created_at": datetime(2024, 11, 20),
+    "structured_job": {
+        "company_overview": {"company_name": "Chai", "industry": "Tech", "locations": "Palo Alto, CA"},
+        "role_summary": {"title": "ML Engineer (Remote)", "remote_options": "Remote"},
+        "responsibilities_and_qualifications": {"tools_and_technologies": ["Python", "PyTorch", "Node.js", "python"]},
+        "compensation_and_benefits": {"salary_range": "$150,000 - $190,000", "benefits_and_perks": ["Equity"]},
+    },
+}
+
+
+class FakeRollupsCollection:
+    def __init__(self):
+        self.documents = {}
+
+    async def update_one(self, key, update, upsert=False):
+        document = self.documents.setdefault(tuple(key.values()), {})
+        for path, value in update["$inc"].items():
+            document[path] = document.get(path, 0) + value
+        document.update(update["$set"])
+
+
+def test_normalization():
+    assert normalize_title("  ML Engineer (Remote) ") == "ml engineer"
+    assert normalize_location("Seattle,  WA (+2 others)") == "seattle, wa"
+    assert rollup_key(ELEVATED_JOB, "Seattle, WA") == {"title": "ml engineer", "location": "seattle, wa", "bucket": "2024-11"}
+
+
+def test_salary_band():
+    assert salary_band("$94,500-$139,000") == "75000-99999"
+    assert salary_band("150K a year") == "150000-174999"
+    assert salary_band("$60 an hour") == "100000-124999"
+    assert salary_band("Competitive") is None
+
+
+def test_rollup_increments_are_mongo_safe():
+    """Each job counts a skill once and field names never contain extra dots."""
+    increments = rollup_increments(ELEVATED_JOB)
+    assert increments["jobs"] == 1
+    assert increments["skills.python"] == 1
+    assert increments["skills.node_js"] == 1
+    assert increments["remote.remote"] == 1
+    assert increments["remote_by_industry.tech.remote"] == 1
+    assert increments["salary_histogram.150000-174999"] == 1
+
+
+async def test_apply_and_summarize():
+    """Incremental updates merge into the same summary a rebuild would produce."""
+    collection = FakeRollupsCollection()
+    repository = RollupsRepository(collection)
+    await repository.apply(ELEVATED_JOB, "Seattle, WA")
+    await repository.apply(ELEVATED_JOB, "Seattle, WA")
+
+    [document] = collection.documents.values()
+    assert "title_family" not in document
+    await repository.apply({**ELEVATED_JOB, "title_family": "ml-engineer"}, "Seattle, WA")
+    await repository.apply(ELEVATED_JOB, "Seattle, WA")
+    assert document["title_family"] == "ml-engineer"
+    summary = merge_rollups([_nest(document)], top=5)
+    assert summary["jobs"] == 4
+    assert ("python", 4) in summary["top_skills"]
+    assert summary["remote_by_industry"] == {"tech": {"remote": 4}}
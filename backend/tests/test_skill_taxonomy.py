@@ -0,0 +1,45 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.skill_taxonomy import SkillTaxonomy, get_skill_taxonomy, tag_elevated_job
+from workflows.tag_skills import tag_listing_batch
+
+TAXONOMY = SkillTaxonomy([
+    {"name": "PyTorch", "category": "ml_framework", "aliases": ["torch"]},
+    {"name": "Apache Spark", "category": "data", "aliases": ["spark", "pyspark"]},
+    {"name": "Spark Streaming", "category": "data", "aliases": []},
+    {"name": "Go", "category": "language", "aliases": ["golang"], "list_aliases": ["go"]},
+    {"name": "C++", "category": "language", "aliases": ["cpp"]},
+])
+
+
+def test_tag_finds_aliases_in_one_pass():
+    text = "Go to market with Torch, C++ and Spark Streaming. Golang a plus."
+    assert TAXONOMY.tag(text) == ["PyTorch", "C++", "Apache Spark", "Spark Streaming", "Go"]
+
+
+def test_list_aliases_only_match_whole_items():
+    assert TAXONOMY.tag("we go fast") == []
+    assert TAXONOMY.normalize(["pytorch", "Torch", "PyTorch", "go", "Ray Serve", "ray  serve"]) == (
+        ["PyTorch", "Go"], ["Ray Serve"]
+    )
+
+
+def test_tag_elevated_job_merges_tools_and_text():
+    structured = {"responsibilities_and_qualifications": {
+        "tools_and_technologies": ["torch", "Internal DSL"],
+        "required_qualifications": ["Experience with PySpark"],
+    }}
+    raw = {"title": "ML Engineer", "description": "Our stack is C++ and Golang."}
+    assert tag_elevated_job(structured, raw, TAXONOMY) == {
+        "skills": ["PyTorch", "Apache Spark", "C++", "Go"], "unmatched_tools": ["Internal DSL"]
+    }
+
+
+def test_default_taxonomy_in_worker_processes():
+    """The backfill worker compiles the bundled taxonomy in each process."""
+    jobs = [{"_id": 1, "title": "Data Engineer", "description": "Airflow, dbt and Snowflake on AWS"}]
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        assert pool.submit(tag_listing_batch, jobs).result() == [
+            (1, {"skills": ["Apache Airflow", "dbt", "Snowflake", "AWS"]})
+        ]
+    assert "PyTorch" in get_skill_taxonomy().categories
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+from bson import ObjectId
+
+from database.repositories import LISTINGS_TEXT_WEIGHTS
+from search.tokens import tokenize
+from workflows import split_job_storage
+
+
+class FakeCollection:
+    """Documents keyed by `_id`, with the reads and bulk writes the migration makes."""
+
+    def __init__(self, documents=()):
+        self.documents = {document["_id"]: dict(document) for document in documents}
+
+    def find(self, query, projection=None, batch_size=None):
+        return [dict(document) for document in self.documents.values() if "fingerprint" not in document]
+
+    def bulk_write(self, operations, ordered=True):
+        modified = 0
+        for operation in operations:
+            document = self.documents.get(operation._filter["_id"])
+            if document is None:
+                self.documents[operation._filter["_id"]] = {
+                    **operation._filter, **operation._doc.get("$setOnInsert", {})
+                }
+                continue
+            document.update(operation._doc.get("$set", {}))
+            for field in operation._doc.get("$unset", {}):
+                document.pop(field, None)
+            modified += 1
+        return SimpleNamespace(modified_count=modified)
+
+    def text_search(self, word):
+        """The `listing_text` index's matches: documents with `word` in a weighted field."""
+        def terms(document):
+            texts = [document.get("title"), document.get("description"), document.get("search_terms")]
+            for highlight in document.get("job_highlights") or []:
+                texts.extend(highlight.get("items") or [])
+            return {token for text in texts for token in tokenize(text)}
+
+        assert {"title", "description", "job_highlights.items", "search_terms"} == set(LISTINGS_TEXT_WEIGHTS)
+        return [document for document in self.documents.values() if word in terms(document)]
+
+
+def test_migrated_listings_stay_searchable_by_body(monkeypatch):
+    """A legacy listing is found by a word from its body once the body moved to cold storage."""
+    listing = {
+        "_id": ObjectId(), "title": "AI Engineer", "company_name": "Chai",
+        "description": "Ship retrieval pipelines on Kubernetes.",
+        "job_highlights": [{"title": "Qualifications", "items": ["LangGraph experience"]}],
+    }
+    jobs, raw = FakeCollection([listing]), FakeCollection()
+    monkeypatch.setattr(split_job_storage, "get_jobs_collection_sync", lambda: jobs)
+    monkeypatch.setattr(split_job_storage, "get_raw_jobs_collection_sync", lambda: raw)
+
+    assert split_job_storage.migrate() == 1
+    [migrated] = jobs.documents.values()
+    assert "description" not in migrated and migrated["fingerprint"] in raw.documents
+    assert jobs.text_search("kubernetes") == [migrated]
+    assert jobs.text_search("langgraph") == [migrated]
+    assert split_job_storage.migrate() == 0
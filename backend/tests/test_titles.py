@@ -0,0 +1,56 @@
+import pytest
+
+from database.repositories import elevated_jobs_query
+from utils import titles
+from utils.titles import TitleCanonicalizer, canonicalize_title, title_fields
+from workflows.canonicalize_titles import canonicalize_elevated_batch, canonicalize_listing_batch
+
+
+@pytest.mark.parametrize("title, family, seniority", [
+    ("Sr. ML Engineer II", "ml-engineer", "senior"),
+    ("Machine Learning Engineer - GenAI", "ml-engineer", None),
+    ("Senior Software Engineer, Machine Learning", "ml-engineer", "senior"),
+    ("AI/ML Engineer", "ml-engineer", None),
+    ("Generative AI Engineer (Contract)", "ai-engineer", None),
+    ("Principal Applied Scientist (Remote)", "data-scientist", "principal"),
+    ("Senior TPM, AI Infrastructure", "technical-program-manager", "senior"),
+    ("New Grad SWE 2025", "software-engineer", "junior"),
+    ("Director of Engineering", None, "director"),
+    ("Barista", None, None),
+])
+def test_canonical_families(title, family, seniority):
+    match = canonicalize_title(title)
+    assert (match.family, match.seniority) == (family, seniority)
+
+
+def test_fuzzy_match_without_rapidfuzz(monkeypatch):
+    monkeypatch.setattr(titles, "process", None)
+    match = TitleCanonicalizer.from_file().canonicalize("Machine Learnign Engineer")
+    assert (match.family, match.method) == ("ml-engineer", "fuzzy")
+    assert match.score >= titles.FUZZY_CUTOFF
+
+
+def test_repeated_titles_are_memoized():
+    canonicalizer = TitleCanonicalizer.from_file()
+    first = canonicalizer.canonicalize("Staff ML Engineer")
+    assert canonicalizer.canonicalize("Staff ML Engineer") is first
+    assert canonicalizer.cache_info().hits == 1
+
+
+def test_stored_fields_and_filters():
+    # The extracted title wins; the listing title is the fallback
+    assert title_fields("Chief Happiness Officer", "Data Scientist") == \
+        {"title_family": "data-scientist", "title_seniority": None}
+    assert title_fields(None) == {"title_family": None, "title_seniority": None}
+
+    assert elevated_jobs_query(title_family="Sr. ML Engineer")["title_family"] == "ml-engineer"
+    assert elevated_jobs_query(title_family="ai-engineer", seniority="Senior")["title_seniority"] == "senior"
+    with pytest.raises(ValueError):
+        elevated_jobs_query(title_family="Barista")
+
+
+def test_backfill_workers():
+    [(_, listing)] = canonicalize_listing_batch([{"_id": 1, "title": "Lead Data Engineer | Hybrid"}])
+    assert listing == {"title_family": "data-engineer", "title_seniority": "lead"}
+    [(_, elevated)] = canonicalize_elevated_batch([({"_id": 2, "structured_job": {}}, "Data Scienist")])
+    assert elevated["title_family"] == "data-scientist"
@@ -0,0 +1,21 @@
+from search.indexes import elevated_fields
+from search.tokens import body_terms, tokenize
+
+
+def test_tokenize_keeps_technical_terms():
+    assert tokenize("Node.js, C++ and C# for the win.") == ["node.js", "c++", "c#", "win"]
+
+
+def test_body_terms_cover_description_and_highlights():
+    body = {
+        "description": "Build machine learning systems with Python.",
+        "job_highlights": [{"title": "Qualifications", "items": ["Python and SQL", "Machine learning"]}],
+    }
+    assert body_terms(body) == "build machine learning systems python sql"
+    assert body_terms({}) == ""
+
+
+def test_elevated_fields():
+    elevated = {"structured_job": {"role_summary": {"title": "AI Engineer"},
+                                   "responsibilities_and_qualifications": {"tools_and_technologies": ["LangChain"]}}}
+    assert elevated_fields(elevated)["tools"] == "LangChain"
@@ -0,0 +1,104 @@
+import multiprocessing
+
+import numpy as np
+
+import search.vectors as vectors
+from search.embeddings import LsaEncoder, normalize_rows
+from search.vectors import IvfIndex, VectorIndex, VectorStore, exact_search
+
+CORPUS = [
+    "machine learning research engineer pytorch deep learning models",
+    "applied scientist machine learning research deep learning experiments",
+    "research scientist deep learning pytorch publications",
+    "frontend engineer typescript react web apps",
+    "web developer javascript react css",
+    "senior frontend developer typescript css design systems",
+    "data engineer spark sql pipelines airflow",
+    "analytics engineer sql dbt warehouse pipelines",
+]
+
+
+def test_lsa_encoder_groups_related_roles():
+    encoder = LsaEncoder(n_features=2 ** 12, dim=3).fit(CORPUS)
+    encoded = encoder.encode(["applied scientist deep learning", "ml research engineer pytorch", "react web developer"])
+    assert encoded.shape == (3, 3)
+    assert np.allclose(np.linalg.norm(encoded, axis=1), 1, atol=1e-5)
+    assert encoded[0] @ encoded[1] > encoded[0] @ encoded[2]
+
+
+def test_vector_store_grows_and_persists(tmp_path):
+    data = normalize_rows(np.random.default_rng(0).standard_normal((5, 4)))
+    store = VectorStore(tmp_path, dim=4, initial_capacity=2)
+    store.append(["a", "b", "c"], data[:3])
+    store.append(["d", "a"], data[3:])
+    assert store.capacity >= 4
+
+    reloaded = VectorStore(tmp_path, dim=4)
+    assert reloaded.ids == ["a", "b", "c", "d"]
+    assert np.allclose(reloaded.vectors[0], data[4])
+    assert np.allclose(reloaded.vectors[3], data[3])
+
+
+def test_ivf_matches_exact_search_when_probing_all_clusters(tmp_path):
+    rng = np.random.default_rng(1)
+    data = normalize_rows(rng.standard_normal((500, 16)))
+    ivf = IvfIndex(tmp_path)
+    ivf.train(data, nlist=10)
+    for query in data[:20]:
+        exact_rows, _ = exact_search(data, query, 5)
+        ivf_rows, _ = ivf.search(data, query, 5, nprobe=10)
+        assert list(ivf_rows) == list(exact_rows)
+
+    extra = normalize_rows(rng.standard_normal((3, 16)))
+    ivf.add(np.arange(500, 503), extra)
+    assert sum(len(rows) for rows in IvfIndex(tmp_path).lists) == 503
+
+
+def test_incremental_add_is_searchable_without_rebuild(tmp_path):
+    index = VectorIndex(tmp_path, encoder=LsaEncoder(n_features=2 ** 12, dim=3))
+    index.build([str(i) for i in range(len(CORPUS))], CORPUS, nlist=2)
+    index.add(["new"], ["staff applied scientist deep learning research"])
+
+    reloaded = VectorIndex(tmp_path)
+    assert "new" in [doc_id for doc_id, _ in reloaded.search("applied scientist deep learning", k=4, nprobe=2)]
+    assert reloaded.recall_at_k(k=3, nprobe=2) == 1.0
+
+
+def test_flush_pending_skips_until_index_built(tmp_path, monkeypatch):
+    monkeypatch.setattr(vectors, "_vector_index", VectorIndex(tmp_path))
+    monkeypatch.setattr(vectors, "_pending", [])
+    vectors.queue_elevated_job({"_id": "job", "structured_job": {"role_summary": {"title": "AI Engineer"}}})
+    assert vectors.flush_pending() == 0
+    assert vectors._pending == []
+
+
+def add_from_process(directory, worker):
+    index = VectorIndex(directory)
+    for batch in range(5):
+        doc_ids = [f"{worker}-{batch}-{n}" for n in range(20)]
+        index.add(doc_ids, [f"{CORPUS[(worker + n) % len(CORPUS)]} {doc_id}" for n, doc_id in enumerate(doc_ids)])
+
+
+def test_concurrent_processes_keep_ids_aligned_with_vectors(tmp_path):
+    """Workflow processes adding at once neither overwrite each other's rows nor misalign the ids."""
+    index = VectorIndex(tmp_path, encoder=LsaEncoder(n_features=2 ** 12, dim=3))
+    index.build([str(i) for i in range(len(CORPUS))], CORPUS, nlist=2)
+
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=add_from_process, args=(tmp_path, worker)) for worker in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert all(worker.exitcode == 0 for worker in workers)
+
+    # The instance opened before the adds re-reads the row count before searching
+    assert len(index.search("data engineer spark", k=500, exact=True)) == len(CORPUS) + 400
+    reloaded = VectorIndex(tmp_path)
+    assert len(reloaded.store) == len(set(reloaded.store.ids)) == len(CORPUS) + 400
+    assert len(reloaded.ivf.assignments) == len(reloaded.store)
+    for row in range(len(CORPUS), len(reloaded.store), 37):
+        doc_id = reloaded.store.ids[row]
+        worker, _, n = map(int, doc_id.split("-"))
+        expected = reloaded.encoder.encode([f"{CORPUS[(worker + n) % len(CORPUS)]} {doc_id}"])[0]
+        assert np.allclose(reloaded.store.vectors[row], expected, atol=1e-5)
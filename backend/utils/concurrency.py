@@ -0,0 +1,226 @@
+"""
+Adaptive concurrency control for async workers.
+Provides an AIMD (additive-increase / multiplicative-decrease) limiter that
+replaces a fixed-size semaphore for LLM and search API workers.
+"""
+
+from typing import Deque, Optional, Union
+from collections import deque
+from contextlib import asynccontextmanager
+import asyncio
+import time
+from backend.logging_config import get_logger
+
+# Initialize logging
+logger = get_logger()
+
+# Substrings that identify provider throttling or timeouts in error messages
+THROTTLE_MARKERS = ("429", "rate limit", "rate_limit", "too many requests")
+TIMEOUT_MARKERS = ("timeout", "timed out")
+
+
+def classify_error(error: Optional[Union[str, BaseException]]) -> str:
+    """
+    Classify an error into a limiter outcome.
+
+    Args:
+        error: Error message or exception raised by a worker (None for success)
+
+    Returns:
+        str: "success", "throttled" (429s and timeouts) or "error"
+    """
+    if error is None:
+        return "success"
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return "throttled"
+
+    message = str(error).lower()
+    if any(marker in message for marker in THROTTLE_MARKERS + TIMEOUT_MARKERS):
+        return "throttled"
+    return "error"
+
+
+class LimiterSlot:
+    """Handle for a single acquired slot; workers set `outcome` and `units` before release."""
+
+    def __init__(self):
+        self.outcome: str = "success"
+        self.units: int = 1  # Units of work (e.g. LLM rounds) the latency covers
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limiter.
+
+    The limit grows by `increase_step / limit` per healthy completion (about one
+    extra slot per full round of work) while latency and error rate stay healthy,
+    and is multiplied by `decrease_factor` on 429s, timeouts or latency spikes.
+    Decreases are spaced by at least one baseline latency so a burst of failures
+    from the same congested round only cuts the limit once.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 3,
+        min_limit: int = 1,
+        max_limit: int = 8,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        error_rate_threshold: float = 0.2,
+        window_size: int = 20,
+        metric_name: str = "concurrency_limit"
+    ):
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("Concurrency bounds must satisfy 1 <= min_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.error_rate_threshold = error_rate_threshold
+        self.metric_name = metric_name
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._latency_baseline: Optional[float] = None
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._last_decrease = 0.0
+        self._gauge = logger.metric_gauge(
+            metric_name,
+            unit="1",
+            description="Current adaptive concurrency limit"
+        )
+        self._gauge.set(self.limit)
+
+    @property
+    def limit(self) -> int:
+        """Current whole-number concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed outcomes over the sliding window."""
+        if not self._outcomes:
+            return 0.0
+        return sum(self._outcomes) / len(self._outcomes)
+
+    def set_bounds(self, min_limit: Optional[int] = None, max_limit: Optional[int] = None):
+        """Update floor and/or ceiling, clamping the current limit into the new range."""
+        min_limit = min_limit if min_limit is not None else self.min_limit
+        max_limit = max_limit if max_limit is not None else self.max_limit
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("Concurrency bounds must satisfy 1 <= min_limit <= max_limit")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._set_limit(self._limit)
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Create the condition lazily so the limiter can be built outside a running loop."""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def _set_limit(self, value: float):
+        """Clamp and apply a new limit, publishing it when the whole-number value changes."""
+        previous = self.limit
+        self._limit = min(max(value, float(self.min_limit)), float(self.max_limit))
+        if self.limit != previous:
+            self._gauge.set(self.limit)
+            logger.info(f"Concurrency limit changed from {previous} to {self.limit}", metadata={
+                "metric": self.metric_name,
+                "latency_baseline": self._latency_baseline,
+                "error_rate": self.error_rate
+            })
+
+    async def acquire(self):
+        """Wait until a slot is available under the current limit."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self, latency: float, outcome: str = "success", units: int = 1):
+        """
+        Release a slot and feed its result into the AIMD controller.
+
+        Args:
+            latency: Wall-clock seconds the slot was held
+            outcome: "success", "throttled", "error" (see classify_error) or
+                "cancelled", which frees the slot without feeding the controller
+            units: Units of work covered by the latency, used to normalize spikes
+        """
+        if outcome != "cancelled":
+            self._record(latency / max(units, 1), outcome)
+
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight -= 1
+            condition.notify_all()
+
+    def _record(self, unit_latency: float, outcome: str):
+        """Apply additive increase or multiplicative decrease for one completion."""
+        now = time.monotonic()
+        self._outcomes.append(outcome != "success")
+
+        spike = (
+            self._latency_baseline is not None
+            and unit_latency > self._latency_baseline * self.latency_tolerance
+        )
+
+        if outcome == "throttled" or spike:
+            cooldown = self._latency_baseline or 0.0
+            if now - self._last_decrease >= cooldown:
+                self._last_decrease = now
+                self._set_limit(self._limit * self.decrease_factor)
+            return
+
+        if outcome == "success":
+            # Exponentially weighted baseline of healthy latencies
+            if self._latency_baseline is None:
+                self._latency_baseline = unit_latency
+            else:
+                self._latency_baseline = 0.8 * self._latency_baseline + 0.2 * unit_latency
+
+        if outcome == "success" and self.error_rate <= self.error_rate_threshold:
+            self._set_limit(self._limit + self.increase_step / max(self._limit, 1.0))
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Hold a slot for the duration of the block.
+
+        Exceptions are classified automatically; workers that swallow errors
+        should set `slot.outcome` themselves.
+        """
+        await self.acquire()
+        slot = LimiterSlot()
+        start = time.monotonic()
+        try:
+            yield slot
+        except BaseException as e:
+            slot.outcome = "cancelled" if isinstance(e, asyncio.CancelledError) else classify_error(e)
+            raise
+        finally:
+            await self.release(time.monotonic() - start, slot.outcome, slot.units)
+
+    def snapshot(self) -> dict:
+        """Current controller state for run summaries."""
+        return {
+            "concurrency_limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self._in_flight,
+            "latency_baseline": self._latency_baseline,
+            "error_rate": self.error_rate
+        }
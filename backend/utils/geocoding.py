@@ -0,0 +1,241 @@
+"""
+Offline geocoding of free-text job locations.
+Location strings such as "Palo Alto, CA", "Northern Virginia" or
+"New York, NY, United States (+2 others)" are resolved against the bundled
+gazetteer in `backend/data/gazetteer.json` (no network calls) into a
+canonical city or area, its state and coordinates. Strings naming only a
+state resolve to the state's centroid; remote markers are flagged.
+Lookups are memoized per distinct location string, which repeats heavily
+across searches.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from pathlib import Path
+import json
+import os
+import re
+
+from pydantic import BaseModel, ConfigDict
+
+DEFAULT_GAZETTEER_PATH = Path(__file__).resolve().parents[1] / "data" / "gazetteer.json"
+
+# Mean Earth radius, for converting distances to `$centerSphere` radians
+EARTH_RADIUS_MILES = 3963.2
+
+REMOTE_MARKERS = ("remote", "anywhere", "work from home", "work-from-home", "wfh")
+
+# Trailing words of metro names ("Greater Seattle Area", "Denver Metro")
+AREA_SUFFIXES = frozenset({"area", "metro", "metropolitan", "metroplex", "region"})
+# Alternatives in one string ("Seattle, WA; Austin, TX"); the first one found is used
+ALTERNATIVES_PATTERN = re.compile(r"[;|/&]")
+PARENTHETICAL_PATTERN = re.compile(r"\([^)]*\)")
+
+# Location fields stored on listings and elevated jobs
+GEO_FIELDS = ("location_geo", "location_city", "location_region", "location_precision")
+
+
+def detect_remote(*texts: Optional[str]) -> bool:
+    """True if any of the texts marks the job as remote (hybrid roles are not remote)."""
+    for text in texts:
+        lowered = (text or "").lower()
+        if "hybrid" in lowered:
+            continue
+        if any(marker in lowered for marker in REMOTE_MARKERS):
+            return True
+    return False
+
+
+def location_key(text: Optional[str]) -> str:
+    """Lowercase, punctuation-free form used for gazetteer lookups ("St. Louis" -> "st louis")."""
+    text = (text or "").lower().replace(".", "")
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+class GeoLocation(BaseModel):
+    """A resolved location; `precision` is "city", "area", "region" or "country"."""
+    model_config = ConfigDict(frozen=True)
+
+    city: Optional[str] = None
+    region: Optional[str] = None
+    country: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    precision: Optional[str] = None
+    remote: bool = False
+
+    def point(self) -> Optional[Dict]:
+        """GeoJSON point (longitude first), or None without coordinates."""
+        if self.latitude is None or self.longitude is None:
+            return None
+        return {"type": "Point", "coordinates": [self.longitude, self.latitude]}
+
+
+class Gazetteer:
+    """
+    In-memory place index built from a gazetteer config.
+
+    Args:
+        config: `countries`, `regions` (state code, name, centroid) and `places`
+            (name, region, coordinates, optional `aliases`, `kind` and `bare`)
+        cache_size: Distinct location strings kept in the lookup cache
+    """
+
+    def __init__(self, config: Dict, cache_size: int = 16384):
+        self.countries: Dict[str, str] = {}
+        for country in config["countries"]:
+            for alias in [country["code"], country["name"], *country.get("aliases", [])]:
+                self.countries[location_key(alias)] = country["code"]
+
+        self.regions: Dict[str, Dict] = {region["code"]: region for region in config["regions"]}
+        self.region_keys: Dict[str, str] = {}
+        for region in config["regions"]:
+            self.region_keys[location_key(region["code"])] = region["code"]
+            self.region_keys[location_key(region["name"])] = region["code"]
+
+        # (place key, region) -> place, and place key alone -> first place listed with it
+        self.by_region: Dict[Tuple[str, str], Dict] = {}
+        self.by_name: Dict[str, Dict] = {}
+        for place in config["places"]:
+            for alias in [place["name"], *place.get("aliases", [])]:
+                key = location_key(alias)
+                self.by_region.setdefault((key, place["region"]), place)
+                if place.get("bare", True) or alias != place["name"]:
+                    self.by_name.setdefault(key, place)
+
+        self._geocode = lru_cache(maxsize=cache_size)(self._resolve)
+
+    @classmethod
+    def from_file(cls, path: Optional[Path] = None) -> "Gazetteer":
+        """Load a gazetteer JSON file (GAZETTEER_PATH, default backend/data/gazetteer.json)."""
+        path = Path(path or os.getenv("GAZETTEER_PATH", DEFAULT_GAZETTEER_PATH))
+        return cls(json.loads(path.read_text()))
+
+    def geocode(self, text: Optional[str]) -> Optional[GeoLocation]:
+        """
+        Resolve a free-text location.
+
+        Returns:
+            Optional[GeoLocation]: The most specific match (coordinates are None
+            for country-only and remote-only strings); None if nothing is recognized
+        """
+        if not text or not text.strip():
+            return None
+        return self._geocode(text.strip())
+
+    def cache_info(self):
+        return self._geocode.cache_info()
+
+    def region_code(self, text: Optional[str]) -> Optional[str]:
+        """State code for a code or name ("wa", "Washington"), else None."""
+        return self.region_keys.get(location_key(text))
+
+    def _resolve(self, text: str) -> Optional[GeoLocation]:
+        remote = detect_remote(text)
+        country = None
+        for alternative in ALTERNATIVES_PATTERN.split(PARENTHETICAL_PATTERN.sub(" ", text)):
+            tokens, found_country = self._strip_country(location_key(alternative).split())
+            country = country or found_country
+            place = self._match(tokens)
+            if place is None:
+                # "Greater Seattle Area" -> "greater seattle"
+                while tokens and tokens[-1] in AREA_SUFFIXES:
+                    tokens = tokens[:-1]
+                    place = self._match(tokens)
+            if place is not None:
+                return place.model_copy(update={"remote": remote})
+        if country or remote:
+            return GeoLocation(country=country, precision="country" if country else None, remote=remote)
+        return None
+
+    def _strip_country(self, tokens: List[str]) -> Tuple[List[str], Optional[str]]:
+        for size in (4, 3, 2, 1):
+            if len(tokens) >= size and " ".join(tokens[-size:]) in self.countries:
+                return tokens[:-size], self.countries[" ".join(tokens[-size:])]
+        return tokens, None
+
+    def _match(self, tokens: List[str]) -> Optional[GeoLocation]:
+        """
+        An exact place name, then a trailing state with the place before it,
+        then a place name after leading words ("hybrid in austin"). A state
+        whose place isn't in the gazetteer resolves to the state itself.
+        """
+        if not tokens:
+            return None
+        place = self.by_name.get(" ".join(tokens))
+        if place is not None:
+            return self._place(place)
+
+        for size in (3, 2, 1):
+            if len(tokens) < size:
+                continue
+            code = self.region_keys.get(" ".join(tokens[-size:]))
+            if code is None:
+                continue
+            place = self._lookup(tokens[:-size], code)
+            if place is not None:
+                return self._place(place)
+            region = self.regions[code]
+            return GeoLocation(
+                region=code, country=region["country"],
+                latitude=region["lat"], longitude=region["lon"], precision="region"
+            )
+
+        place = self._lookup(tokens, None)
+        return self._place(place) if place is not None else None
+
+    def _lookup(self, tokens: List[str], region: Optional[str]) -> Optional[Dict]:
+        # Longest suffix first, so "West Palm Beach" never matches a "Palm Beach" entry
+        for start in range(len(tokens)):
+            key = " ".join(tokens[start:])
+            place = self.by_region.get((key, region)) if region else self.by_name.get(key)
+            if place is not None:
+                return place
+        return None
+
+    def _place(self, place: Dict) -> GeoLocation:
+        return GeoLocation(
+            city=place["name"],
+            region=place["region"],
+            country=self.regions[place["region"]]["country"],
+            latitude=place["lat"],
+            longitude=place["lon"],
+            precision=place.get("kind", "city"),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_gazetteer() -> Gazetteer:
+    """Process-wide gazetteer, loaded on first use."""
+    return Gazetteer.from_file()
+
+
+def geocode(text: Optional[str]) -> Optional[GeoLocation]:
+    """Resolve a location with the bundled gazetteer (see `Gazetteer.geocode`)."""
+    return get_gazetteer().geocode(text)
+
+
+def geo_fields(*texts: Optional[str]) -> Dict:
+    """
+    Stored location fields from the first text that resolves to coordinates;
+    a text flagged remote stops the search so remote roles aren't placed at a
+    fallback location.
+
+    Returns:
+        Dict: `location_geo` (GeoJSON point), `location_city`, `location_region`
+        and `location_precision`, all None when nothing resolves
+    """
+    for text in texts:
+        location = geocode(text)
+        if location is None:
+            continue
+        if location.point() is not None:
+            return {
+                "location_geo": location.point(),
+                "location_city": location.city,
+                "location_region": location.region,
+                "location_precision": location.precision,
+            }
+        if location.remote:
+            break
+    return dict.fromkeys(GEO_FIELDS)
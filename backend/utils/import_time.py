@@ -0,0 +1,130 @@
+"""
+Import-time benchmark for CLI entry points.
+Imports each module in a fresh interpreter under `python -X importtime` and
+checks the cumulative import cost and any heavy dependencies pulled in
+against a budget.
+
+Usage:
+    python -m backend.utils.import_time [module ...] [--budget-ms N] [--repeat N]
+"""
+
+from typing import Dict, List, Optional
+from pathlib import Path
+import argparse
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import budget per entry point, in milliseconds
+ENTRY_POINT_BUDGETS_MS: Dict[str, float] = {
+    "backend.workflows.elevate_job_descriptions": 500,
+    "backend.workflows.jobs_to_mongo": 500,
+    "backend.workflows.search_jobs_to_mongodb": 500,
+    "backend.database": 150,
+}
+
+# Packages that must only load when actually used, never at import time
+DEFERRED_MODULES = (
+    "langchain", "langchain_core", "langchain_groq", "langgraph", "groq",
+    "logfire", "motor", "backend.notebooks",
+)
+
+
+def measure_import_time(module: str) -> Dict:
+    """
+    Import a module in a fresh interpreter with `-X importtime`.
+
+    Args:
+        module: Dotted module name to import
+
+    Returns:
+        Dict: `cumulative_ms` for the module and `modules`, a mapping of every
+        imported module to its cumulative import time in microseconds
+    """
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env=env
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    modules: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <indented name>"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        modules[parts[2].strip()] = int(parts[1])
+
+    return {
+        "module": module,
+        "cumulative_ms": modules.get(module, 0) / 1000,
+        "modules": modules
+    }
+
+
+def check_import_budget(
+    module: str,
+    budget_ms: float,
+    repeat: int = 3,
+    deferred: tuple = DEFERRED_MODULES
+) -> Dict:
+    """
+    Check a module's import cost against its budget.
+
+    The fastest of `repeat` runs is used to reduce noise from a cold disk cache.
+
+    Returns:
+        Dict: Best `cumulative_ms` and the list of budget `violations`
+        (empty when the module is within budget)
+    """
+    runs = [measure_import_time(module) for _ in range(max(repeat, 1))]
+    best = min(runs, key=lambda run: run["cumulative_ms"])
+
+    violations = []
+    if best["cumulative_ms"] > budget_ms:
+        violations.append(f"{module}: {best['cumulative_ms']:.1f} ms exceeds budget of {budget_ms:.0f} ms")
+
+    loaded = sorted(
+        name for name in best["modules"]
+        if any(name == heavy or name.startswith(heavy + ".") for heavy in deferred)
+    )
+    if loaded:
+        violations.append(f"{module}: imports deferred dependencies at import time: {', '.join(loaded[:10])}")
+
+    return {"cumulative_ms": best["cumulative_ms"], "violations": violations}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point for the import-time benchmark."""
+    parser = argparse.ArgumentParser(description="Import-time benchmark for CLI entry points")
+    parser.add_argument("modules", nargs="*", help="Modules to check (defaults to all entry points)")
+    parser.add_argument("--budget-ms", type=float, help="Override the budget for every module")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per module; the fastest is reported")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or list(ENTRY_POINT_BUDGETS_MS)
+    failures = []
+    for module in modules:
+        budget = args.budget_ms or ENTRY_POINT_BUDGETS_MS.get(module, 500)
+        result = check_import_budget(module, budget, repeat=args.repeat)
+        status = "FAIL" if result["violations"] else "ok"
+        print(f"{status:4} {module:50} {result['cumulative_ms']:8.1f} ms (budget {budget:.0f} ms)")
+        failures.extend(result["violations"])
+
+    for violation in failures:
+        print(f"  - {violation}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
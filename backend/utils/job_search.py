@@ -2,14 +2,16 @@ from typing import List, Optional, Dict
 from datetime import datetime, UTC
 import requests
 import os
-from dotenv import load_dotenv
-from logfire import Logfire
-from backend.database.mongodb import get_jobs_collection, get_searches_collection
+from backend.database.repositories import get_job_ingest_repository
+from backend.utils.normalization import normalize_job_listing
+from backend.utils.skill_taxonomy import tag_job_listing
+from backend.utils.titles import title_fields
 from backend.models.jobs_search_models import JobSearchResponse
+from backend.logging_config import get_logger, load_environment
 from pydantic import ValidationError
 
 # Initialize logging
-logger = Logfire()
+logger = get_logger()
 
 def fetch_job_data(
     job_title: str,
@@ -27,12 +29,13 @@ def fetch_job_data(
         next_page_token (str, optional): Token for pagination
         
     Returns:
-        Optional[Dict]: Parsed JSON response containing job listings or None if error occurs
+        Optional[Dict]: Parsed JSON response containing job listings, or None without an API key
         
     Raises:
-        requests.RequestException: If API request fails
+        requests.RequestException: If API request fails (HTTP errors such as 429
+            carry the status, so callers can classify throttling)
     """
-    load_dotenv()
+    load_environment()
     
     api_key = os.getenv('SEARCH_API_KEY')
     if not api_key:
@@ -62,7 +65,7 @@ def fetch_job_data(
         
     except requests.RequestException as e:
         logger.error(f"Error fetching job data: {str(e)}")
-        return None
+        raise
 
 def parse_job_response(raw_response: Dict) -> Optional[JobSearchResponse]:
     """
@@ -123,47 +126,61 @@ def fetch_and_parse_jobs(
         
     return parse_job_response(raw_response)  # Remove search_level addition but keep type hints
 
+def prepare_job_documents(parsed_response: JobSearchResponse, fetched_at: Optional[datetime] = None) -> List[Dict]:
+    """
+    Listing documents for a parsed search page: the listing fields plus search
+    references, normalized salary/date/remote/location fields, canonical skills
+    and the title family.
+    """
+    fetched_at = fetched_at or datetime.now(UTC)
+    job_dicts = []
+    for job in parsed_response.jobs:
+        job_dict = job.model_dump()
+        job_dict.update({
+            'search_id': parsed_response.search_metadata.id,
+            'search_query': parsed_response.search_parameters.q,
+            'fetched_at': fetched_at,
+            'search_location': parsed_response.search_information.detected_location
+        })
+        # Typed salary / posting date / remote fields for index-backed range queries
+        job_dict.update(normalize_job_listing(job_dict, fetched_at))
+        job_dict.update(tag_job_listing(job_dict))
+        job_dict.update(title_fields(job_dict.get("title")))
+        job_dicts.append(job_dict)
+    return job_dicts
+
+def persist_job_results(parsed_response: JobSearchResponse, job_dicts: Optional[List[Dict]] = None) -> Dict[int, str]:
+    """
+    Write a search page and its listings (prepared with `prepare_job_documents`
+    unless given). Errors are raised.
+    
+    Returns:
+        Dict[int, str]: Position in `job_dicts` -> id of each newly inserted listing
+    """
+    repository = get_job_ingest_repository()
+    if job_dicts is None:
+        job_dicts = prepare_job_documents(parsed_response)
+    
+    # Store search metadata
+    search_dict = parsed_response.model_dump(exclude={'jobs'})
+    repository.upsert_search(search_dict)
+    
+    # Store individual jobs with reference to search
+    new_jobs = repository.upsert_jobs(job_dicts)
+    
+    logger.info(f"Successfully stored search data and {len(job_dicts)} jobs in MongoDB", metadata={
+        "search_id": search_dict['search_metadata']['id'],
+        "new_jobs": len(new_jobs)
+    })
+    return new_jobs
+
 def store_job_results(parsed_response: JobSearchResponse) -> bool:
     """
-    Store job search results in MongoDB, splitting between searches and jobs collections
+    Store job search results in MongoDB, splitting between searches and jobs collections.
+    Uses the shared pooled synchronous client; jobs are upserted in one bulk write.
     """
     try:
-        jobs_collection = get_jobs_collection()
-        searches_collection = get_searches_collection()
-        current_time = datetime.now(UTC)
-        
-        # Store search metadata
-        search_dict = parsed_response.model_dump(exclude={'jobs'})
-        search_id = search_dict['search_metadata']['id']
-        
-        searches_collection.update_one(
-            {'search_metadata.id': search_id},
-            {'$set': search_dict},
-            upsert=True
-        )
-        
-        # Store individual jobs with reference to search
-        for job in parsed_response.jobs:
-            job_dict = job.model_dump()
-            job_dict.update({
-                'search_id': search_id,
-                'search_query': parsed_response.search_parameters.q,
-                'fetched_at': current_time,
-                'search_location': parsed_response.search_information.detected_location
-            })
-            
-            jobs_collection.update_one(
-                {
-                    'title': job.title,
-                    'company_name': job.company_name,
-                    'location': job.location,
-                    'apply_link': job.apply_link
-                },
-                {'$set': job_dict},
-                upsert=True
-            )
-        
-        logger.info(f"Successfully stored search data and {len(parsed_response.jobs)} jobs in MongoDB")
+        persist_job_results(parsed_response)
         return True
         
     except Exception as e:
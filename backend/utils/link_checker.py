@@ -0,0 +1,183 @@
+"""
+Async liveness checks for job apply links.
+One pooled aiohttp session keeps connections alive per host. Requests are
+bounded both globally and per host (a slow or rate-limited job board never
+holds more than `per_host` slots), try HEAD first and fall back to GET for
+servers that reject it, follow redirects, and send `If-None-Match` /
+`If-Modified-Since` from the previous check so unchanged pages answer 304.
+
+`next_check` turns a result into the listing's check state: live links are
+re-checked at intervals that double with every consecutive live result, dead
+links are re-checked soon and declared expired only after repeated dead
+results. Unreachable links (throttled, blocked, server errors, timeouts) are
+re-checked with capped backoff and never expire a posting.
+"""
+
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime, timedelta, UTC
+from urllib.parse import urlsplit
+import asyncio
+
+import aiohttp
+
+from backend.logging_config import get_logger
+
+logger = get_logger()
+
+USER_AGENT = "Mozilla/5.0 (compatible; ElevatedAmbitionsLinkChecker/1.0)"
+
+DEAD_STATUSES = frozenset({404, 410})
+# Servers that reject HEAD (or answer it differently from GET)
+HEAD_REJECTED = frozenset({400, 403, 405, 501})
+
+LIVE_RECHECK = timedelta(days=1)
+MAX_LIVE_RECHECK = timedelta(days=14)
+SUSPECT_RECHECK = timedelta(hours=6)
+FAILURE_RECHECK = timedelta(hours=1)
+MAX_FAILURE_RECHECK = timedelta(days=1)
+# Consecutive dead results before a listing is expired
+DEAD_CONFIRMATIONS = 2
+
+
+def classify(http_status: Optional[int], requested_url: str, final_url: Optional[str]) -> str:
+    """
+    "live", "dead" or "unknown" (throttled, server errors, network failures).
+    A redirect from a posting to the site's front page counts as dead.
+    """
+    if http_status is None:
+        return "unknown"
+    if http_status in DEAD_STATUSES:
+        return "dead"
+    if http_status == 304 or 200 <= http_status < 300:
+        if final_url and final_url != requested_url:
+            if urlsplit(final_url).path in ("", "/") and urlsplit(requested_url).path not in ("", "/"):
+                return "dead"
+        return "live"
+    return "unknown"
+
+
+def next_check(previous: Optional[Dict], result: Dict, now: Optional[datetime] = None) -> Dict:
+    """
+    New `link_check` state for a listing from its previous state and a check result.
+    `expired` is set once a link has been dead `DEAD_CONFIRMATIONS` times in
+    a row; "unknown" results only back off, as a live posting on a host that
+    blocks or throttles the checker answers the same way.
+    """
+    now = now or datetime.now(UTC)
+    previous = previous or {}
+    state = {
+        "status": result["status"],
+        "url": result["url"],
+        "http_status": result.get("http_status"),
+        "final_url": result.get("final_url"),
+        "etag": result.get("etag") or (previous.get("etag") if result["status"] == "live" else None),
+        "last_modified": result.get("last_modified") or (
+            previous.get("last_modified") if result["status"] == "live" else None
+        ),
+        "error": result.get("error"),
+        "checked_at": now,
+        "live_streak": 0,
+        "dead_streak": 0,
+        "failures": 0,
+        "expired": False,
+    }
+    if result["status"] == "live":
+        state["live_streak"] = previous.get("live_streak", 0) + 1
+        delay = min(LIVE_RECHECK * 2 ** (state["live_streak"] - 1), MAX_LIVE_RECHECK)
+    elif result["status"] == "dead":
+        state["dead_streak"] = previous.get("dead_streak", 0) + 1
+        state["expired"] = state["dead_streak"] >= DEAD_CONFIRMATIONS
+        delay = SUSPECT_RECHECK
+    else:
+        state["failures"] = previous.get("failures", 0) + 1
+        state["dead_streak"] = previous.get("dead_streak", 0)
+        delay = min(FAILURE_RECHECK * 2 ** (state["failures"] - 1), MAX_FAILURE_RECHECK)
+    state["next_check_at"] = None if state["expired"] else now + delay
+    return state
+
+
+class LinkChecker:
+    """
+    Pooled HEAD/GET checker. Use as an async context manager.
+
+    Args:
+        concurrency: Requests in flight across all hosts
+        per_host: Requests in flight per host
+        timeout: Seconds per request, including redirects
+        max_redirects: Redirects followed before giving up
+    """
+
+    def __init__(self, concurrency: int = 200, per_host: int = 8, timeout: float = 15.0, max_redirects: int = 5):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._global = asyncio.Semaphore(concurrency)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        self.stats = {"requests": 0, "not_modified": 0, "head_fallbacks": 0, "errors": 0}
+
+    async def __aenter__(self) -> "LinkChecker":
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency, limit_per_host=self.per_host, ttl_dns_cache=300, enable_cleanup_closed=True
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout, sock_connect=min(self.timeout, 5.0)),
+            headers={"User-Agent": USER_AGENT},
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+
+    async def _request(self, method: str, url: str, headers: Dict[str, str]):
+        self.stats["requests"] += 1
+        async with self.session.request(
+            method, url, headers=headers, allow_redirects=True, max_redirects=self.max_redirects
+        ) as response:
+            # Headers are all that's needed; GET bodies are discarded with the connection returned to the pool
+            return response.status, str(response.url), response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+    async def check(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> Dict:
+        """Check one URL; the result's `status` is "live", "dead" or "unknown"."""
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._hosts.setdefault(host, asyncio.Semaphore(self.per_host))
+
+        result = {"url": url, "http_status": None, "final_url": None, "etag": None, "last_modified": None, "error": None}
+        # Host slot first, so requests waiting on a busy host don't hold global slots
+        async with semaphore, self._global:
+            try:
+                status, final_url, new_etag, new_last_modified = await self._request("HEAD", url, headers)
+                if status in HEAD_REJECTED:
+                    self.stats["head_fallbacks"] += 1
+                    status, final_url, new_etag, new_last_modified = await self._request("GET", url, headers)
+                result.update(http_status=status, final_url=final_url, etag=new_etag, last_modified=new_last_modified)
+                if status == 304:
+                    self.stats["not_modified"] += 1
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                self.stats["errors"] += 1
+                result["error"] = f"{type(e).__name__}: {e}"[:200]
+        result["status"] = classify(result["http_status"], url, result["final_url"])
+        return result
+
+    async def check_any(self, urls: Iterable[str], etag: Optional[str] = None, last_modified: Optional[str] = None) -> Dict:
+        """
+        Check links in order until one is live. Validators apply to the first
+        link only. Returns the live result, else the first "unknown" result
+        (so a flaky link doesn't expire a posting), else the last dead one.
+        """
+        results: List[Dict] = []
+        for position, url in enumerate(dict.fromkeys(url for url in urls if url)):
+            result = await self.check(url, etag, last_modified) if position == 0 else await self.check(url)
+            if result["status"] == "live":
+                return result
+            results.append(result)
+        if not results:
+            return {"url": None, "status": "dead", "error": "no links"}
+        return next((result for result in results if result["status"] == "unknown"), results[-1])
@@ -0,0 +1,330 @@
+"""
+Event-loop diagnostics for the async workflows.
+A monitor task sleeps for a short interval and records how late it wakes up
+(the event-loop lag); a watchdog thread notices when the loop has not woken
+for longer than the stall threshold and captures the loop thread's stack while
+it is still blocked, so each reported stall names the blocking call. asyncio
+debug mode is switched on with `slow_callback_duration` set to the same
+threshold, and its slow-callback warnings are counted and forwarded.
+
+A profiler can be attached to the run (or its first `profile_window` seconds):
+`cprofile` writes a `.prof` file (snakeviz, tuna, flameprof) and `pyinstrument`
+a speedscope JSON file, both under `backend/data/profiles/` by default.
+
+Enable it with the `--diagnostics`/`--profile` flags of the workflow CLIs, or
+with LOOP_DIAGNOSTICS=1 (LOOP_LAG_THRESHOLD_MS, LOOP_PROFILER) for callers
+without flags.
+"""
+
+from typing import Deque, Dict, List, Optional
+from collections import deque
+from datetime import datetime, UTC
+from pathlib import Path
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+
+from backend.logging_config import get_logger
+
+logger = get_logger()
+
+PROFILERS = ("cprofile", "pyinstrument")
+DEFAULT_PROFILE_DIR = Path(__file__).resolve().parents[1] / "data" / "profiles"
+
+# Innermost frames kept from a stalled stack
+STACK_DEPTH = 25
+
+
+def percentile(values: List[float], share: float) -> float:
+    """Nearest-rank percentile of unsorted values (0.0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+class LoopLagMonitor:
+    """
+    Continuous event-loop lag measurement with stall reports.
+
+    Args:
+        threshold: Lag in seconds reported as a stall
+        interval: Seconds between lag samples
+        max_stalls: Stalls kept (with their stacks) for the summary
+        window_size: Lag samples kept for percentiles
+    """
+
+    def __init__(self, threshold: float = 0.1, interval: float = 0.05, max_stalls: int = 50, window_size: int = 10000):
+        self.threshold = threshold
+        self.interval = interval
+        self.lags: Deque[float] = deque(maxlen=window_size)
+        self.stalls: Deque[Dict] = deque(maxlen=max_stalls)
+        self.stall_count = 0
+        self.max_lag = 0.0
+        self._heartbeat = time.perf_counter()
+        self._stalled_stack: Optional[List[str]] = None
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._histogram = logger.metric_histogram(
+            "event_loop.lag",
+            unit="s",
+            description="Seconds the event loop woke up late"
+        )
+
+    def start(self):
+        """Start sampling on the running loop (call from inside it)."""
+        self._loop_thread = threading.get_ident()
+        self._heartbeat = time.perf_counter()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._sample(), name="loop-lag-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self):
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._watchdog is not None:
+            self._watchdog.join()
+
+    async def _sample(self):
+        while True:
+            self._heartbeat = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self._record(max(0.0, time.perf_counter() - self._heartbeat - self.interval))
+
+    def _watch(self):
+        """Watchdog thread: capture the loop thread's stack while it is stalled."""
+        reported = None
+        while not self._stopped.wait(self.threshold / 2):
+            heartbeat = self._heartbeat
+            if heartbeat == reported or time.perf_counter() - heartbeat - self.interval <= self.threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is not None:
+                self._stalled_stack = traceback.format_stack(frame)[-STACK_DEPTH:]
+                reported = heartbeat
+
+    def _record(self, lag: float):
+        self.lags.append(lag)
+        self.max_lag = max(self.max_lag, lag)
+        self._histogram.record(lag)
+        stack, self._stalled_stack = self._stalled_stack, None
+        if lag <= self.threshold:
+            return
+
+        self.stall_count += 1
+        stall = {"lag_ms": round(lag * 1000, 1), "at": datetime.now(UTC).isoformat(), "stack": stack}
+        self.stalls.append(stall)
+        logger.warning(f"Event loop stalled for {stall['lag_ms']} ms", metadata={
+            "lag_ms": stall["lag_ms"],
+            "stack": "".join(stack) if stack else None
+        })
+
+    def snapshot(self) -> Dict:
+        """Lag percentiles and stall counts for run summaries."""
+        lags = list(self.lags)
+        return {
+            "samples": len(lags),
+            "lag_p50_ms": round(percentile(lags, 0.5) * 1000, 1),
+            "lag_p99_ms": round(percentile(lags, 0.99) * 1000, 1),
+            "lag_max_ms": round(self.max_lag * 1000, 1),
+            "stalls": self.stall_count,
+            "threshold_ms": self.threshold * 1000
+        }
+
+
+class SlowCallbackHandler(logging.Handler):
+    """Counts and forwards asyncio debug-mode warnings ("Executing <Handle ...> took 0.250 seconds")."""
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self.count = 0
+        self.examples: Deque[str] = deque(maxlen=10)
+
+    def emit(self, record: logging.LogRecord):
+        message = record.getMessage()
+        if message.startswith("Executing"):
+            self.count += 1
+            self.examples.append(message)
+        logger.warning(f"asyncio: {message}")
+
+
+class RunProfiler:
+    """
+    cProfile or pyinstrument profile of a run window, written to one file per run.
+    pyinstrument falls back to cProfile when it is not installed.
+
+    Args:
+        kind: "cprofile" or "pyinstrument"
+        name: Run name used in the file name
+        output_dir: Directory for profile files
+    """
+
+    def __init__(self, kind: str, name: str, output_dir: Optional[Path] = None):
+        if kind not in PROFILERS:
+            raise ValueError(f"Unknown profiler {kind!r}; expected one of {', '.join(PROFILERS)}")
+        if kind == "pyinstrument":
+            try:
+                import pyinstrument  # noqa: F401
+            except ImportError:
+                logger.warning("pyinstrument is not installed; profiling with cProfile")
+                kind = "cprofile"
+        self.kind = kind
+        self.name = name
+        self.output_dir = Path(output_dir or DEFAULT_PROFILE_DIR)
+        self.path: Optional[Path] = None
+        self._profiler = None
+
+    def start(self):
+        """Start profiling (inside the running loop, so pyinstrument attributes time to awaits)."""
+        if self.kind == "pyinstrument":
+            from pyinstrument import Profiler
+
+            self._profiler = Profiler(interval=0.001, async_mode="enabled")
+            self._profiler.start()
+        else:
+            import cProfile
+
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def stop(self) -> Optional[Path]:
+        """Stop profiling and write the profile; later calls return the same path."""
+        if self._profiler is None:
+            return self.path
+        profiler, self._profiler = self._profiler, None
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{self.name}-{datetime.now(UTC).strftime('%Y%m%dT%H%M%S')}"
+        if self.kind == "pyinstrument":
+            from pyinstrument.renderers import SpeedscopeRenderer
+
+            profiler.stop()
+            self.path = self.output_dir / f"{stem}.speedscope.json"
+            self.path.write_text(profiler.output(SpeedscopeRenderer()))
+        else:
+            profiler.disable()
+            self.path = self.output_dir / f"{stem}.prof"
+            profiler.dump_stats(self.path)
+        logger.info(f"Wrote {self.kind} profile to {self.path}")
+        return self.path
+
+
+class LoopDiagnostics:
+    """
+    Async context manager that runs the lag monitor, asyncio debug mode and an
+    optional profiler for the duration of a block. Does nothing when disabled.
+
+    Args:
+        name: Run name for logs and profile files
+        enabled: Monitor the loop (implied by `profile`)
+        lag_threshold: Lag in seconds reported as a stall and as a slow callback
+        profile: "cprofile" or "pyinstrument" to profile the run
+        profile_window: Seconds profiled from the start (default: the whole block)
+        output_dir: Directory for profile files
+    """
+
+    def __init__(
+        self,
+        name: str,
+        enabled: bool = True,
+        lag_threshold: float = 0.1,
+        profile: Optional[str] = None,
+        profile_window: Optional[float] = None,
+        output_dir: Optional[Path] = None
+    ):
+        self.name = name
+        self.enabled = enabled or profile is not None
+        self.monitor = LoopLagMonitor(threshold=lag_threshold) if self.enabled else None
+        self.profiler = RunProfiler(profile, name, output_dir) if profile else None
+        self.profile_window = profile_window
+        self.slow_callbacks = SlowCallbackHandler()
+        self._window_timer: Optional[asyncio.TimerHandle] = None
+        self._previous_debug = False
+        self._previous_slow_callback_duration = 0.1
+
+    @classmethod
+    def from_args(cls, name: str, args) -> "LoopDiagnostics":
+        """Diagnostics configured by the flags of `add_diagnostics_arguments` (or the environment)."""
+        if not (args.diagnostics or args.profile):
+            return cls.from_env(name)
+        return cls(
+            name,
+            enabled=args.diagnostics,
+            lag_threshold=args.lag_threshold_ms / 1000,
+            profile=args.profile,
+            profile_window=args.profile_window
+        )
+
+    @classmethod
+    def from_env(cls, name: str) -> "LoopDiagnostics":
+        """Diagnostics configured by LOOP_DIAGNOSTICS, LOOP_LAG_THRESHOLD_MS and LOOP_PROFILER."""
+        return cls(
+            name,
+            enabled=os.getenv("LOOP_DIAGNOSTICS", "").lower() in ("1", "true", "yes"),
+            lag_threshold=float(os.getenv("LOOP_LAG_THRESHOLD_MS", "100")) / 1000,
+            profile=os.getenv("LOOP_PROFILER") or None
+        )
+
+    async def __aenter__(self) -> "LoopDiagnostics":
+        if not self.enabled:
+            return self
+        loop = asyncio.get_running_loop()
+        self._previous_debug = loop.get_debug()
+        self._previous_slow_callback_duration = loop.slow_callback_duration
+        loop.set_debug(True)
+        loop.slow_callback_duration = self.monitor.threshold
+        logging.getLogger("asyncio").addHandler(self.slow_callbacks)
+
+        self.monitor.start()
+        if self.profiler is not None:
+            self.profiler.start()
+            if self.profile_window:
+                self._window_timer = loop.call_later(self.profile_window, self.profiler.stop)
+        logger.info(f"Loop diagnostics enabled for {self.name}", metadata={
+            "lag_threshold_ms": self.monitor.threshold * 1000,
+            "profiler": self.profiler.kind if self.profiler else None,
+            "profile_window": self.profile_window
+        })
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if not self.enabled:
+            return
+        if self._window_timer is not None:
+            self._window_timer.cancel()
+        if self.profiler is not None:
+            self.profiler.stop()
+        await self.monitor.stop()
+
+        logging.getLogger("asyncio").removeHandler(self.slow_callbacks)
+        loop = asyncio.get_running_loop()
+        loop.slow_callback_duration = self._previous_slow_callback_duration
+        loop.set_debug(self._previous_debug)
+        logger.info(f"Loop diagnostics for {self.name}", metadata=self.summary())
+
+    def summary(self) -> Dict:
+        """Lag percentiles, stall and slow-callback counts and the profile path."""
+        summary = self.monitor.snapshot() if self.monitor else {}
+        summary["slow_callbacks"] = self.slow_callbacks.count
+        summary["profile"] = str(self.profiler.path) if self.profiler and self.profiler.path else None
+        return summary
+
+
+def add_diagnostics_arguments(parser):
+    """Add the `--diagnostics`, `--lag-threshold-ms`, `--profile` and `--profile-window` flags."""
+    group = parser.add_argument_group("diagnostics")
+    group.add_argument("--diagnostics", action="store_true", help="Monitor event-loop lag and report stalls")
+    group.add_argument("--lag-threshold-ms", type=float, default=100, help="Loop lag reported as a stall")
+    group.add_argument("--profile", choices=PROFILERS, help="Write a profile of the run to backend/data/profiles")
+    group.add_argument("--profile-window", type=float, help="Seconds profiled from the start (default: whole run)")
@@ -0,0 +1,273 @@
+"""
+Normalization of free-text job fields into typed, indexable values.
+Turns salary text such as "120K–180K a year" into annualized numeric bounds,
+relative posting ages such as "3 days ago" into absolute timestamps, the
+various remote markers into a boolean and locations into coordinates (see
+`backend.utils.geocoding`).
+"""
+
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta, UTC
+import re
+
+from backend.utils.geocoding import GEO_FIELDS, detect_remote, geo_fields
+
+# Multipliers that annualize a pay rate
+PERIOD_FACTORS: Dict[str, int] = {
+    "hour": 2080,
+    "day": 260,
+    "week": 52,
+    "month": 12,
+    "year": 1,
+}
+
+PERIOD_PATTERNS = [
+    ("hour", r"\b(?:hour|hourly|hr)\b|/\s*h\b"),
+    ("day", r"\b(?:day|daily)\b"),
+    ("week", r"\b(?:week|weekly|wk)\b"),
+    ("month", r"\b(?:month|monthly|mo)\b"),
+    ("year", r"\b(?:year|yearly|yr|annum|annual|annually)\b"),
+]
+
+CURRENCY_SYMBOLS = [("C$", "CAD"), ("A$", "AUD"), ("$", "USD"), ("£", "GBP"), ("€", "EUR"), ("₹", "INR")]
+CURRENCY_CODES = ("USD", "CAD", "AUD", "GBP", "EUR", "INR")
+
+# "94,500", "60.000" and "1.234,50" (grouped thousands, optional decimals), or plain "22.50"
+AMOUNT_PATTERN = re.compile(r"(\d{1,3}(?:[.,\u00a0 ]\d{3})+(?:[.,]\d{1,2})?|\d+(?:[.,]\d+)?)\s*([kKmM])?\b")
+SUFFIX_FACTORS = {"k": 1_000, "m": 1_000_000}
+# A currency sign or code right before an amount
+CURRENCY_BEFORE = re.compile(r"(?:[$£€₹]|\b(?:USD|CAD|AUD|GBP|EUR|INR))\s*$", re.IGNORECASE)
+# Percentages and counts of time off, hours and the like: "15% bonus", "2 weeks PTO"
+NOT_PAY_AFTER = re.compile(r"\s*(?:%|(?:percent|hours?|hrs?|days?|weeks?|months?|years?|yrs?)\b)", re.IGNORECASE)
+# What may separate the two bounds of a range: "120K–180K", "$94,500 - $139,000", "60 to 75"
+RANGE_JOINER = re.compile(r"\s*(?:-|–|—|to)\s*(?:[A-Z]?[$£€₹]|[A-Z]{3})?\s*$", re.IGNORECASE)
+
+AGE_PATTERN = re.compile(r"(\d+|an?|one)\+?\s*(minute|min|hour|hr|day|week|month|year)s?\s+ago")
+AGE_UNITS = {
+    "minute": timedelta(minutes=1),
+    "min": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "hr": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365),
+}
+
+# Without a stated period, amounts below these are read as hourly, then monthly, pay
+HOURLY_BELOW = 300
+MONTHLY_BELOW = 20_000
+
+# Annual amounts outside this range are treated as parse errors
+MIN_ANNUAL_SALARY = 1_000
+MAX_ANNUAL_SALARY = 10_000_000
+
+
+def parse_salary(text: Optional[str], default_currency: str = "USD") -> Optional[Dict]:
+    """
+    Parse a free-text salary into annualized bounds.
+
+    Args:
+        text: Salary text, e.g. "$94,500-$139,000", "120K–180K a year", "$60 an hour",
+            "€60.000 - €80.000"; without a stated period small amounts are read as
+            hourly, then monthly pay (see HOURLY_BELOW, MONTHLY_BELOW)
+        default_currency: Currency assumed when none is stated
+
+    Returns:
+        Optional[Dict]: `salary_min` and `salary_max` (annual, either may be None for
+        "up to" / "from" ranges), `salary_currency` and `salary_period` (the stated
+        pay period); None if no amount is found
+    """
+    if not text:
+        return None
+    lowered = text.lower()
+
+    bounds = _salary_bounds(text)
+    if not bounds:
+        return None
+    amounts = [parse_amount(match.group(1)) for match in bounds]
+    suffixes = [(match.group(2) or "").lower() or None for match in bounds]
+
+    # "120–180K": a suffix on one bound applies to a bare bound of the same magnitude
+    shared_suffix = next((suffix for suffix in suffixes if suffix), None)
+    scaled = []
+    for amount, suffix in zip(amounts, suffixes):
+        if suffix:
+            amount *= SUFFIX_FACTORS[suffix]
+        elif shared_suffix and amount < 1000:
+            amount *= SUFFIX_FACTORS[shared_suffix]
+        scaled.append(amount)
+    amounts = scaled
+
+    period = next((name for name, pattern in PERIOD_PATTERNS if re.search(pattern, lowered)), None)
+    if period is None:
+        largest = max(amounts)
+        period = "hour" if largest < HOURLY_BELOW else "month" if largest < MONTHLY_BELOW else "year"
+    factor = PERIOD_FACTORS[period]
+
+    low, high = (min(amounts), max(amounts)) if len(amounts) == 2 else (amounts[0], amounts[0])
+    if re.search(r"\bup to\b", lowered) and len(amounts) == 1:
+        low = None
+    elif re.search(r"\b(?:from|starting at|at least)\b|\+", lowered) and len(amounts) == 1:
+        high = None
+
+    annual = [round(amount * factor) if amount is not None else None for amount in (low, high)]
+    if any(value is not None and not MIN_ANNUAL_SALARY <= value <= MAX_ANNUAL_SALARY for value in annual):
+        return None
+
+    return {
+        "salary_min": annual[0],
+        "salary_max": annual[1],
+        "salary_currency": _detect_currency(text) or default_currency,
+        "salary_period": period
+    }
+
+
+def _salary_bounds(text: str) -> List[re.Match]:
+    """
+    Amount matches of the salary itself: the first amount (preferring one with
+    a currency sign) and a second bound only when it is joined to the first as
+    a range or carries a currency sign. Percentages and counts of days or weeks
+    are never bounds.
+    """
+    candidates = []
+    for match in AMOUNT_PATTERN.finditer(text):
+        signed = bool(CURRENCY_BEFORE.search(text[:match.start()]))
+        if not signed and NOT_PAY_AFTER.match(text, match.end(1) if match.group(2) is None else match.end(2)):
+            continue
+        candidates.append((match, signed))
+    if not candidates:
+        return []
+
+    first = next((position for position, (_, signed) in enumerate(candidates) if signed), 0)
+    bounds = [candidates[first][0]]
+    for match, signed in candidates[first + 1:]:
+        if signed or RANGE_JOINER.match(text[bounds[0].end():match.start()]):
+            bounds.append(match)
+            break
+    return bounds
+
+
+def parse_amount(value: str) -> float:
+    """
+    Number from an amount with either separator convention: "94,500" and
+    "60.000" are thousands, "22.50" and "1.234,50" have decimals.
+    """
+    value = re.sub(r"[\u00a0 ]", "", value)
+    if "," in value and "." in value:
+        # The later separator is the decimal one
+        thousands, decimal = (",", ".") if value.rfind(".") > value.rfind(",") else (".", ",")
+        return float(value.replace(thousands, "").replace(decimal, "."))
+    for separator in (",", "."):
+        if separator in value:
+            head, *groups = value.split(separator)
+            if all(len(group) == 3 for group in groups):
+                return float(head + "".join(groups))
+            return float(value.replace(separator, "."))
+    return float(value)
+
+
+def _detect_currency(text: str) -> Optional[str]:
+    """Currency code from a symbol or ISO code in the text."""
+    upper = text.upper()
+    for code in CURRENCY_CODES:
+        if re.search(rf"\b{code}\b", upper):
+            return code
+    for symbol, code in CURRENCY_SYMBOLS:
+        if symbol in text:
+            return code
+    return None
+
+
+def parse_posted_at(relative_age: Optional[str], reference: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Convert a relative posting age into an absolute UTC timestamp.
+
+    Args:
+        relative_age: e.g. "3 days ago", "30+ days ago", "an hour ago", "Just posted"
+        reference: When the age was observed (usually `fetched_at`); defaults to now
+
+    Returns:
+        Optional[datetime]: Estimated posting time, or None if the age can't be parsed
+    """
+    if not relative_age:
+        return None
+    reference = _as_utc(reference or datetime.now(UTC))
+    text = relative_age.strip().lower()
+
+    if text in ("today", "just posted", "just now") or "moments ago" in text:
+        return reference
+    if text == "yesterday":
+        return reference - timedelta(days=1)
+
+    match = AGE_PATTERN.search(text)
+    if not match:
+        return None
+    count = 1 if match.group(1) in ("a", "an", "one") else int(match.group(1))
+    return reference - count * AGE_UNITS[match.group(2)]
+
+
+def normalize_job_listing(job: Dict, fetched_at: Optional[datetime] = None) -> Dict:
+    """
+    Typed fields for a raw job listing, stored alongside it at ingest.
+
+    Args:
+        job: Job listing as stored in `job_listings`
+        fetched_at: When the listing was fetched; defaults to `job["fetched_at"]`
+
+    Returns:
+        Dict: `salary_min`, `salary_max`, `salary_currency`, `salary_period`,
+        `posted_date`, `is_remote` and the `geo_fields` of the listing location
+        (falling back to the location the search was run for)
+    """
+    extensions = job.get("detected_extensions") or {}
+    salary = parse_salary(extensions.get("salary")) or _empty_salary()
+    return {
+        **salary,
+        "posted_date": parse_posted_at(extensions.get("posted_at"), fetched_at or job.get("fetched_at")),
+        "is_remote": detect_remote(job.get("location"), *(job.get("extensions") or [])),
+        **geo_fields(job.get("location"), job.get("search_location"))
+    }
+
+
+def normalize_elevated_job(structured_job: Dict, raw_job: Dict) -> Dict:
+    """
+    Typed fields for an elevated job, preferring the extracted values and falling
+    back to the raw listing (the company's locations for coordinates).
+
+    Args:
+        structured_job: Extracted `JobDescription` as a dict
+        raw_job: Original job listing
+
+    Returns:
+        Dict: Same fields as `normalize_job_listing`
+    """
+    raw_fields = normalize_job_listing(raw_job)
+    compensation = structured_job.get("compensation_and_benefits") or {}
+    additional = structured_job.get("additional_information") or {}
+    role = structured_job.get("role_summary") or {}
+
+    company = structured_job.get("company_overview") or {}
+
+    salary = parse_salary(compensation.get("salary_range"))
+    remote_options = role.get("remote_options")
+    location = {key: raw_fields[key] for key in GEO_FIELDS}
+    if location["location_geo"] is None and not raw_fields["is_remote"]:
+        location = geo_fields(company.get("locations"))
+    return {
+        **(salary or {key: raw_fields[key] for key in _empty_salary()}),
+        "posted_date": raw_fields["posted_date"] or parse_posted_at(
+            additional.get("posting_age"), raw_job.get("fetched_at")
+        ),
+        "is_remote": detect_remote(remote_options) if remote_options else raw_fields["is_remote"],
+        **location
+    }
+
+
+def _empty_salary() -> Dict:
+    return {"salary_min": None, "salary_max": None, "salary_currency": None, "salary_period": None}
+
+
+def _as_utc(timestamp: datetime) -> datetime:
+    """PyMongo returns naive UTC datetimes; make them timezone-aware."""
+    return timestamp.replace(tzinfo=UTC) if timestamp.tzinfo is None else timestamp.astimezone(UTC)
@@ -0,0 +1,98 @@
+"""
+Priority scheduling of the elevation backlog.
+Each pending listing gets a score in [0, 1] from posting recency, title
+interest, company interest and the size of its duplicate cluster (the same
+title at the same company, usually one role posted in several locations),
+weighted by `backend/data/elevation_priority.json`.
+
+Scores are turned into a virtual deadline that the backlog is processed in
+ascending order of:
+
+    priority_key = hours(enqueued_at) - aging_hours * score
+
+A score of 1.0 lets a job overtake everything enqueued up to `aging_hours`
+after it, but a low-scoring job still moves ahead of every job enqueued more
+than `aging_hours` later, so nothing starves. The key never changes while a
+job waits, which is what lets it live in an index.
+"""
+
+from typing import Dict, Optional
+from datetime import datetime, UTC
+from functools import lru_cache
+from pathlib import Path
+import json
+import math
+import os
+
+from backend.database.rollups import normalize_title
+
+DEFAULT_PRIORITY_PATH = Path(__file__).resolve().parents[1] / "data" / "elevation_priority.json"
+
+
+def duplicate_key(job: Dict) -> str:
+    """Cluster key of a listing: normalized company and title."""
+    return f"{normalize_title(job.get('company_name'))}|{normalize_title(job.get('title'))}"
+
+
+class PriorityPolicy:
+    """Scores listings and derives their `priority_key` from a weights config."""
+
+    def __init__(self, config: Dict):
+        self.component_weights: Dict[str, float] = config["component_weights"]
+        self.aging_hours: float = config["aging_hours"]
+        self.recency_half_life_days: float = config["recency_half_life_days"]
+        self.title_weights = {normalize_title(title): weight for title, weight in config["title_weights"].items()}
+        self.default_title_weight: float = config["default_title_weight"]
+        self.company_weights = {normalize_title(name): weight for name, weight in config["company_weights"].items()}
+        self.default_company_weight: float = config["default_company_weight"]
+        self.max_cluster_size: int = config["max_cluster_size"]
+
+    @classmethod
+    def from_file(cls, path: Optional[Path] = None) -> "PriorityPolicy":
+        """Load a weights file (ELEVATION_PRIORITY_PATH, default backend/data/elevation_priority.json)."""
+        path = Path(path or os.getenv("ELEVATION_PRIORITY_PATH", DEFAULT_PRIORITY_PATH))
+        return cls(json.loads(path.read_text()))
+
+    def recency(self, job: Dict, now: datetime) -> float:
+        """Halves every `recency_half_life_days` since posting; 0.5 when the date is unknown."""
+        posted = job.get("posted_date") or job.get("fetched_at")
+        if not isinstance(posted, datetime):
+            return 0.5
+        if posted.tzinfo is None:
+            posted = posted.replace(tzinfo=UTC)
+        age_days = max((now - posted).total_seconds() / 86400, 0.0)
+        return 0.5 ** (age_days / self.recency_half_life_days)
+
+    def title_interest(self, job: Dict) -> float:
+        """Highest weight among the interest titles contained in the listing title."""
+        title = normalize_title(job.get("title"))
+        weights = [weight for phrase, weight in self.title_weights.items() if phrase in title]
+        return max(weights, default=self.default_title_weight)
+
+    def company_interest(self, job: Dict) -> float:
+        return self.company_weights.get(normalize_title(job.get("company_name")), self.default_company_weight)
+
+    def cluster(self, cluster_size: int) -> float:
+        """Log-scaled duplicate cluster size: one elevation stands in for several postings."""
+        return min(math.log1p(max(cluster_size, 1) - 1) / math.log(self.max_cluster_size), 1.0)
+
+    def score(self, job: Dict, cluster_size: int = 1, now: Optional[datetime] = None) -> float:
+        """Weighted score in [0, 1]."""
+        components = {
+            "recency": self.recency(job, now or datetime.now(UTC)),
+            "title": self.title_interest(job),
+            "company": self.company_interest(job),
+            "cluster": self.cluster(cluster_size),
+        }
+        total = sum(self.component_weights.values()) or 1.0
+        return sum(self.component_weights[name] * value for name, value in components.items()) / total
+
+    def key(self, enqueued_at: datetime, score: float) -> float:
+        """Virtual deadline in hours since the epoch; lower is elevated sooner."""
+        return enqueued_at.timestamp() / 3600 - self.aging_hours * score
+
+
+@lru_cache(maxsize=1)
+def get_priority_policy() -> PriorityPolicy:
+    """Default policy, loaded once per process."""
+    return PriorityPolicy.from_file()
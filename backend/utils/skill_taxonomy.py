@@ -0,0 +1,160 @@
+"""
+Canonical skill taxonomy and a single-pass multi-pattern tagger.
+Skill names and aliases from `backend/data/skill_taxonomy.json` are tokenized
+and compiled into a token-level Aho-Corasick automaton, so tagging a document
+is one scan over its tokens however many aliases the taxonomy has. Aliases
+that are ordinary English words ("go", "excel", "rest") are listed under
+`list_aliases` and only match a whole item of an extracted list, never
+free text.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+import json
+import os
+
+from backend.search.tokens import TOKEN_PATTERN
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).resolve().parents[1] / "data" / "skill_taxonomy.json"
+
+
+def skill_tokens(text: Optional[str]) -> Tuple[str, ...]:
+    """Lowercase tokens used for both aliases and documents (stopwords are kept)."""
+    return tuple(TOKEN_PATTERN.findall((text or "").lower()))
+
+
+class SkillTaxonomy:
+    """
+    Skill taxonomy compiled into an Aho-Corasick automaton over tokens.
+
+    Args:
+        skills: Entries with `name`, `category`, `aliases` and optional `list_aliases`
+    """
+
+    def __init__(self, skills: List[Dict]):
+        self.skills = skills
+        self.categories: Dict[str, str] = {skill["name"]: skill.get("category") for skill in skills}
+        # Whole-item lookups used when normalizing extracted lists
+        self.exact: Dict[Tuple[str, ...], str] = {}
+        # Trie: transitions per state, fail links, and (skill, length) outputs per state
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[List[str]] = [[]]
+
+        for skill in skills:
+            name = skill["name"]
+            list_only = {skill_tokens(alias) for alias in skill.get("list_aliases", [])}
+            for alias in [name, *skill.get("aliases", []), *skill.get("list_aliases", [])]:
+                tokens = skill_tokens(alias)
+                if not tokens:
+                    continue
+                self.exact.setdefault(tokens, name)
+                if tokens not in list_only:
+                    self._insert(tokens, name)
+        self._link()
+
+    @classmethod
+    def from_file(cls, path: Optional[Path] = None) -> "SkillTaxonomy":
+        """Load a taxonomy JSON file (SKILL_TAXONOMY_PATH, default backend/data/skill_taxonomy.json)."""
+        path = Path(path or os.getenv("SKILL_TAXONOMY_PATH", DEFAULT_TAXONOMY_PATH))
+        return cls(json.loads(path.read_text())["skills"])
+
+    def _insert(self, tokens: Tuple[str, ...], name: str):
+        state = 0
+        for token in tokens:
+            if token not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+                self.goto[state][token] = len(self.goto) - 1
+            state = self.goto[state][token]
+        if name not in self.outputs[state]:
+            self.outputs[state].append(name)
+
+    def _link(self):
+        """Breadth-first fail links; each state also inherits its fail state's outputs."""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and token not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(token, 0)
+                self.outputs[child] = self.outputs[child] + [
+                    name for name in self.outputs[self.fail[child]] if name not in self.outputs[child]
+                ]
+
+    def tag(self, text: Optional[str]) -> List[str]:
+        """Canonical skills mentioned in free text, in order of first mention."""
+        found: Dict[str, None] = {}
+        state = 0
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        for token in skill_tokens(text):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for name in outputs[state]:
+                found.setdefault(name)
+        return list(found)
+
+    def normalize(self, items: Iterable[Optional[str]]) -> Tuple[List[str], List[str]]:
+        """
+        Map an extracted skill list ("pytorch", "Torch", "AWS SageMaker") onto canonical names.
+
+        Returns:
+            Tuple[List[str], List[str]]: Canonical skills, and items no alias matched
+        """
+        canonical: Dict[str, None] = {}
+        unknown: Dict[str, str] = {}
+        for item in items:
+            tokens = skill_tokens(item)
+            if not tokens:
+                continue
+            matches = [self.exact[tokens]] if tokens in self.exact else self.tag(item)
+            for name in matches:
+                canonical.setdefault(name)
+            if not matches:
+                unknown.setdefault(" ".join(tokens), item.strip())
+        return list(canonical), list(unknown.values())
+
+
+@lru_cache(maxsize=1)
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """Default taxonomy, compiled once per process."""
+    return SkillTaxonomy.from_file()
+
+
+def listing_text(job: Dict) -> str:
+    """Title, description and highlight items of a raw job listing."""
+    highlights = [item for highlight in job.get("job_highlights") or [] for item in highlight.get("items") or []]
+    return "\n".join(filter(None, [job.get("title"), job.get("description"), *highlights]))
+
+
+def tag_job_listing(job: Dict, taxonomy: Optional[SkillTaxonomy] = None) -> Dict:
+    """
+    Skill fields for a raw job listing, stored alongside it at ingest.
+
+    Returns:
+        Dict: `skills` (canonical names in order of first mention)
+    """
+    return {"skills": (taxonomy or get_skill_taxonomy()).tag(listing_text(job))}
+
+
+def tag_elevated_job(structured_job: Dict, raw_job: Optional[Dict] = None, taxonomy: Optional[SkillTaxonomy] = None) -> Dict:
+    """
+    Skill fields for an elevated job: the extracted tools list normalized onto the
+    taxonomy, plus skills tagged in the qualifications and the raw description.
+
+    Returns:
+        Dict: `skills` (canonical names) and `unmatched_tools` (extracted tools outside the taxonomy)
+    """
+    taxonomy = taxonomy or get_skill_taxonomy()
+    details = structured_job.get("responsibilities_and_qualifications") or {}
+    canonical, unmatched = taxonomy.normalize(details.get("tools_and_technologies") or [])
+    qualifications = (details.get("required_qualifications") or []) + (details.get("preferred_qualifications") or [])
+    text_skills = taxonomy.tag("\n".join([*qualifications, listing_text(raw_job or {})]))
+    return {"skills": list(dict.fromkeys(canonical + text_skills)), "unmatched_tools": unmatched}
@@ -0,0 +1,220 @@
+"""
+Canonical job-title families and seniority levels.
+Raw titles such as "Sr. ML Engineer II" or "Machine Learning Engineer - GenAI"
+are tokenized, abbreviations expanded ("ml" -> "machine learning") and
+seniority and filler words removed, then matched against the curated titles
+in `backend/data/title_families.json`. The match is tried in three steps:
+an exact title, the longest curated title contained in the raw one, and a
+fuzzy match for misspellings. The fuzzy step uses rapidfuzz when it is
+installed and difflib otherwise. Results are memoized per raw title, which
+repeats heavily across searches.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from difflib import SequenceMatcher, get_close_matches
+from functools import lru_cache
+from pathlib import Path
+import json
+import os
+import re
+
+from pydantic import BaseModel, ConfigDict
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    process = None
+
+DEFAULT_FAMILIES_PATH = Path(__file__).resolve().parents[1] / "data" / "title_families.json"
+
+# Minimum fuzzy similarity (0-100) for a misspelled title to join a family
+FUZZY_CUTOFF = 88
+
+PARENTHETICAL_PATTERN = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+# Qualifier separators: "ML Engineer - GenAI", "Software Engineer, Machine Learning"
+SEGMENT_PATTERN = re.compile(r"\s-\s|[,|:–—]")
+
+# Stored title fields
+TITLE_FIELDS = ("title_family", "title_seniority")
+
+
+def title_words(text: Optional[str]) -> List[str]:
+    """Lowercase words; "Sr." -> "sr", "AI/ML" -> "ai ml", "C++" is kept."""
+    text = (text or "").lower().replace(".", "").replace("&", " and ")
+    return re.findall(r"[a-z0-9+#]+", text)
+
+
+class TitleMatch(BaseModel):
+    """A canonicalized title; `method` is "exact", "contains" or "fuzzy" (None when unmatched)."""
+    model_config = ConfigDict(frozen=True)
+
+    family: Optional[str] = None
+    label: Optional[str] = None
+    seniority: Optional[str] = None
+    score: float = 0.0
+    method: Optional[str] = None
+
+
+class TitleCanonicalizer:
+    """
+    Title matcher built from a families config.
+
+    Args:
+        config: `families` (slug `name`, display `label`, curated `titles`),
+            `abbreviations`, ranked `seniority` levels and `ignored_words`
+        cache_size: Distinct raw titles kept in the memo cache
+    """
+
+    def __init__(self, config: Dict, cache_size: int = 65536):
+        self.abbreviations: Dict[str, List[str]] = {
+            word: expansion.split() for word, expansion in config["abbreviations"].items()
+        }
+        # Phrases of one or two words, matched longest first
+        self.seniority: Dict[Tuple[str, ...], str] = {}
+        self.level_ranks: Dict[str, int] = {}
+        for rank, entry in enumerate(config["seniority"]):
+            self.level_ranks[entry["level"]] = rank
+            for words in entry["words"]:
+                self.seniority[tuple(words.split())] = entry["level"]
+        self.ignored = {tuple(words.split()) for words in config["ignored_words"]}
+
+        self.labels: Dict[str, str] = {family["name"]: family["label"] for family in config["families"]}
+        self.phrases: Dict[Tuple[str, ...], str] = {}
+        for family in config["families"]:
+            for title in [family["label"], *family["titles"]]:
+                tokens, _ = self.tokens(title)
+                if tokens:
+                    self.phrases.setdefault(tuple(tokens), family["name"])
+        self.longest_phrase = max(map(len, self.phrases), default=0)
+        self.choices = [" ".join(phrase) for phrase in self.phrases]
+
+        self._canonicalize = lru_cache(maxsize=cache_size)(self._resolve)
+
+    @classmethod
+    def from_file(cls, path: Optional[Path] = None) -> "TitleCanonicalizer":
+        """Load a families JSON file (TITLE_FAMILIES_PATH, default backend/data/title_families.json)."""
+        path = Path(path or os.getenv("TITLE_FAMILIES_PATH", DEFAULT_FAMILIES_PATH))
+        return cls(json.loads(path.read_text()))
+
+    def tokens(self, text: Optional[str]) -> Tuple[List[str], Optional[str]]:
+        """Matching tokens of a title and the highest seniority level it names."""
+        expanded: List[str] = []
+        for word in title_words(text):
+            expanded.extend(self.abbreviations.get(word, [word]))
+
+        tokens: List[str] = []
+        levels: List[str] = []
+        position = 0
+        while position < len(expanded):
+            for size in (2, 1):
+                phrase = tuple(expanded[position:position + size])
+                if len(phrase) < size:
+                    continue
+                if phrase in self.seniority:
+                    levels.append(self.seniority[phrase])
+                    position += size
+                    break
+                if phrase in self.ignored:
+                    position += size
+                    break
+            else:
+                tokens.append(expanded[position])
+                position += 1
+        return tokens, self._highest(levels)
+
+    def canonicalize(self, title: Optional[str]) -> TitleMatch:
+        """Family and seniority of a raw title (memoized)."""
+        if not title or not title.strip():
+            return TitleMatch()
+        return self._canonicalize(title.strip())
+
+    def cache_info(self):
+        return self._canonicalize.cache_info()
+
+    def families_for(self, titles: Iterable[str]) -> Set[str]:
+        """Families of the given titles (titles outside every family are left out)."""
+        return {match.family for match in map(self.canonicalize, titles) if match.family}
+
+    def _resolve(self, title: str) -> TitleMatch:
+        segments, levels = [], []
+        for segment in SEGMENT_PATTERN.split(PARENTHETICAL_PATTERN.sub(" ", title)):
+            tokens, level = self.tokens(segment)
+            if tokens:
+                segments.append(tokens)
+            if level:
+                levels.append(level)
+        seniority = self._highest(levels)
+        if not segments:
+            return TitleMatch(seniority=seniority)
+
+        # The whole title, then qualifiers moved to the front ("software engineer, machine
+        # learning" reads as "machine learning software engineer"), then each segment
+        candidates = [sum(segments, [])]
+        if len(segments) > 1:
+            candidates.append(sum(segments[1:], []) + segments[0])
+            candidates.extend(segments)
+
+        for tokens in candidates:
+            family = self.phrases.get(tuple(tokens))
+            if family:
+                return self._match(family, seniority, 100.0, "exact")
+
+        best: Optional[Tuple[int, float, str]] = None
+        for tokens in candidates:
+            for size in range(min(len(tokens), self.longest_phrase), 0, -1):
+                if best and size < best[0]:
+                    break
+                for start in range(len(tokens) - size + 1):
+                    family = self.phrases.get(tuple(tokens[start:start + size]))
+                    if family:
+                        candidate = (size, 100.0 * size / len(tokens), family)
+                        best = max(best or candidate, candidate, key=lambda match: match[:2])
+                        break
+        if best:
+            return self._match(best[2], seniority, round(best[1], 1), "contains")
+
+        for tokens in candidates:
+            phrase, score = self._fuzzy(" ".join(tokens))
+            if phrase:
+                return self._match(self.phrases[tuple(phrase.split())], seniority, score, "fuzzy")
+        return TitleMatch(seniority=seniority)
+
+    def _match(self, family: str, seniority: Optional[str], score: float, method: str) -> TitleMatch:
+        return TitleMatch(family=family, label=self.labels[family], seniority=seniority, score=score, method=method)
+
+    def _fuzzy(self, text: str) -> Tuple[Optional[str], float]:
+        if process is not None:
+            match = process.extractOne(text, self.choices, scorer=fuzz.ratio, score_cutoff=FUZZY_CUTOFF)
+            return (match[0], round(match[1], 1)) if match else (None, 0.0)
+        matches = get_close_matches(text, self.choices, n=1, cutoff=FUZZY_CUTOFF / 100)
+        if not matches:
+            return None, 0.0
+        return matches[0], round(100 * SequenceMatcher(None, text, matches[0]).ratio(), 1)
+
+    def _highest(self, levels: List[str]) -> Optional[str]:
+        """Most senior of the levels ("Senior Engineer II" is senior)."""
+        return max(levels, key=self.level_ranks.__getitem__, default=None)
+
+
+@lru_cache(maxsize=1)
+def get_title_canonicalizer() -> TitleCanonicalizer:
+    """Process-wide canonicalizer, loaded on first use."""
+    return TitleCanonicalizer.from_file()
+
+
+def canonicalize_title(title: Optional[str]) -> TitleMatch:
+    """Family and seniority of a raw title with the bundled families (see `TitleCanonicalizer`)."""
+    return get_title_canonicalizer().canonicalize(title)
+
+
+def title_fields(*titles: Optional[str]) -> Dict:
+    """
+    Stored title fields from the first title that joins a family.
+
+    Returns:
+        Dict: `title_family` (family slug, None when no title matches) and
+        `title_seniority` (level named by the matched title, or by the first one)
+    """
+    matches = [canonicalize_title(title) for title in titles if title]
+    match = next((match for match in matches if match.family), matches[0] if matches else TitleMatch())
+    return {"title_family": match.family, "title_seniority": match.seniority}
@@ -0,0 +1,132 @@
+"""
+Backfill canonical title families and seniority levels on stored job
+listings and elevated jobs. Titles are read in batches by the main process
+and canonicalized in a process pool (one memoized canonicalizer per worker);
+results are written back with unordered bulk updates while later batches are
+still being matched.
+
+Usage:
+    python -m backend.workflows.canonicalize_titles [--collection job_listings|elevated_jobs] [--workers N]
+        [--batch-size N] [--force]
+"""
+
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import multiprocessing
+import os
+
+from backend.database import get_jobs_collection_sync, get_elevated_jobs_collection_sync
+from backend.utils.titles import get_title_canonicalizer, title_fields
+from backend.workflows.tag_skills import _batches
+from backend.logging_config import get_logger, setup_logging
+
+logger = get_logger()
+
+ELEVATED_TITLE_FIELD = "structured_job.role_summary.title"
+
+
+def canonicalize_listing_batch(jobs: List[Dict]) -> List[Tuple[object, Dict]]:
+    """Worker: title fields for a batch of raw job listings."""
+    return [(job["_id"], title_fields(job.get("title"))) for job in jobs]
+
+
+def canonicalize_elevated_batch(batch: List[Tuple[Dict, Optional[str]]]) -> List[Tuple[object, Dict]]:
+    """Worker: title fields for a batch of (elevated job, original listing title) pairs."""
+    results = []
+    for doc, listing_title in batch:
+        role = (doc.get("structured_job") or {}).get("role_summary") or {}
+        results.append((doc["_id"], title_fields(role.get("title"), listing_title)))
+    return results
+
+
+def _with_listing_titles(docs: List[Dict]) -> List[Tuple[Dict, Optional[str]]]:
+    """Pair elevated jobs with the titles of their original listings."""
+    from bson import ObjectId
+
+    ids = [ObjectId(doc["original_job_id"]) for doc in docs if ObjectId.is_valid(doc.get("original_job_id"))]
+    listings = get_jobs_collection_sync().find({"_id": {"$in": ids}}, {"title": 1})
+    titles = {str(job["_id"]): job.get("title") for job in listings}
+    return [(doc, titles.get(doc.get("original_job_id"))) for doc in docs]
+
+
+def backfill(
+    collection: str = "job_listings",
+    workers: Optional[int] = None,
+    batch_size: int = 2000,
+    force: bool = False
+) -> int:
+    """
+    Canonicalize the titles of every document in a collection without a `title_family` field yet.
+
+    Args:
+        collection: `job_listings` or `elevated_jobs`
+        workers: Worker processes (default: CPU count)
+        batch_size: Documents per worker task and per bulk write
+        force: Recompute documents that already have title fields
+
+    Returns:
+        int: Number of documents updated
+    """
+    from pymongo import UpdateOne
+
+    query = {} if force else {"title_family": {"$exists": False}}
+    if collection == "job_listings":
+        target = get_jobs_collection_sync()
+        batches = _batches(target.find(query, {"title": 1}, batch_size=batch_size), batch_size)
+        task = canonicalize_listing_batch
+    else:
+        target = get_elevated_jobs_collection_sync()
+        cursor = target.find(query, {ELEVATED_TITLE_FIELD: 1, "original_job_id": 1}, batch_size=batch_size)
+        batches = (_with_listing_titles(batch) for batch in _batches(cursor, batch_size))
+        task = canonicalize_elevated_batch
+
+    workers = workers or os.cpu_count() or 1
+    updated = 0
+
+    def write(results: List[Tuple[object, Dict]]) -> int:
+        if not results:
+            return 0
+        operations = [UpdateOne({"_id": _id}, {"$set": fields}) for _id, fields in results]
+        return target.bulk_write(operations, ordered=False).modified_count
+
+    # Spawned rather than forked: the parent holds a PyMongo client with background threads
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=get_title_canonicalizer
+    ) as pool:
+        in_flight = set()
+        for batch in batches:
+            # Bound the batches held in memory while workers catch up
+            if len(in_flight) >= 2 * workers:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    updated += write(future.result())
+            in_flight.add(pool.submit(task, batch))
+        for future in in_flight:
+            updated += write(future.result())
+
+    logger.info(f"Canonicalized titles on {updated} {collection} documents", metadata={"workers": workers})
+    return updated
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point for the title family backfill."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backfill canonical title families and seniority levels")
+    parser.add_argument("--collection", choices=["job_listings", "elevated_jobs"], help="Collection (default: both)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=2000, help="Documents per worker task")
+    parser.add_argument("--force", action="store_true", help="Recompute documents that already have title fields")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    for collection in [args.collection] if args.collection else ["job_listings", "elevated_jobs"]:
+        backfill(collection, args.workers, args.batch_size, args.force)
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
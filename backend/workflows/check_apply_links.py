@@ -0,0 +1,181 @@
+"""
+Check the apply links of stored job listings and expire dead postings.
+Listings whose `link_check.next_check_at` is due (or that were never checked)
+are streamed from the `link_check_due` index and their `apply_link` (then
+the alternative `apply_links`) checked by a pooled `LinkChecker`. Expired
+listings get `expired: True`, leave the elevation backlog and are no longer
+re-checked.
+
+Usage:
+    python -m backend.workflows.check_apply_links [--limit N] [--concurrency N] [--per-host N]
+"""
+
+from typing import Dict, List, Optional
+from datetime import datetime, UTC
+import asyncio
+import time
+
+from backend.database import mongodb
+from backend.database.raw_store import merge_body
+from backend.database.repositories import get_job_listings_repository
+from backend.utils.link_checker import LinkChecker, next_check
+from backend.utils.loop_diagnostics import LoopDiagnostics, add_diagnostics_arguments
+from backend.logging_config import get_logger, setup_logging
+
+logger = get_logger()
+
+PROJECTION = {"apply_link": 1, "apply_links": 1, "fingerprint": 1, "link_check": 1}
+
+
+def due_query(now: Optional[datetime] = None) -> Dict:
+    """Unexpired listings due for a check, including never checked ones."""
+    return {
+        "link_check.next_check_at": {"$not": {"$gt": now or datetime.now(UTC)}},
+        "expired": {"$ne": True},
+    }
+
+
+def link_update(job: Dict, result: Dict, now: datetime) -> Dict:
+    """Update for a listing after a check; expired listings also leave the priority queue."""
+    state = next_check(job.get("link_check"), result, now)
+    update = {"$set": {"link_check": state}}
+    if state["expired"]:
+        update["$set"].update(expired=True, expired_at=now)
+        update["$unset"] = {"priority_key": "", "priority_due_at": ""}
+    return update
+
+
+async def _with_apply_links(jobs: List[Dict], raw_collection) -> List[Dict]:
+    """Restore `apply_links` from the cold bodies of split listings."""
+    fingerprints = list({job["fingerprint"] for job in jobs if job.get("fingerprint")})
+    if not fingerprints or raw_collection is None:
+        return jobs
+    bodies = {raw["_id"]: raw for raw in await raw_collection.find({"_id": {"$in": fingerprints}}).to_list(length=None)}
+    return [merge_body(job, bodies.get(job.get("fingerprint"))) for job in jobs]
+
+
+async def check_listing(checker: LinkChecker, job: Dict) -> Dict:
+    """Check result for a listing: its last live link first, then the apply link and alternatives."""
+    previous = job.get("link_check") or {}
+    urls = [previous.get("url") if previous.get("status") == "live" else None, job.get("apply_link")]
+    urls += [link.get("link") for link in job.get("apply_links") or []]
+    etag = previous.get("etag") if urls[0] else None
+    last_modified = previous.get("last_modified") if urls[0] else None
+    return await checker.check_any(urls, etag, last_modified)
+
+
+async def check_apply_links(
+    collection,
+    raw_collection=None,
+    limit: Optional[int] = None,
+    batch_size: int = 500,
+    concurrency: int = 200,
+    per_host: int = 8,
+    timeout: float = 15.0
+) -> Dict[str, int]:
+    """
+    Check due listings until none are left (or `limit` have been checked).
+
+    Args:
+        collection: Async `job_listings` collection
+        raw_collection: Async `job_listings_raw` collection (for alternative links)
+        limit: Most listings checked
+        batch_size: Listings read and updates written per round trip
+        concurrency: Requests in flight across all hosts
+        per_host: Requests in flight per host
+        timeout: Seconds per link
+
+    Returns:
+        Dict[str, int]: Counts of live, dead, unknown and newly expired listings, and of
+            listings whose check failed with an error (their state is left as it was)
+    """
+    from pymongo import UpdateOne
+
+    stats = {"checked": 0, "live": 0, "dead": 0, "unknown": 0, "expired": 0, "errors": 0}
+    started = time.perf_counter()
+    updates: List = []
+
+    async def flush():
+        nonlocal updates
+        if updates:
+            # Swap before awaiting so results finishing meanwhile land in the next batch
+            batch, updates = updates, []
+            await collection.bulk_write(batch, ordered=False)
+
+    async def run(job: Dict):
+        result = await check_listing(checker, job)
+        now = datetime.now(UTC)
+        update = link_update(job, result, now)
+        updates.append(UpdateOne({"_id": job["_id"]}, update))
+        stats["checked"] += 1
+        stats[result["status"]] += 1
+        stats["expired"] += bool(update["$set"].get("expired"))
+
+    job_ids: Dict[asyncio.Task, object] = {}
+
+    def reap(done):
+        """Retrieve finished checks; one that raised keeps its listing's previous state."""
+        for task in done:
+            job_id = job_ids.pop(task)
+            try:
+                task.result()
+            except Exception as e:
+                stats["errors"] += 1
+                logger.error(f"Failed to check apply links: {str(e)}", metadata={"job_id": str(job_id)})
+
+    async with LinkChecker(concurrency=concurrency, per_host=per_host, timeout=timeout) as checker:
+        cursor = collection.find(due_query(), PROJECTION, batch_size=batch_size)
+        if limit:
+            cursor = cursor.limit(limit)
+        in_flight = set()
+        while batch := await cursor.to_list(length=batch_size):
+            for job in await _with_apply_links(batch, raw_collection):
+                # Bound the listings held in memory while requests are in flight
+                if len(in_flight) >= 2 * concurrency:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    reap(done)
+                task = asyncio.create_task(run(job))
+                job_ids[task] = job["_id"]
+                in_flight.add(task)
+            if len(updates) >= batch_size:
+                await flush()
+        if in_flight:
+            done, _ = await asyncio.wait(in_flight)
+            reap(done)
+        await flush()
+
+    elapsed = time.perf_counter() - started
+    logger.info("Apply link check complete", metadata={
+        **stats, **checker.stats, "links_per_hour": round(checker.stats["requests"] / max(elapsed, 1e-9) * 3600)
+    })
+    return stats
+
+
+async def main():
+    """CLI entry point for the apply link checker."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Check job apply links and expire dead postings")
+    parser.add_argument("--limit", type=int, help="Most listings checked")
+    parser.add_argument("--batch-size", type=int, default=500, help="Listings per read and bulk write")
+    parser.add_argument("--concurrency", type=int, default=200, help="Requests in flight across all hosts")
+    parser.add_argument("--per-host", type=int, default=8, help="Requests in flight per host")
+    parser.add_argument("--timeout", type=float, default=15.0, help="Seconds per link")
+    add_diagnostics_arguments(parser)
+    args = parser.parse_args()
+
+    setup_logging()
+    async with mongodb, LoopDiagnostics.from_args("check_apply_links", args):
+        jobs = await get_job_listings_repository()
+        await jobs.ensure_indexes()
+        await check_apply_links(
+            jobs.collection,
+            jobs.raw_collection,
+            limit=args.limit,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            per_host=args.per_host,
+            timeout=args.timeout
+        )
+
+if __name__ == "__main__":
+    asyncio.run(main())
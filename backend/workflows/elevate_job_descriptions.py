@@ -4,62 +4,133 @@ Handles the elevation of job data through AI processing and validation.
 """
 
 from typing import Optional, List, Dict
-from datetime import datetime, UTC
-from logfire import Logfire, configure
-from pydantic import Field
+from datetime import datetime, timedelta, UTC
 import asyncio
-from bson import ObjectId
-from tqdm.asyncio import tqdm
 from tqdm import tqdm as tqdm_sync
-from os import getenv
+import time
 
-from backend.database import get_jobs_collection, get_elevated_jobs_collection
+from backend.database import get_model_tier_stats_collection, get_cache_versions_collection
+from backend.database.repositories import (
+    JobListingsRepository, ElevatedJobsRepository,
+    get_job_listings_repository, get_elevated_jobs_repository
+)
+from backend.database.rollups import RollupsRepository, get_rollups_repository
+from backend.database.raw_store import source_listing
+from backend.database.alerts import AlertsRepository, get_alerts_repository
+from backend.api.cache import CacheVersion
+from backend.utils.normalization import normalize_elevated_job
+from backend.utils.skill_taxonomy import tag_elevated_job
+from backend.utils.titles import title_fields
+from backend.utils.priority import PriorityPolicy, get_priority_policy
 from backend.models.job_description_workflow_state import JobDescriptionProcessingState
-from backend.agents.job_description_graph import create_job_description_graph
-from backend.logging_config import setup_logging
-
-setup_logging()  # Must be before any other imports that might use logging
+from backend.agents.model_cascade import MODEL_TIERS, ModelCascadePolicy
+from backend.utils.concurrency import AdaptiveConcurrencyLimiter, classify_error
+from backend.utils.loop_diagnostics import LoopDiagnostics, add_diagnostics_arguments
+from backend.logging_config import get_logger, setup_logging
 
 class JobElevationWorkflow:
     """
     Orchestrates the complete job elevation process, including:
-    - Batch processing of jobs
-    - Concurrent execution management
+    - Batch processing of jobs, highest priority first (see backend.utils.priority)
+    - Concurrent execution management (adaptive AIMD limit between
+      `min_concurrent` and `max_concurrent`)
     - Database operations
-    - Error handling and retries
+    - Error handling and retries (failed jobs back off exponentially and are
+      parked in the "dead_letter" status once `max_failures` is reached)
     """
     
-    def __init__(self, batch_size: int = 10, max_concurrent: int = 3):
+    def __init__(
+        self,
+        batch_size: int = 10,
+        max_concurrent: int = 8,
+        min_concurrent: int = 1,
+        initial_concurrent: int = 3,
+        max_failures: int = 3,
+        retry_backoff: timedelta = timedelta(minutes=30),
+        max_retry_backoff: timedelta = timedelta(hours=24),
+        num_candidates: int = 1,
+        priority_policy: Optional[PriorityPolicy] = None,
+        priority_interval: timedelta = timedelta(minutes=1)
+    ):
         self.batch_size = batch_size
         self.max_concurrent = max_concurrent
-        self.graph = create_job_description_graph()
-        self.logger = Logfire()
-        self.jobs_collection = None
-        self.elevated_jobs = None
+        self.min_concurrent = min_concurrent
+        self.max_failures = max_failures
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        # K > 1 runs K concurrent extraction candidates in the first round
+        self.num_candidates = num_candidates
+        # Shared across batches so the learned limit carries over between runs of process_batch
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=initial_concurrent,
+            min_limit=min_concurrent,
+            max_limit=max_concurrent,
+            metric_name="elevation.concurrency_limit"
+        )
+        self._graph = None
+        setup_logging()
+        self.logger = get_logger()
+        self.jobs: Optional[JobListingsRepository] = None
+        self.elevated_jobs: Optional[ElevatedJobsRepository] = None
+        self.rollups: Optional[RollupsRepository] = None
+        self.alerts: Optional[AlertsRepository] = None
+        self.cache_version: Optional[CacheVersion] = None
+        self.cascade_policy = ModelCascadePolicy()
+        self.priority_policy = priority_policy or get_priority_policy()
+        # Due jobs are scored at most once per interval, not on every batch
+        self.priority_interval = priority_interval
+        self._priorities_assigned_at: Optional[datetime] = None
+
+    @property
+    def graph(self):
+        """
+        Compiled extraction graph, built on first use so LangGraph, LangChain
+        and Groq are only imported when jobs are actually elevated.
+        """
+        if self._graph is None:
+            from backend.agents.job_description_graph import create_job_description_graph
+            self._graph = create_job_description_graph()
+        return self._graph
 
     async def initialize(self):
         """Initialize async resources"""
-        self.jobs_collection = await get_jobs_collection()
-        self.elevated_jobs = await get_elevated_jobs_collection()
+        self.jobs = await get_job_listings_repository()
+        self.elevated_jobs = await get_elevated_jobs_repository()
+        self.rollups = await get_rollups_repository()
+        self.alerts = await get_alerts_repository()
+        self.cache_version = CacheVersion(await get_cache_versions_collection())
+        self.cascade_policy = ModelCascadePolicy(await get_model_tier_stats_collection())
+        await self.cascade_policy.load()
+        await self.jobs.ensure_indexes()
+        await self.elevated_jobs.ensure_indexes()
+        await self.rollups.ensure_indexes()
+        await self.alerts.ensure_indexes()
+
+    def retry_delay(self, failures: int) -> timedelta:
+        """Exponential backoff before a job that has failed `failures` times is retried."""
+        return min(self.retry_backoff * (2 ** max(failures - 1, 0)), self.max_retry_backoff)
 
     async def process_job(self, job_id: str, raw_job_data: Dict) -> JobDescriptionProcessingState:
         """Process a single job through the elevation workflow."""
         try:
-            # Convert ObjectId to string in raw_job_data
+            # Only the fetched fields reach the prompts; ObjectId becomes a string
+            raw_job_data = source_listing(raw_job_data)
             if '_id' in raw_job_data:
-                raw_job_data = raw_job_data.copy()
                 raw_job_data['_id'] = str(raw_job_data['_id'])
 
             initial_state = JobDescriptionProcessingState(
                 job_id=job_id,
                 raw_job_data=raw_job_data,
+                model_tier=self.cascade_policy.choose_tier(raw_job_data),
+                num_candidates=self.num_candidates,
                 created_at=datetime.now(UTC),
                 updated_at=datetime.now(UTC)
             )
             
             self.logger.info("Starting job processing", metadata={
                 "job_id": job_id,
-                "initial_status": initial_state.status
+                "initial_status": initial_state.status,
+                "model_tier": initial_state.model_tier
             })
             
             # Execute the graph and convert result back to JobDescriptionProcessingState
@@ -70,17 +141,28 @@ class JobElevationWorkflow:
                 "job_id": job_id,
                 "final_status": final_state.status,
                 "attempts": final_state.attempts,
+                "model_tier": final_state.model_tier,
                 "quality_score": final_state.grader_output.overall_quality_score if final_state.grader_output else None
             })
             
+            if final_state.extraction_calls:
+                starting_tier = final_state.extraction_calls[0]["tier"]
+                await self.cascade_policy.record(
+                    raw_job_data,
+                    starting_tier,
+                    final_state.status == "completed" and final_state.model_tier == starting_tier
+                )
+            
             if final_state.status == "completed":
                 await self._save_to_database(final_state)
+            else:
+                await self._record_failure(final_state)
             
             return final_state
             
         except Exception as e:
             self.logger.error(f"Error processing job {job_id}: {str(e)}", exc_info=True)
-            return JobDescriptionProcessingState(
+            failed_state = JobDescriptionProcessingState(
                 job_id=job_id,
                 raw_job_data=raw_job_data,
                 status="failed",
@@ -88,6 +170,26 @@ class JobElevationWorkflow:
                 created_at=datetime.now(UTC),
                 updated_at=datetime.now(UTC)
             )
+            await self._record_failure(failed_state)
+            return failed_state
+
+    async def assign_priorities(self, force: bool = False) -> int:
+        """
+        Score jobs that became due since the last pass (new listings, retries
+        whose backoff has ended, requeued dead letters), at most once per
+        `priority_interval` unless `force`.
+
+        Returns:
+            int: Number of jobs scored
+        """
+        now = datetime.now(UTC)
+        if not force and self._priorities_assigned_at and now - self._priorities_assigned_at < self.priority_interval:
+            return 0
+        self._priorities_assigned_at = now
+        scored = await self.jobs.assign_priorities(self.priority_policy)
+        if scored:
+            self.logger.info("Scored queued jobs", metadata={"scored": scored})
+        return scored
 
     async def process_batch(
         self,
@@ -95,80 +197,143 @@ class JobElevationWorkflow:
         max_concurrent: Optional[int] = None,
         job_titles: Optional[List[str]] = None
     ) -> Dict[str, int]:
-        """Process a batch of jobs with concurrency control."""
+        """
+        Process a batch of jobs with adaptive concurrency control.
+        
+        Args:
+            batch_size: Number of pending jobs to fetch
+            max_concurrent: Optional override of the concurrency ceiling
+            job_titles: Restrict processing to these job titles
+        """
         batch_size = batch_size or self.batch_size
-        max_concurrent = max_concurrent or self.max_concurrent
+        if max_concurrent:
+            self.max_concurrent = max(max_concurrent, self.min_concurrent)
+            self.limiter.set_bounds(max_limit=self.max_concurrent)
         
         self.logger.info("Starting batch processing", 
             metadata={
                 "batch_size": batch_size,
-                "max_concurrent": max_concurrent,
+                "max_concurrent": self.max_concurrent,
+                "concurrency_limit": self.limiter.limit,
                 "job_titles": job_titles
             }
         )
         
-        # Get pending jobs
-        query = {
-            "$or": [
-                {"extracted": {"$ne": True}},
-                {"extracted": {"$exists": False}}
-            ]
-        }
-        if job_titles:
-            query["title"] = {"$in": job_titles}
-            
-        # Use to_list() for async cursor operation
-        pending_jobs = await self.jobs_collection.find(query) \
-            .sort("_id", -1) \
-            .limit(batch_size) \
-            .to_list(length=batch_size)
-        
+        # Take the highest priority jobs; dead-lettered jobs and those still
+        # backing off carry no priority key
+        await self.assign_priorities()
+        pending_jobs = await self.jobs.find_pending(batch_size, job_titles)
+        return await self.process_jobs(pending_jobs)
+
+    async def process_job_ids(self, job_ids: List[str], job_titles: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Process specific jobs (e.g. just inserted), skipping any that are no
+        longer pending because another run already elevated them.
+        """
+        pending_jobs = await self.jobs.find_pending_by_ids(job_ids, job_titles)
+        return await self.process_jobs(pending_jobs)
+
+    async def process_jobs(self, pending_jobs: List[Dict]) -> Dict[str, int]:
+        """Elevate already-fetched pending jobs with adaptive concurrency control."""
         if not pending_jobs:
-            return {"total": 0, "successful": 0, "failed": 0}
+            return {"total": 0, "successful": 0, "failed": 0, "concurrency_limit": self.limiter.limit}
         
-        # Process with concurrency control
-        semaphore = asyncio.Semaphore(max_concurrent)
+        # Process with adaptive concurrency control
         stats = {"total": 0, "successful": 0, "failed": 0}
+        latencies: List[float] = []
+        extraction_calls: List[int] = []
+        costs: List[float] = []
         
-        async def process_with_semaphore(job: Dict):
-            async with semaphore:
+        async def process_with_limiter(job: Dict):
+            async with self.limiter.slot() as slot:
+                started = time.perf_counter()
+                # Pending jobs are fetched without their bodies; load one only when it is processed
+                job = await self.jobs.load_raw(job)
                 result = await self.process_job(str(job["_id"]), job)
+                latencies.append(time.perf_counter() - started)
+                extraction_calls.append(len(result.extraction_calls))
+                costs.append(sum(call.get("cost_usd", 0.0) for call in result.extraction_calls))
+                # Latency is compared per extraction round so retries don't look like spikes
+                slot.units = max(result.attempts, 1)
                 if result.status == "completed":
                     stats["successful"] += 1
                 else:
+                    slot.outcome = classify_error(result.error_message)
                     stats["failed"] += 1
                 stats["total"] += 1
         
         # Process all jobs with progress bar
-        tasks = [process_with_semaphore(job) for job in pending_jobs]
+        tasks = [process_with_limiter(job) for job in pending_jobs]
         with tqdm_sync(total=len(tasks), desc="Processing jobs") as pbar:
             for coro in asyncio.as_completed(tasks):
                 await coro
                 pbar.update(1)
+                pbar.set_postfix(concurrency=self.limiter.limit, refresh=False)
         
+        await self.flush_vectors()
+        stats["concurrency_limit"] = self.limiter.limit
+        stats.update(self._latency_summary(latencies, extraction_calls, costs))
+        self.logger.info("Batch summary", metadata=stats)
         return stats
 
+    def _latency_summary(self, latencies: List[float], extraction_calls: List[int], costs: List[float]) -> Dict:
+        """
+        Latency and cost figures for the run summary, tagged with the number of
+        parallel candidates so K can be compared against tail latency and spend.
+        """
+        if not latencies:
+            return {"candidates": self.num_candidates, "avg_latency_s": 0.0}
+        
+        ordered = sorted(latencies)
+        def percentile(q: float) -> float:
+            return round(ordered[min(int(q * len(ordered)), len(ordered) - 1)], 2)
+        
+        return {
+            "candidates": self.num_candidates,
+            "avg_latency_s": round(sum(ordered) / len(ordered), 2),
+            "p50_latency_s": percentile(0.5),
+            "p95_latency_s": percentile(0.95),
+            "max_latency_s": round(ordered[-1], 2),
+            "extraction_calls_per_job": round(sum(extraction_calls) / len(extraction_calls), 2),
+            "cost_per_job_usd": round(sum(costs) / len(costs), 6)
+        }
+
+    @staticmethod
+    def _extraction_summary(state: JobDescriptionProcessingState) -> Dict:
+        """Summarize model choice, latency and cost of the extraction calls for a job."""
+        calls = state.extraction_calls
+        return {
+            "model_tier": state.model_tier,
+            "model": MODEL_TIERS[state.model_tier]["model"],
+            "starting_tier": calls[0]["tier"] if calls else state.model_tier,
+            "escalated": bool(calls) and calls[0]["tier"] != state.model_tier,
+            "latency_s": round(sum(call.get("latency_s", 0.0) for call in calls), 3),
+            "cost_usd": sum(call.get("cost_usd", 0.0) for call in calls),
+            "candidates": state.candidate_stats,
+            "calls": calls
+        }
+
     async def _save_to_database(self, state: JobDescriptionProcessingState):
         """Save processed job to database."""
         try:
-            new_id = str(ObjectId())
+            structured_job = state.structured_job.model_dump(mode="json")
             elevated_job = {
-                "_id": ObjectId(new_id),
                 "original_job_id": state.job_id,
-                "structured_job": state.structured_job.model_dump(mode="json"),
+                "structured_job": structured_job,
                 "grader_output": state.grader_output.model_dump(mode="json"),
-                "created_at": datetime.now(UTC)
+                "extraction": self._extraction_summary(state),
+                "created_at": datetime.now(UTC),
+                **normalize_elevated_job(structured_job, state.raw_job_data),
+                **tag_elevated_job(structured_job, state.raw_job_data),
+                # The extracted title first, the listing title if it names no family
+                **title_fields(
+                    (structured_job.get("role_summary") or {}).get("title"), state.raw_job_data.get("title")
+                )
             }
             
-            await self.elevated_jobs.insert_one(elevated_job)
-            
-            await self.jobs_collection.update_one(
-                {"_id": ObjectId(state.job_id)},
-                {"$set": {
-                    "extracted": True,
-                    "elevated_job_id": new_id
-                }}
-            )
+            new_id = await self.elevated_jobs.insert(elevated_job)
+            await self.jobs.mark_elevated(state.job_id, new_id)
+            await self._after_save(elevated_job, state.raw_job_data)
             
             self.logger.info("Saved elevated job to database", metadata={
                 "job_id": state.job_id,
@@ -181,22 +346,113 @@ class JobElevationWorkflow:
             })
             raise
 
+    async def _after_save(self, elevated_job: Dict, raw_job: Dict):
+        """
+        Update data derived from a saved job (analytics rollups, job alerts)
+        and invalidate API response caches.
+        Failures are logged rather than raised; the rollups and vector index can be rebuilt.
+        Embeddings are only queued here and encoded once per batch in `flush_vectors`.
+        """
+        # Deferred so NumPy is only loaded once jobs are actually saved
+        from backend.search.vectors import queue_elevated_job
+
+        queue_elevated_job(elevated_job)
+        updates = {
+            "job rollups": self.rollups.apply(elevated_job, raw_job.get("location")),
+            "job alerts": self.alerts.match_new_job(elevated_job),
+            "API cache version": self.cache_version.bump(),
+        }
+        for name, update in updates.items():
+            try:
+                await update
+            except Exception as e:
+                self.logger.error(f"Failed to update {name}: {str(e)}", metadata={
+                    "original_job_id": elevated_job.get("original_job_id")
+                })
+
+    async def flush_vectors(self):
+        """Encode the jobs saved during this batch and add them to the vector index."""
+        from backend.search.vectors import flush_pending
+
+        try:
+            added = await asyncio.to_thread(flush_pending)
+            if added:
+                self.logger.info("Updated vector index", metadata={"added": added})
+        except Exception as e:
+            self.logger.error(f"Failed to update vector index: {str(e)}")
+
+    async def _record_failure(self, state: JobDescriptionProcessingState):
+        """
+        Persist failure state on the job: attempt count, last error and score,
+        and the next eligible time. Jobs over the retry budget are dead-lettered.
+        """
+        try:
+            update = await self.jobs.record_failure(
+                state.job_id,
+                state.error_message,
+                state.grader_output.overall_quality_score if state.grader_output else None,
+                self.max_failures,
+                self.retry_delay
+            )
+            if update is None:
+                return
+            
+            self.logger.info("Recorded elevation failure", metadata={
+                "job_id": state.job_id,
+                **update
+            })
+            
+        except Exception as e:
+            self.logger.error(f"Failed to record elevation failure: {str(e)}", metadata={
+                "job_id": state.job_id
+            })
+
+    async def requeue_dead_letters(self, job_ids: Optional[List[str]] = None) -> int:
+        """
+        Return dead-lettered jobs to the pending pool with a fresh retry budget.
+        
+        Args:
+            job_ids: Specific jobs to requeue; all dead-lettered jobs if omitted
+            
+        Returns:
+            int: Number of jobs requeued
+        """
+        requeued = await self.jobs.requeue_dead_letters(job_ids)
+        self.logger.info(f"Requeued {requeued} dead-lettered jobs")
+        return requeued
+
 async def main():
     """CLI entry point for the workflow."""
     import argparse
     parser = argparse.ArgumentParser(description="Job Elevation Workflow")
     parser.add_argument("--batch-size", type=int, help="Batch size for processing")
-    parser.add_argument("--max-concurrent", type=int, help="Maximum concurrent jobs")
+    parser.add_argument("--max-concurrent", type=int, default=8, help="Concurrency ceiling for the adaptive limiter")
+    parser.add_argument("--min-concurrent", type=int, default=1, help="Concurrency floor for the adaptive limiter")
     parser.add_argument("--job-titles", nargs="+", help="Specific job titles to process")
+    parser.add_argument("--max-failures", type=int, default=3, help="Failures before a job is dead-lettered")
+    parser.add_argument("--requeue-dead-letters", action="store_true", help="Requeue dead-lettered jobs and exit")
+    parser.add_argument("--candidates", type=int, default=1, help="Parallel extraction candidates in the first round")
+    add_diagnostics_arguments(parser)
     args = parser.parse_args()
     
-    workflow = JobElevationWorkflow()
-    await workflow.initialize()  # Initialize collections
-    stats = await workflow.process_batch(
-        batch_size=args.batch_size,
-        max_concurrent=args.max_concurrent,
-        job_titles=args.job_titles
-    )
+    setup_logging()
+    async with LoopDiagnostics.from_args("elevate_job_descriptions", args):
+        workflow = JobElevationWorkflow(
+            max_concurrent=args.max_concurrent,
+            min_concurrent=args.min_concurrent,
+            max_failures=args.max_failures,
+            num_candidates=args.candidates
+        )
+        await workflow.initialize()  # Initialize collections
+        
+        if args.requeue_dead_letters:
+            await workflow.requeue_dead_letters()
+            return
+        
+        stats = await workflow.process_batch(
+            batch_size=args.batch_size,
+            job_titles=args.job_titles
+        )
     
     workflow.logger.info("Workflow complete", metadata=stats)
 
@@ -0,0 +1,246 @@
+"""
+Event-driven elevation: new `job_listings` are handed to the elevation
+workflow as soon as they are inserted instead of waiting for the next batch run.
+
+On a replica set the trigger follows a change stream filtered to insert events
+and checkpoints the stream's resume token in `trigger_state` after each batch
+has been processed, so a restarted trigger picks up exactly where the last one
+stopped (events may be replayed, never lost; already elevated jobs are skipped
+because only pending jobs are fetched). Standalone servers have no change
+streams, so the trigger falls back to polling the default `_id` index, backing
+off while the collection is idle. ObjectIds are generated by the inserting
+clients, so a listing can become visible after one with a greater `_id` (clock
+skew between ingest hosts, a slow bulk write): each poll rescans the `_id`s of
+the last `poll_overlap` seconds before the newest one seen - a covered range
+scan - and skips the ones already handed over, which are checkpointed too.
+
+Usage:
+    python -m backend.workflows.elevation_trigger [--mode auto|stream|poll] [--batch-size N] [--catch-up]
+"""
+
+from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, UTC
+import asyncio
+
+from backend.database import mongodb, get_trigger_state_collection
+from backend.utils.loop_diagnostics import LoopDiagnostics, add_diagnostics_arguments
+from backend.logging_config import get_logger, setup_logging
+
+logger = get_logger()
+
+STATE_ID = "elevation:job_listings"
+
+# Server error codes
+NOT_REPLICA_SET = 40573
+CHANGE_STREAM_HISTORY_LOST = 286
+CHANGE_STREAM_FATAL = 280
+
+INSERTS_PIPELINE = [
+    {"$match": {"operationType": "insert"}},
+    {"$project": {"documentKey": 1}},
+]
+
+
+class ElevationTrigger:
+    """
+    Feeds newly inserted job listings into `JobElevationWorkflow.process_job_ids`.
+
+    Args:
+        workflow: Initialized elevation workflow
+        state_collection: Collection holding the checkpoint document
+        batch_size: Most job IDs handed to the workflow at once
+        linger: Seconds a partial batch waits for more inserts before it is processed
+        poll_interval: Initial polling interval when change streams are unavailable
+        max_poll_interval: Ceiling of the idle polling backoff
+        poll_overlap: Seconds of `_id`s before the newest one seen that are polled again
+        job_titles: Restrict elevation to these job titles
+        mode: "stream", "poll", or "auto" (stream, falling back to polling)
+    """
+
+    def __init__(
+        self,
+        workflow,
+        state_collection,
+        batch_size: int = 10,
+        linger: float = 2.0,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        poll_overlap: float = 60.0,
+        job_titles: Optional[List[str]] = None,
+        mode: str = "auto"
+    ):
+        self.workflow = workflow
+        self.listings = workflow.jobs.collection
+        self.state = state_collection
+        self.batch_size = batch_size
+        self.linger = linger
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.poll_overlap = poll_overlap
+        self.job_titles = job_titles
+        self.mode = mode
+        self.stats = {"batches": 0, "total": 0, "successful": 0, "failed": 0}
+
+    async def load_state(self) -> Dict:
+        return await self.state.find_one({"_id": STATE_ID}) or {}
+
+    async def save_state(self, **fields: Any):
+        await self.state.update_one(
+            {"_id": STATE_ID}, {"$set": {**fields, "updated_at": datetime.now(UTC)}}, upsert=True
+        )
+
+    async def run(self, stop: Optional[asyncio.Event] = None):
+        """Process inserts until `stop` is set."""
+        from pymongo.errors import OperationFailure
+
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            if self.mode == "poll":
+                await self.poll(stop)
+                return
+            try:
+                await self.watch(stop)
+                return
+            except OperationFailure as error:
+                if error.code == NOT_REPLICA_SET and self.mode == "auto":
+                    logger.info("Change streams unavailable, polling job_listings by _id")
+                    self.mode = "poll"
+                elif error.code in (CHANGE_STREAM_HISTORY_LOST, CHANGE_STREAM_FATAL):
+                    # The checkpoint fell off the oplog: sweep what was missed, then start a fresh stream
+                    logger.warning("Resume token expired, catching up on pending jobs", metadata={"code": error.code})
+                    await self.save_state(resume_token=None)
+                    await self.catch_up()
+                else:
+                    raise
+
+    async def watch(self, stop: asyncio.Event):
+        """Follow insert events, checkpointing the resume token after each processed batch."""
+        state = await self.load_state()
+        saved_token = state.get("resume_token")
+        async with self.listings.watch(
+            INSERTS_PIPELINE, resume_after=saved_token, max_await_time_ms=int(self.linger * 1000)
+        ) as stream:
+            logger.info("Watching job_listings inserts", metadata={"resumed": saved_token is not None})
+            job_ids: List[str] = []
+            while not stop.is_set():
+                change = await stream.try_next()
+                if change is not None:
+                    job_ids.append(str(change["documentKey"]["_id"]))
+                    if len(job_ids) < self.batch_size:
+                        continue
+                if job_ids:
+                    await self._dispatch(job_ids)
+                    job_ids = []
+                # Also checkpoint while idle so a restart doesn't resume from an expiring token
+                if stream.resume_token is not None and stream.resume_token != saved_token:
+                    saved_token = stream.resume_token
+                    await self.save_state(mode="stream", resume_token=saved_token)
+
+    async def poll(self, stop: asyncio.Event):
+        """Poll for listings not handed over yet, rescanning the overlap window, backing off while idle."""
+        state = await self.load_state()
+        last_id = state.get("last_id")
+        dispatched = set(state.get("recent_ids") or [])
+        if last_id is None:
+            # First run: only listings inserted from now on (use --catch-up for the backlog)
+            newest = await self.listings.find({}, {"_id": 1}).sort("_id", -1).limit(1).to_list(length=1)
+            last_id = newest[0]["_id"] if newest else None
+            dispatched = set(await self._recent_ids(last_id))
+            await self.save_state(mode="poll", last_id=last_id, recent_ids=sorted(dispatched))
+        interval = self.poll_interval
+
+        while not stop.is_set():
+            recent = await self._recent_ids(last_id)
+            # IDs that left the window can't be returned again
+            dispatched.intersection_update(recent)
+            job_ids = [job_id for job_id in recent if job_id not in dispatched][:self.batch_size]
+            if job_ids:
+                await self._dispatch([str(job_id) for job_id in job_ids])
+                dispatched.update(job_ids)
+                last_id = max(job_ids[-1], last_id) if last_id is not None else job_ids[-1]
+                await self.save_state(mode="poll", last_id=last_id, recent_ids=sorted(dispatched))
+                interval = self.poll_interval
+                continue
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                interval = min(interval * 2, self.max_poll_interval)
+
+    async def _recent_ids(self, last_id) -> List:
+        """`_id`s from `poll_overlap` seconds before `last_id` on (every `_id` when there is none), ascending."""
+        from bson import ObjectId
+
+        query = {}
+        if last_id is not None:
+            window_start = last_id.generation_time - timedelta(seconds=self.poll_overlap)
+            query = {"_id": {"$gte": ObjectId.from_datetime(window_start)}}
+        documents = await self.listings.find(query, {"_id": 1}).sort("_id", 1).to_list(length=None)
+        return [document["_id"] for document in documents]
+
+    async def catch_up(self):
+        """Elevate the existing backlog of pending jobs."""
+        while True:
+            stats = await self.workflow.process_batch(batch_size=self.batch_size, job_titles=self.job_titles)
+            if stats["total"] == 0:
+                return
+            self._record(stats)
+
+    async def _dispatch(self, job_ids: List[str]):
+        stats = await self.workflow.process_job_ids(job_ids, self.job_titles)
+        self._record(stats)
+        logger.info("Elevated inserted jobs", metadata={"inserted": len(job_ids), **stats})
+
+    def _record(self, stats: Dict[str, int]):
+        self.stats["batches"] += 1
+        for key in ("total", "successful", "failed"):
+            self.stats[key] += stats.get(key, 0)
+
+
+async def main():
+    """CLI entry point for the insert trigger."""
+    import argparse
+    import signal
+    parser = argparse.ArgumentParser(description="Elevate job listings as they are inserted")
+    parser.add_argument("--mode", choices=["auto", "stream", "poll"], default="auto", help="Change stream or polling")
+    parser.add_argument("--batch-size", type=int, default=10, help="Most jobs elevated together")
+    parser.add_argument("--linger", type=float, default=2.0, help="Seconds to wait for a batch to fill")
+    parser.add_argument("--max-poll-interval", type=float, default=30.0, help="Idle polling backoff ceiling")
+    parser.add_argument("--poll-overlap", type=float, default=60.0, help="Seconds of inserts polled again")
+    parser.add_argument("--max-concurrent", type=int, default=8, help="Concurrency ceiling for the adaptive limiter")
+    parser.add_argument("--job-titles", nargs="+", help="Specific job titles to process")
+    parser.add_argument("--candidates", type=int, default=1, help="Parallel extraction candidates in the first round")
+    parser.add_argument("--catch-up", action="store_true", help="Elevate already pending jobs before following inserts")
+    add_diagnostics_arguments(parser)
+    args = parser.parse_args()
+
+    setup_logging()
+    # Deferred so `--help` and argument errors don't pay for the workflow imports
+    from backend.workflows.elevate_job_descriptions import JobElevationWorkflow
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    async with mongodb, LoopDiagnostics.from_args("elevation_trigger", args):
+        workflow = JobElevationWorkflow(
+            batch_size=args.batch_size, max_concurrent=args.max_concurrent, num_candidates=args.candidates
+        )
+        await workflow.initialize()
+        trigger = ElevationTrigger(
+            workflow,
+            await get_trigger_state_collection(),
+            batch_size=args.batch_size,
+            linger=args.linger,
+            max_poll_interval=args.max_poll_interval,
+            poll_overlap=args.poll_overlap,
+            job_titles=args.job_titles,
+            mode=args.mode
+        )
+        if args.catch_up:
+            await trigger.catch_up()
+        await trigger.run(stop)
+    logger.info("Elevation trigger stopped", metadata=trigger.stats)
+
+if __name__ == "__main__":
+    asyncio.run(main())
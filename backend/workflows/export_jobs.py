@@ -0,0 +1,331 @@
+"""
+Streaming columnar export of `job_listings` and `elevated_jobs` to Parquet.
+Documents are read through batched cursors that project only the exported
+fields, flattened into columns derived from the Pydantic models
+(`structured_job.role_summary.title` -> `role_summary__title`) and written as
+Arrow record batches into hive-partitioned Parquet files:
+
+    <export dir>/<collection>/fetch_date=2024-10-01/title_family=ml-engineer/part-<run>-<n>.parquet
+
+The partition is the stored canonical `title_family` (`backend.utils.titles`);
+documents whose title names no family go to `title_family=unknown`, and the
+`title_family` column holds the same value as the partition.
+
+At most `batch_size` rows are buffered, so memory stays flat regardless of
+collection size. Each run appends new part files for documents changed since
+the previous run's watermark (`fetched_at` for listings, `created_at` for
+elevated jobs); a listing fetched again appears once per export, so readers
+keep the row with the latest `fetched_at` per `_id`.
+
+Usage:
+    python -m backend.workflows.export_jobs [--collection job_listings|elevated_jobs] [--output DIR] [--full]
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union, get_args, get_origin
+from collections import OrderedDict
+from datetime import date, datetime, UTC
+from pathlib import Path
+import json
+import os
+import uuid
+from pydantic import BaseModel
+
+from backend.database import get_jobs_collection_sync, get_elevated_jobs_collection_sync
+from backend.database.raw_store import with_raw_bodies
+from backend.models.jobs_search_models import JobListing
+from backend.models.job_description_models import JobDescription
+from backend.logging_config import get_logger, setup_logging
+
+logger = get_logger()
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# (column, dotted path, kind); kinds map onto Arrow types in `arrow_schema`
+Column = Tuple[str, str, str]
+
+# Partition of documents without a title family
+UNKNOWN_FAMILY = "unknown"
+
+
+def model_columns(model: Type[BaseModel], path: str = "", prefix: str = "") -> List[Column]:
+    """
+    Flatten a Pydantic model into leaf columns: nested models are expanded,
+    lists of strings stay lists and lists of models are kept as JSON text.
+    """
+    columns = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) is Union:
+            annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+        field_path = f"{path}.{name}" if path else name
+        column = f"{prefix}__{name}" if prefix else name
+
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            columns.extend(model_columns(annotation, field_path, column))
+        elif get_origin(annotation) in (list, List):
+            (item,) = get_args(annotation) or (str,)
+            kind = "json" if isinstance(item, type) and issubclass(item, BaseModel) else "list"
+            columns.append((column, field_path, kind))
+        else:
+            kinds = {bool: "bool", int: "int", float: "float", datetime: "timestamp"}
+            columns.append((column, field_path, kinds.get(annotation, "string")))
+    return columns
+
+
+NORMALIZED_COLUMNS: List[Column] = [
+    ("salary_min", "salary_min", "float"),
+    ("salary_max", "salary_max", "float"),
+    ("salary_currency", "salary_currency", "string"),
+    ("salary_period", "salary_period", "string"),
+    ("posted_date", "posted_date", "timestamp"),
+    ("is_remote", "is_remote", "bool"),
+    ("skills", "skills", "list"),
+    ("title_family", "title_family", "string"),
+    ("title_seniority", "title_seniority", "string"),
+]
+
+COLLECTIONS: Dict[str, Dict[str, Any]] = {
+    "job_listings": {
+        "columns": [
+            ("_id", "_id", "string"),
+            *model_columns(JobListing),
+            ("search_query", "search_query", "string"),
+            ("search_location", "search_location", "string"),
+            ("fetched_at", "fetched_at", "timestamp"),
+            ("fingerprint", "fingerprint", "string"),
+            ("extracted", "extracted", "bool"),
+            ("elevation_status", "elevation_status", "string"),
+            *NORMALIZED_COLUMNS,
+        ],
+        "watermark_field": "fetched_at",
+    },
+    "elevated_jobs": {
+        "columns": [
+            ("_id", "_id", "string"),
+            ("original_job_id", "original_job_id", "string"),
+            ("created_at", "created_at", "timestamp"),
+            *model_columns(JobDescription, "structured_job"),
+            ("quality_score", "grader_output.overall_quality_score", "float"),
+            *NORMALIZED_COLUMNS,
+            ("unmatched_tools", "unmatched_tools", "list"),
+        ],
+        "watermark_field": "created_at",
+    },
+}
+
+
+def export_dir() -> Path:
+    """Export root (EXPORT_DIR, default backend/data/exports)."""
+    return Path(os.getenv("EXPORT_DIR", PROJECT_ROOT / "backend" / "data" / "exports"))
+
+
+def _lookup(document: Dict, path: str) -> Any:
+    value = document
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def flatten_document(document: Dict, columns: List[Column]) -> Dict[str, Any]:
+    """One export row: leaf values coerced to their column kind."""
+    row = {}
+    for column, path, kind in columns:
+        value = _lookup(document, path)
+        if value is None:
+            row[column] = None
+        elif kind == "list":
+            row[column] = [str(item) for item in value] if isinstance(value, list) else [str(value)]
+        elif kind == "json":
+            row[column] = json.dumps(value, default=str)
+        elif kind == "timestamp":
+            row[column] = value if isinstance(value, datetime) else None
+        elif kind == "float":
+            row[column] = float(value) if isinstance(value, (int, float)) else None
+        elif kind == "int":
+            row[column] = int(value) if isinstance(value, (int, float)) else None
+        elif kind == "bool":
+            row[column] = bool(value)
+        else:
+            row[column] = str(value)
+    return row
+
+
+def partition_of(row: Dict[str, Any], date_column: str) -> Tuple[str, str]:
+    """
+    (fetch date, title family) partition values of a row. A row without a
+    stored family is moved to the "unknown" family, column included.
+    """
+    timestamp = row.get(date_column)
+    day = timestamp.date().isoformat() if isinstance(timestamp, (datetime, date)) else "unknown"
+    row["title_family"] = row.get("title_family") or UNKNOWN_FAMILY
+    return day, row["title_family"]
+
+
+def projection_for(columns: List[Column]) -> Dict[str, int]:
+    return {path: 1 for _, path, _ in columns}
+
+
+def arrow_schema(columns: List[Column]):
+    """Arrow schema for the flattened columns."""
+    import pyarrow as pa
+
+    types = {
+        "string": pa.string(),
+        "json": pa.string(),
+        "list": pa.list_(pa.string()),
+        "float": pa.float64(),
+        "int": pa.int64(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("ms", tz="UTC"),
+    }
+    return pa.schema([(column, types[kind]) for column, _, kind in columns])
+
+
+class PartitionedParquetWriter:
+    """
+    Buffers rows per partition and writes them as record batches, keeping at
+    most `max_open_files` Parquet writers open (least recently used are closed).
+    """
+
+    def __init__(self, root: Path, columns: List[Column], batch_size: int = 5_000, max_open_files: int = 64):
+        self.root = root
+        self.columns = columns
+        self.schema = arrow_schema(columns)
+        self.batch_size = batch_size
+        self.max_open_files = max_open_files
+        self.run_id = f"{datetime.now(UTC):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        self.buffers: Dict[Tuple[str, str], List[Dict]] = {}
+        self.buffered = 0
+        self.writers: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self.files_written = 0
+        self.rows_written = 0
+
+    def add(self, partition: Tuple[str, str], row: Dict[str, Any]):
+        self.buffers.setdefault(partition, []).append(row)
+        self.buffered += 1
+        if self.buffered >= self.batch_size:
+            self.flush()
+
+    def _writer(self, partition: Tuple[str, str]):
+        import pyarrow.parquet as pq
+
+        if partition in self.writers:
+            self.writers.move_to_end(partition)
+            return self.writers[partition]
+        if len(self.writers) >= self.max_open_files:
+            _, oldest = self.writers.popitem(last=False)
+            oldest.close()
+        day, family = partition
+        directory = self.root / f"fetch_date={day}" / f"title_family={family}"
+        directory.mkdir(parents=True, exist_ok=True)
+        self.files_written += 1
+        writer = pq.ParquetWriter(
+            directory / f"part-{self.run_id}-{self.files_written:05d}.parquet", self.schema, compression="zstd"
+        )
+        self.writers[partition] = writer
+        return writer
+
+    def flush(self):
+        import pyarrow as pa
+
+        for partition, rows in self.buffers.items():
+            batch = pa.RecordBatch.from_pylist(rows, schema=self.schema)
+            self._writer(partition).write_batch(batch)
+            self.rows_written += len(rows)
+        self.buffers = {}
+        self.buffered = 0
+
+    def close(self):
+        self.flush()
+        for writer in self.writers.values():
+            writer.close()
+        self.writers.clear()
+
+
+def _read_watermarks(root: Path) -> Dict[str, str]:
+    path = root / "_watermarks.json"
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def _write_watermark(root: Path, collection: str, watermark: datetime):
+    watermarks = _read_watermarks(root)
+    watermarks[collection] = watermark.isoformat()
+    temporary = root / "_watermarks.json.tmp"
+    temporary.write_text(json.dumps(watermarks, indent=2))
+    temporary.replace(root / "_watermarks.json")
+
+
+def export_collection(
+    collection: str,
+    output: Optional[Path] = None,
+    full: bool = False,
+    batch_size: int = 5_000,
+    documents: Optional[Iterable[Dict]] = None
+) -> int:
+    """
+    Export one collection, appending documents changed since the last watermark.
+
+    Args:
+        collection: `job_listings` or `elevated_jobs`
+        output: Export root (defaults to `export_dir()`)
+        full: Ignore the watermark and export every document
+        batch_size: Cursor batch size and rows buffered before writing
+        documents: Documents to export instead of querying MongoDB
+
+    Returns:
+        int: Number of rows written
+    """
+    spec = COLLECTIONS[collection]
+    root = Path(output or export_dir())
+    root.mkdir(parents=True, exist_ok=True)
+    field = spec["watermark_field"]
+    started = datetime.now(UTC)
+
+    if documents is None:
+        source = get_jobs_collection_sync() if collection == "job_listings" else get_elevated_jobs_collection_sync()
+        query = {field: {"$lte": started}}
+        previous = None if full else _read_watermarks(root).get(collection)
+        if previous:
+            query[field]["$gt"] = datetime.fromisoformat(previous)
+        documents = source.find(query, projection_for(spec["columns"]), batch_size=batch_size)
+        if collection == "job_listings":
+            documents = with_raw_bodies(documents, batch_size=batch_size)
+
+    writer = PartitionedParquetWriter(root / collection, spec["columns"], batch_size)
+    try:
+        for document in documents:
+            row = flatten_document(document, spec["columns"])
+            writer.add(partition_of(row, field), row)
+    finally:
+        writer.close()
+
+    # Documents written after `started` are picked up by the next run
+    _write_watermark(root, collection, started)
+    logger.info(f"Exported {collection}", metadata={
+        "rows": writer.rows_written, "files": writer.files_written, "full": full
+    })
+    return writer.rows_written
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point for the Parquet export."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export jobs to partitioned Parquet")
+    parser.add_argument("--collection", choices=list(COLLECTIONS), help="Collection (default: both)")
+    parser.add_argument("--output", type=Path, help="Export directory (default: EXPORT_DIR or backend/data/exports)")
+    parser.add_argument("--full", action="store_true", help="Ignore the watermark and export everything")
+    parser.add_argument("--batch-size", type=int, default=5_000, help="Rows per cursor batch and record batch")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    for collection in [args.collection] if args.collection else list(COLLECTIONS):
+        export_collection(collection, args.output, args.full, args.batch_size)
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
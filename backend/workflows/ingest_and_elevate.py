@@ -0,0 +1,217 @@
+"""
+Combined ingest -> elevate pipeline.
+
+Search workers hand each parsed page to two in-memory stages instead of
+writing it to MongoDB and leaving a later elevation run to scan, read back
+and convert the listings:
+
+- a background persister writes the page (one bulk write per page, in a
+  thread) and resolves a future per listing with its new `_id`, or None if
+  the listing was already stored;
+- elevation workers take listing dicts from a bounded queue, wait for the
+  page write and extract only the listings it inserted. Already stored
+  listings are skipped before they take a limiter slot or an LLM call.
+
+Both queues are bounded, so searching slows to the pace of elevation and
+persistence (backpressure) instead of buffering without limit. The summary
+reports fetch -> elevated latency percentiles and queue waits, also recorded
+as the `pipeline.fetch_to_elevated` histogram.
+
+Run it instead of, not alongside, the insert trigger (`elevation_trigger`),
+which would pick up the same new listings.
+
+Usage:
+    python -m backend.workflows.ingest_and_elevate [--job-titles ...] [--locations ...] [--queue-size N]
+"""
+
+from typing import Dict, List, Optional
+import asyncio
+import time
+
+from backend.database import mongodb
+from backend.utils.job_search import persist_job_results, prepare_job_documents
+from backend.utils.concurrency import classify_error
+from backend.utils.loop_diagnostics import LoopDiagnostics, add_diagnostics_arguments
+from backend.models.jobs_search_models import JobSearchResponse
+from backend.workflows.jobs_to_mongo import JOB_TITLES, JOB_LOCATIONS, process_job_searches
+from backend.logging_config import get_logger, setup_logging
+
+logger = get_logger()
+
+
+class IngestElevatePipeline:
+    """
+    Bounded in-memory hand-off from job searches to `JobElevationWorkflow`.
+
+    Args:
+        workflow: Initialized elevation workflow; its adaptive limiter bounds extraction concurrency
+        queue_size: Listings waiting for an elevation worker before searches block
+        persist_queue_size: Pages waiting to be written before searches block
+    """
+
+    def __init__(self, workflow, queue_size: int = 32, persist_queue_size: int = 8):
+        self.workflow = workflow
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.persist_queue: asyncio.Queue = asyncio.Queue(maxsize=persist_queue_size)
+        self.stats = {"fetched": 0, "new": 0, "known": 0, "successful": 0, "failed": 0, "max_queue_depth": 0}
+        self.latencies: List[float] = []
+        self.queue_waits: List[float] = []
+        self._latency_histogram = logger.metric_histogram(
+            "pipeline.fetch_to_elevated",
+            unit="s",
+            description="Seconds from fetching a listing to saving its elevated job"
+        )
+
+    async def enqueue(self, parsed_response: JobSearchResponse) -> bool:
+        """
+        Search stage handler: queue a parsed page for writing and its listings
+        for elevation. Waits while either queue is full.
+        """
+        fetched = time.perf_counter()
+        # Skill tagging and title canonicalization are CPU work; keep them off the loop
+        job_dicts = await asyncio.to_thread(prepare_job_documents, parsed_response)
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in job_dicts]
+        await self.persist_queue.put((parsed_response, job_dicts, futures))
+        for job_dict, future in zip(job_dicts, futures):
+            await self.queue.put((job_dict, future, fetched, time.perf_counter()))
+            self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], self.queue.qsize())
+        self.stats["fetched"] += len(job_dicts)
+        return True
+
+    async def persist(self):
+        """Write queued pages and resolve each listing's future with its new ID."""
+        while True:
+            parsed_response, job_dicts, futures = await self.persist_queue.get()
+            try:
+                new_jobs = await asyncio.to_thread(persist_job_results, parsed_response, job_dicts)
+                for position, future in enumerate(futures):
+                    future.set_result(new_jobs.get(position))
+            except Exception as e:
+                logger.error(f"Error storing data in MongoDB: {str(e)}")
+                for future in futures:
+                    future.set_exception(e)
+            finally:
+                self.persist_queue.task_done()
+
+    async def elevate(self):
+        """Elevation worker: extract newly stored listings under the workflow's adaptive limiter."""
+        while True:
+            job_dict, persisted, fetched, enqueued = await self.queue.get()
+            self.queue_waits.append(time.perf_counter() - enqueued)
+            try:
+                try:
+                    job_id = await persisted
+                except Exception:
+                    # Logged by the persister; the listing is fetched again by a later search
+                    self.stats["failed"] += 1
+                    continue
+                if job_id is None:
+                    self.stats["known"] += 1
+                    continue
+                self.stats["new"] += 1
+                async with self.workflow.limiter.slot() as slot:
+                    result = await self.workflow.process_job(job_id, job_dict)
+                    slot.units = max(result.attempts, 1)
+                    if result.status == "completed":
+                        latency = time.perf_counter() - fetched
+                        self.latencies.append(latency)
+                        self._latency_histogram.record(latency)
+                        self.stats["successful"] += 1
+                    else:
+                        slot.outcome = classify_error(result.error_message)
+                        self.stats["failed"] += 1
+            finally:
+                self.queue.task_done()
+
+    async def run(
+        self,
+        job_titles: List[str],
+        job_locations: List[str],
+        max_concurrent_searches: int = 8,
+        calls_per_minute: int = 30,
+        max_retries: int = 3,
+        max_search_level: int = 2
+    ) -> Dict:
+        """Search, persist and elevate until every fetched listing has been handled."""
+        started = time.perf_counter()
+        persister = asyncio.create_task(self.persist())
+        workers = [asyncio.create_task(self.elevate()) for _ in range(self.workflow.max_concurrent)]
+        try:
+            successful, failed = await process_job_searches(
+                job_titles,
+                job_locations,
+                max_concurrent=max_concurrent_searches,
+                calls_per_minute=calls_per_minute,
+                max_retries=max_retries,
+                max_search_level=max_search_level,
+                store=self.enqueue
+            )
+            await self.persist_queue.join()
+            await self.queue.join()
+        finally:
+            for task in [persister, *workers]:
+                task.cancel()
+            await asyncio.gather(persister, *workers, return_exceptions=True)
+
+        await self.workflow.flush_vectors()
+        summary = {
+            **self.stats,
+            "searches_successful": successful,
+            "searches_failed": failed,
+            "wall_time_s": round(time.perf_counter() - started, 2),
+            **self._summarize("fetch_to_elevated", self.latencies),
+            **self._summarize("queue_wait", self.queue_waits),
+        }
+        logger.info("Pipeline summary", metadata=summary)
+        return summary
+
+    @staticmethod
+    def _summarize(name: str, values: List[float]) -> Dict[str, float]:
+        if not values:
+            return {}
+        ordered = sorted(values)
+
+        def percentile(q: float) -> float:
+            return round(ordered[min(int(q * len(ordered)), len(ordered) - 1)], 2)
+
+        return {
+            f"{name}_p50_s": percentile(0.5),
+            f"{name}_p95_s": percentile(0.95),
+            f"{name}_max_s": round(ordered[-1], 2),
+        }
+
+
+async def main(argv: Optional[List[str]] = None):
+    """CLI entry point for the combined pipeline."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Search for jobs and elevate new listings in one process")
+    parser.add_argument("--job-titles", nargs="+", default=JOB_TITLES, help="Job titles to search")
+    parser.add_argument("--locations", nargs="+", default=JOB_LOCATIONS, help="Locations to search")
+    parser.add_argument("--max-concurrent-searches", type=int, default=8, help="Concurrency ceiling for searches")
+    parser.add_argument("--calls-per-minute", type=int, default=30, help="Search API rate limit")
+    parser.add_argument("--max-search-level", type=int, default=2, help="Result pages fetched per search")
+    parser.add_argument("--max-concurrent", type=int, default=8, help="Concurrency ceiling for elevation")
+    parser.add_argument("--queue-size", type=int, default=32, help="Listings buffered ahead of elevation")
+    parser.add_argument("--candidates", type=int, default=1, help="Parallel extraction candidates in the first round")
+    add_diagnostics_arguments(parser)
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    # Deferred so `--help` and argument errors don't pay for the workflow imports
+    from backend.workflows.elevate_job_descriptions import JobElevationWorkflow
+
+    async with mongodb, LoopDiagnostics.from_args("ingest_and_elevate", args):
+        workflow = JobElevationWorkflow(max_concurrent=args.max_concurrent, num_candidates=args.candidates)
+        await workflow.initialize()
+        pipeline = IngestElevatePipeline(workflow, queue_size=args.queue_size)
+        await pipeline.run(
+            args.job_titles,
+            args.locations,
+            max_concurrent_searches=args.max_concurrent_searches,
+            calls_per_minute=args.calls_per_minute,
+            max_search_level=args.max_search_level
+        )
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,111 @@
+"""
+Backfill the normalized salary / posting date / remote / location fields on
+documents stored before normalization ran at ingest and elevation time.
+
+Usage:
+    python -m backend.workflows.normalize_jobs [--batch-size N] [--force]
+"""
+
+from typing import Dict, List
+import asyncio
+
+from backend.database import mongodb, get_jobs_collection, get_elevated_jobs_collection
+from backend.database.repositories import get_job_listings_repository, get_elevated_jobs_repository
+from backend.utils.geocoding import get_gazetteer
+from backend.utils.normalization import normalize_job_listing, normalize_elevated_job
+from backend.logging_config import get_logger, setup_logging
+
+logger = get_logger()
+
+RAW_PROJECTION = {"detected_extensions": 1, "extensions": 1, "location": 1, "search_location": 1, "fetched_at": 1}
+# The newest normalized field; documents without it predate at least part of the normalization
+PENDING_QUERY = {"location_geo": {"$exists": False}}
+
+async def _flush(collection, updates: List) -> int:
+    if not updates:
+        return 0
+    result = await collection.bulk_write(updates, ordered=False)
+    return result.modified_count
+
+async def normalize_job_listings(batch_size: int = 500, force: bool = False) -> int:
+    """
+    Add normalized fields to job listings.
+
+    Args:
+        batch_size: Updates per bulk write
+        force: Recompute fields that are already present
+
+    Returns:
+        int: Number of listings updated
+    """
+    from pymongo import UpdateOne
+
+    jobs = await get_jobs_collection()
+    query = {} if force else PENDING_QUERY
+    updates, updated = [], 0
+    async for job in jobs.find(query, RAW_PROJECTION):
+        updates.append(UpdateOne({"_id": job["_id"]}, {"$set": normalize_job_listing(job)}))
+        if len(updates) >= batch_size:
+            updated += await _flush(jobs, updates)
+            updates = []
+    updated += await _flush(jobs, updates)
+    logger.info(f"Normalized {updated} job listings")
+    return updated
+
+async def normalize_elevated_jobs(batch_size: int = 500, force: bool = False) -> int:
+    """
+    Add normalized fields to elevated jobs, using their original listings as fallback.
+
+    Returns:
+        int: Number of elevated jobs updated
+    """
+    from bson import ObjectId
+    from pymongo import UpdateOne
+
+    jobs = await get_jobs_collection()
+    elevated_jobs = await get_elevated_jobs_collection()
+    query = {} if force else PENDING_QUERY
+    updated = 0
+
+    async def process(batch: List[Dict]) -> int:
+        ids = [ObjectId(doc["original_job_id"]) for doc in batch if ObjectId.is_valid(doc.get("original_job_id"))]
+        raw_jobs = {str(job["_id"]): job async for job in jobs.find({"_id": {"$in": ids}}, RAW_PROJECTION)}
+        updates = [
+            UpdateOne(
+                {"_id": doc["_id"]},
+                {"$set": normalize_elevated_job(doc.get("structured_job") or {}, raw_jobs.get(doc.get("original_job_id"), {}))}
+            )
+            for doc in batch
+        ]
+        return await _flush(elevated_jobs, updates)
+
+    batch = []
+    async for doc in elevated_jobs.find(query, {"structured_job": 1, "original_job_id": 1}):
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            updated += await process(batch)
+            batch = []
+    if batch:
+        updated += await process(batch)
+    logger.info(f"Normalized {updated} elevated jobs")
+    return updated
+
+async def main():
+    """CLI entry point for the normalization backfill."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Backfill normalized salary, posting date, remote and location fields")
+    parser.add_argument("--batch-size", type=int, default=500, help="Updates per bulk write")
+    parser.add_argument("--force", action="store_true", help="Recompute fields that are already present")
+    args = parser.parse_args()
+
+    setup_logging()
+    async with mongodb:
+        await (await get_job_listings_repository()).ensure_indexes()
+        await (await get_elevated_jobs_repository()).ensure_indexes()
+        await normalize_job_listings(args.batch_size, args.force)
+        await normalize_elevated_jobs(args.batch_size, args.force)
+    cache = get_gazetteer().cache_info()
+    logger.info("Geocoding cache", metadata={"hits": cache.hits, "misses": cache.misses, "size": cache.currsize})
+
+if __name__ == "__main__":
+    asyncio.run(main())
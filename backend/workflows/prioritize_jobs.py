@@ -0,0 +1,39 @@
+"""
+Score the elevation backlog and show what runs next.
+Ingest marks new listings as due and the elevation workflow scores due jobs
+(and listings stored before they were marked) before its batches, at most
+once a minute; run this with `--rescore` after editing the priority weights.
+
+Usage:
+    python -m backend.workflows.prioritize_jobs [--rescore] [--show N]
+"""
+
+import asyncio
+
+from backend.database import mongodb
+from backend.database.repositories import get_job_listings_repository
+from backend.utils.priority import get_priority_policy
+from backend.logging_config import get_logger, setup_logging
+
+logger = get_logger()
+
+async def main():
+    """CLI entry point for backlog prioritization."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Prioritize the elevation backlog")
+    parser.add_argument("--rescore", action="store_true", help="Recompute existing priority keys")
+    parser.add_argument("--show", type=int, default=0, help="Print the next N jobs in priority order")
+    args = parser.parse_args()
+
+    setup_logging()
+    async with mongodb:
+        jobs = await get_job_listings_repository()
+        await jobs.ensure_indexes()
+        scored = await jobs.assign_priorities(get_priority_policy(), limit=0, rescore=args.rescore)
+        logger.info("Prioritized pending jobs", metadata={"scored": scored, "rescore": args.rescore})
+        if args.show:
+            for job in await jobs.find_pending(args.show):
+                print(f"{job['priority_key']:12.1f}  {job.get('title')}  @ {job.get('company_name')}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,32 @@
+"""
+Rebuild the analytics rollups from all elevated jobs.
+Use after backfills or when incremental updates were missed.
+
+Usage:
+    python -m backend.workflows.rebuild_rollups [--batch-size N]
+"""
+
+import asyncio
+
+from backend.database import mongodb
+from backend.database.rollups import get_rollups_repository
+from backend.logging_config import get_logger, setup_logging
+
+logger = get_logger()
+
+async def main():
+    """CLI entry point for the rollup rebuild."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Rebuild job analytics rollups")
+    parser.add_argument("--batch-size", type=int, default=500, help="Elevated jobs per location lookup")
+    args = parser.parse_args()
+
+    setup_logging()
+    async with mongodb:
+        rollups = await get_rollups_repository()
+        await rollups.ensure_indexes()
+        processed = await rollups.rebuild(batch_size=args.batch_size)
+    logger.info("Rollup rebuild complete", metadata={"jobs": processed})
+
+if __name__ == "__main__":
+    asyncio.run(main())
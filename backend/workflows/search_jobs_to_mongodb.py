@@ -3,20 +3,21 @@ Workflow for fetching job listings and storing them in MongoDB.
 Handles batch processing of multiple job searches with rate limiting.
 """
 
-from typing import List, Tuple, Optional, Dict
+from typing import Awaitable, Callable, List, Tuple, Optional, Dict
 from backend.utils.job_search import fetch_and_parse_jobs, store_job_results
-from logfire import Logfire
+from backend.models.jobs_search_models import JobSearchResponse
+from backend.utils.concurrency import AdaptiveConcurrencyLimiter, classify_error
+from backend.utils.loop_diagnostics import LoopDiagnostics, add_diagnostics_arguments
+from backend.logging_config import get_logger, setup_logging
 import asyncio
-import aiohttp
 import time
 from datetime import datetime, UTC
 import random
 from itertools import product
-from tqdm.asyncio import tqdm
 from tqdm import tqdm as tqdm_sync
 
 # Initialize logging
-logger = Logfire()
+logger = get_logger()
 
 # Job search configurations
 JOB_TITLES: List[str] = [
@@ -54,7 +55,8 @@ async def process_search(
     location: str,
     rate_limiter: RateLimiter,
     max_retries: int = 3,
-    max_search_level: int = 2  # Add max search level parameter
+    max_search_level: int = 2,  # Add max search level parameter
+    store: Optional[Callable[[JobSearchResponse], Awaitable[bool]]] = None
 ) -> bool:
     """
     Process a single job search asynchronously with pagination
@@ -65,31 +67,40 @@ async def process_search(
         rate_limiter: Rate limiter instance
         max_retries: Maximum number of retry attempts
         max_search_level: Maximum pagination level to fetch
+        store: Async handler for each parsed page (default: write it to MongoDB)
+    
+    Raises:
+        Exception: The last error when the final attempt failed with one (e.g. a
+            SearchAPI 429), so the caller can classify it for the concurrency limiter
     """
     retries = 0
     current_level = 1
     next_token = None
+    last_error: Optional[Exception] = None
     
     while retries < max_retries and current_level <= max_search_level:
         try:
             await rate_limiter.wait()
             logger.info(f"Searching for {job_title} in {location} (Level {current_level})")
             
-            parsed_result = fetch_and_parse_jobs(
+            # The search request and the default MongoDB write are blocking; keep them off the event loop
+            parsed_result = await asyncio.to_thread(
+                fetch_and_parse_jobs,
                 job_title=job_title,
                 job_location=location,
                 next_page_token=next_token,
                 search_level=current_level
             )
             
-            if parsed_result and store_job_results(parsed_result):
+            if parsed_result and (
+                await store(parsed_result) if store else await asyncio.to_thread(store_job_results, parsed_result)
+            ):
                 logger.info(f"Successfully stored {len(parsed_result.jobs)} jobs for {job_title} in {location} (Level {current_level})")
                 
-                # Check if we have more pages and should continue
-                if (parsed_result.pagination and 
-                    parsed_result.pagination.next_page_token and 
-                    current_level < max_search_level):
-                    next_token = parsed_result.pagination.next_page_token
+                # Check if we have more pages and should continue (token kept by parse_job_response)
+                page_token = getattr(parsed_result, '_next_page_token', None)
+                if page_token and current_level < max_search_level:
+                    next_token = page_token
                     current_level += 1
                     # Reset retries for next page
                     retries = 0
@@ -99,6 +110,7 @@ async def process_search(
                 
                 return True
                 
+            last_error = None
             retries += 1
             if retries < max_retries:
                 delay = random.uniform(1, 3)
@@ -106,24 +118,38 @@ async def process_search(
                 
         except Exception as e:
             logger.error(f"Error processing search for {job_title} in {location} (Level {current_level}): {str(e)}")
+            last_error = e
             retries += 1
             if retries < max_retries:
                 await asyncio.sleep(2 ** retries)  # Exponential backoff
     
     logger.error(f"Failed to process search for {job_title} in {location} after {max_retries} attempts")
+    if last_error is not None:
+        raise last_error
     return False
 
 async def process_job_searches(
     job_titles: List[str],
     job_locations: List[str],
-    max_concurrent: int = 3,
+    max_concurrent: int = 8,
     calls_per_minute: int = 30,
     max_retries: int = 3,
-    max_search_level: int = 2  # Add max search level parameter
+    max_search_level: int = 2,  # Add max search level parameter
+    min_concurrent: int = 1,
+    store: Optional[Callable[[JobSearchResponse], Awaitable[bool]]] = None
 ) -> Tuple[int, int]:
-    """Process job searches asynchronously with rate limiting and progress bar"""
+    """
+    Process job searches asynchronously with rate limiting and progress bar.
+    Concurrency adapts between min_concurrent and max_concurrent (AIMD).
+    Parsed pages go to `store` instead of MongoDB when it is given.
+    """
     rate_limiter = RateLimiter(calls_per_minute)
-    semaphore = asyncio.Semaphore(max_concurrent)
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=3,
+        min_limit=min_concurrent,
+        max_limit=max_concurrent,
+        metric_name="search.concurrency_limit"
+    )
     successful = 0
     failed = 0
     
@@ -140,18 +166,28 @@ async def process_job_searches(
     )
     
     async def bounded_search(job_title: str, location: str) -> None:
-        """Execute search with semaphore bound and update progress"""
+        """Execute search under the adaptive limiter and update progress"""
         nonlocal successful, failed
-        async with semaphore:
-            if await process_search(job_title, location, rate_limiter, max_retries, max_search_level):
+        async with limiter.slot() as slot:
+            error = None
+            try:
+                found = await process_search(job_title, location, rate_limiter, max_retries, max_search_level, store)
+            except Exception as e:
+                found, error = False, e
+            if found:
                 successful += 1
             else:
+                # SearchAPI 429s and timeouts are "throttled" and cut the limit multiplicatively
+                slot.outcome = classify_error(error) if error is not None else "error"
                 failed += 1
             pbar.update(1)
+            # Redrawn at tqdm's `mininterval` rather than on every update
             pbar.set_postfix(
                 successful=successful,
                 failed=failed,
-                current=f"{job_title} in {location}"
+                concurrency=limiter.limit,
+                current=f"{job_title} in {location}",
+                refresh=False
             )
     
     try:
@@ -170,16 +206,19 @@ async def process_job_searches(
     logger.info(f"Job search batch processing completed at {datetime.now(UTC)}")
     logger.info(f"Successful searches: {successful}")
     logger.info(f"Failed searches: {failed}")
+    logger.info("Search concurrency summary", metadata=limiter.snapshot())
     
     return successful, failed
 
 def run_job_search_workflow(
     job_titles: Optional[List[str]] = None,
     job_locations: Optional[List[str]] = None,
-    max_concurrent: int = 3,
+    max_concurrent: int = 8,
     calls_per_minute: int = 30,
     max_retries: int = 3,
-    max_search_level: int = 2  # Add max search level parameter
+    max_search_level: int = 2,  # Add max search level parameter
+    min_concurrent: int = 1,
+    diagnostics: Optional[LoopDiagnostics] = None
 ) -> None:
     """
     Run the job search workflow
@@ -187,28 +226,43 @@ def run_job_search_workflow(
     Args:
         job_titles: Optional custom list of job titles
         job_locations: Optional custom list of locations
-        max_concurrent: Maximum number of concurrent requests
+        max_concurrent: Concurrency ceiling for the adaptive limiter
         calls_per_minute: Maximum API calls per minute
         max_retries: Maximum retry attempts per search
         max_search_level: Maximum pagination level to fetch (default: 2)
+        min_concurrent: Concurrency floor for the adaptive limiter
+        diagnostics: Event-loop lag monitor and profiler for the run (default: from LOOP_DIAGNOSTICS)
     """
+    setup_logging()
     titles = job_titles if job_titles is not None else JOB_TITLES
     locations = job_locations if job_locations is not None else JOB_LOCATIONS
+    diagnostics = diagnostics or LoopDiagnostics.from_env("job_search")
     
-    asyncio.run(process_job_searches(
-        titles,
-        locations,
-        max_concurrent=max_concurrent,
-        calls_per_minute=calls_per_minute,
-        max_retries=max_retries,
-        max_search_level=max_search_level
-    ))
+    async def run():
+        async with diagnostics:
+            await process_job_searches(
+                titles,
+                locations,
+                max_concurrent=max_concurrent,
+                calls_per_minute=calls_per_minute,
+                max_retries=max_retries,
+                max_search_level=max_search_level,
+                min_concurrent=min_concurrent
+            )
+    
+    asyncio.run(run())
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Search for jobs and store the listings in MongoDB")
+    add_diagnostics_arguments(parser)
+    args = parser.parse_args()
+    
     # Test the workflow
     run_job_search_workflow(
-        max_concurrent=3,  # Maximum concurrent requests
+        max_concurrent=8,  # Concurrency ceiling (adaptive)
         calls_per_minute=30,  # Rate limit
         max_retries=3,  # Maximum retries per search
-        max_search_level=2  # Maximum pagination level to fetch
+        max_search_level=2,  # Maximum pagination level to fetch
+        diagnostics=LoopDiagnostics.from_args("job_search", args)
     )
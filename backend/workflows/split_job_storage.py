@@ -0,0 +1,137 @@
+"""
+Move job listing bodies stored inline into the compressed `job_listings_raw`
+collection, prune bodies no listing references any more, and report how much
+smaller the hot documents are.
+
+Usage:
+    python -m backend.workflows.split_job_storage migrate [--batch-size N]
+    python -m backend.workflows.split_job_storage prune [--batch-size N]
+    python -m backend.workflows.split_job_storage stats
+"""
+
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta, UTC
+
+from backend.database import get_jobs_collection_sync, get_raw_jobs_collection_sync
+from backend.database.raw_store import COLD_FIELDS, fingerprint, raw_document, split_listing
+from backend.logging_config import get_logger, setup_logging
+from backend.search.tokens import body_terms
+
+logger = get_logger()
+
+
+def migrate(batch_size: int = 500) -> int:
+    """
+    Split every listing that still carries its body inline. Bodies are written
+    before the listing is slimmed, so an interrupted run can simply be restarted.
+
+    Returns:
+        int: Number of listings migrated
+    """
+    from pymongo import UpdateOne
+
+    jobs = get_jobs_collection_sync()
+    raw = get_raw_jobs_collection_sync()
+    legacy = {"fingerprint": {"$exists": False}, "$or": [{field: {"$exists": True}} for field in COLD_FIELDS]}
+    projection = {field: 1 for field in COLD_FIELDS}
+    migrated = 0
+
+    def flush(batch: List[Dict]) -> int:
+        raw_operations, job_operations = {}, []
+        for job in batch:
+            _, body = split_listing(job)
+            job_fingerprint = fingerprint(body)
+            raw_operations.setdefault(job_fingerprint, UpdateOne(
+                {"_id": job_fingerprint}, {"$setOnInsert": raw_document(body)}, upsert=True
+            ))
+            job_operations.append(UpdateOne(
+                {"_id": job["_id"]},
+                {"$set": {"fingerprint": job_fingerprint, "search_terms": body_terms(body)},
+                 "$unset": {field: "" for field in body}}
+            ))
+        raw.bulk_write(list(raw_operations.values()), ordered=False)
+        return jobs.bulk_write(job_operations, ordered=False).modified_count
+
+    batch = []
+    for job in jobs.find(legacy, projection, batch_size=batch_size):
+        batch.append(job)
+        if len(batch) >= batch_size:
+            migrated += flush(batch)
+            batch = []
+    if batch:
+        migrated += flush(batch)
+    logger.info(f"Moved {migrated} job listing bodies to job_listings_raw")
+    return migrated
+
+
+def prune(batch_size: int = 1000, min_age: timedelta = timedelta(hours=1)) -> int:
+    """
+    Delete bodies that no listing references (left behind when a listing's
+    content changed on a later fetch). Bodies younger than `min_age` are kept:
+    ingest writes a body just before the listing that references it.
+
+    Returns:
+        int: Number of bodies deleted
+    """
+    jobs = get_jobs_collection_sync()
+    raw = get_raw_jobs_collection_sync()
+    deleted = 0
+
+    def flush(fingerprints: List[str]) -> int:
+        referenced = set(jobs.distinct("fingerprint", {"fingerprint": {"$in": fingerprints}}))
+        unreferenced = [value for value in fingerprints if value not in referenced]
+        return raw.delete_many({"_id": {"$in": unreferenced}}).deleted_count if unreferenced else 0
+
+    batch = []
+    cutoff = datetime.now(UTC) - min_age
+    for document in raw.find({"created_at": {"$lt": cutoff}}, {"_id": 1}, batch_size=batch_size):
+        batch.append(document["_id"])
+        if len(batch) >= batch_size:
+            deleted += flush(batch)
+            batch = []
+    if batch:
+        deleted += flush(batch)
+    logger.info(f"Pruned {deleted} unreferenced job listing bodies")
+    return deleted
+
+
+def stats() -> Dict:
+    """Document counts and average sizes of the hot and cold collections."""
+    collections = {"job_listings": get_jobs_collection_sync(), "job_listings_raw": get_raw_jobs_collection_sync()}
+    summary = {}
+    for name, collection in collections.items():
+        collection_stats = collection.database.command("collStats", name)
+        summary[name] = {
+            "count": collection_stats.get("count", 0),
+            "avg_document_bytes": collection_stats.get("avgObjSize", 0),
+            "storage_bytes": collection_stats.get("storageSize", 0),
+        }
+    summary["job_listings"]["inline_bodies"] = collections["job_listings"].count_documents(
+        {"fingerprint": {"$exists": False}}
+    )
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point for the hot/cold storage migration."""
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Split job listing bodies into compressed cold storage")
+    parser.add_argument("command", choices=["migrate", "prune", "stats"])
+    parser.add_argument("--batch-size", type=int, default=500, help="Documents per bulk write")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    if args.command == "migrate":
+        migrate(args.batch_size)
+    elif args.command == "prune":
+        prune(args.batch_size)
+    else:
+        print(json.dumps(stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+Backfill canonical skill tags on stored job listings and elevated jobs.
+Documents are read in batches by the main process and tagged in a process
+pool (one compiled taxonomy per worker); results are written back with
+unordered bulk updates while later batches are still being tagged.
+
+Usage:
+    python -m backend.workflows.tag_skills [--collection job_listings|elevated_jobs] [--workers N] [--batch-size N] [--force]
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import multiprocessing
+import os
+
+from backend.database import get_jobs_collection_sync, get_elevated_jobs_collection_sync
+from backend.database.raw_store import with_raw_bodies
+from backend.utils.skill_taxonomy import get_skill_taxonomy, tag_job_listing, tag_elevated_job
+from backend.logging_config import get_logger, setup_logging
+
+logger = get_logger()
+
+LISTING_PROJECTION = {"title": 1, "description": 1, "job_highlights": 1, "fingerprint": 1}
+
+
+def tag_listing_batch(jobs: List[Dict]) -> List[Tuple[object, Dict]]:
+    """Worker: skill fields for a batch of raw job listings."""
+    taxonomy = get_skill_taxonomy()
+    return [(job["_id"], tag_job_listing(job, taxonomy)) for job in jobs]
+
+
+def tag_elevated_batch(batch: List[Tuple[Dict, Dict]]) -> List[Tuple[object, Dict]]:
+    """Worker: skill fields for a batch of (elevated job, original listing) pairs."""
+    taxonomy = get_skill_taxonomy()
+    return [(doc["_id"], tag_elevated_job(doc.get("structured_job") or {}, raw, taxonomy)) for doc, raw in batch]
+
+
+def _batches(cursor: Iterable[Dict], size: int) -> Iterable[List[Dict]]:
+    batch = []
+    for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _with_listings(docs: List[Dict]) -> List[Tuple[Dict, Dict]]:
+    """Pair elevated jobs with the text fields of their original listings."""
+    from bson import ObjectId
+
+    ids = [ObjectId(doc["original_job_id"]) for doc in docs if ObjectId.is_valid(doc.get("original_job_id"))]
+    listings = {
+        str(job["_id"]): job
+        for job in with_raw_bodies(get_jobs_collection_sync().find({"_id": {"$in": ids}}, LISTING_PROJECTION))
+    }
+    return [(doc, listings.get(doc.get("original_job_id"), {})) for doc in docs]
+
+
+def backfill(
+    collection: str = "job_listings",
+    workers: Optional[int] = None,
+    batch_size: int = 500,
+    force: bool = False
+) -> int:
+    """
+    Tag every document in a collection that has no `skills` field yet.
+
+    Args:
+        collection: `job_listings` or `elevated_jobs`
+        workers: Worker processes (default: CPU count)
+        batch_size: Documents per worker task and per bulk write
+        force: Re-tag documents that already have skills
+
+    Returns:
+        int: Number of documents updated
+    """
+    from pymongo import UpdateOne
+
+    query = {} if force else {"skills": {"$exists": False}}
+    if collection == "job_listings":
+        target = get_jobs_collection_sync()
+        batches = _batches(with_raw_bodies(target.find(query, LISTING_PROJECTION), batch_size=batch_size), batch_size)
+        task = tag_listing_batch
+    else:
+        target = get_elevated_jobs_collection_sync()
+        cursor = target.find(query, {"structured_job.responsibilities_and_qualifications": 1, "original_job_id": 1})
+        batches = (_with_listings(batch) for batch in _batches(cursor, batch_size))
+        task = tag_elevated_batch
+
+    workers = workers or os.cpu_count() or 1
+    updated = 0
+
+    def write(results: List[Tuple[object, Dict]]) -> int:
+        if not results:
+            return 0
+        operations = [UpdateOne({"_id": _id}, {"$set": fields}) for _id, fields in results]
+        return target.bulk_write(operations, ordered=False).modified_count
+
+    # Spawned rather than forked: the parent holds a PyMongo client with background threads
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        in_flight = set()
+        for batch in batches:
+            # Bound the batches held in memory while workers catch up
+            if len(in_flight) >= 2 * workers:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    updated += write(future.result())
+            in_flight.add(pool.submit(task, batch))
+        for future in in_flight:
+            updated += write(future.result())
+
+    logger.info(f"Tagged skills on {updated} {collection} documents", metadata={"workers": workers})
+    return updated
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point for the skill tagging backfill."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backfill canonical skill tags")
+    parser.add_argument("--collection", choices=["job_listings", "elevated_jobs"], help="Collection (default: both)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=500, help="Documents per worker task")
+    parser.add_argument("--force", action="store_true", help="Re-tag documents that already have skills")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    for collection in [args.collection] if args.collection else ["job_listings", "elevated_jobs"]:
+        backfill(collection, args.workers, args.batch_size, args.force)
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
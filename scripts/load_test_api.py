@@ -0,0 +1,118 @@
+"""
+Open-loop load test for the read API (backend.api.app).
+
+Requests are started at a fixed rate regardless of how fast responses come
+back, so queueing shows up in the latency percentiles instead of silently
+lowering the offered load. The mix is job lookups, filtered listing pages and
+keyword searches; a share of clients revalidate with `If-None-Match`.
+Exits non-zero when p99 latency or the error rate misses its target.
+
+Usage:
+    python -m backend.api.app --workers 2 &
+    python scripts/load_test_api.py --rps 200 --duration 30 --p99-ms 50
+"""
+
+import asyncio
+import random
+import time
+from typing import Dict, List
+
+import httpx
+
+SEARCH_TERMS = ["python", "machine learning", "pytorch", "kubernetes", "llm", "data pipeline", "spark", "aws"]
+TITLE_FILTERS = ["engineer", "scientist", "manager", "ml", "ai"]
+
+
+async def sample_job_ids(client: httpx.AsyncClient, count: int = 200) -> List[str]:
+    response = await client.get("/jobs", params={"limit": min(count, 100), "fields": "_id"})
+    response.raise_for_status()
+    return [item["_id"] for item in response.json()["items"]]
+
+
+def next_request(job_ids: List[str]) -> Dict:
+    roll = random.random()
+    if roll < 0.5 and job_ids:
+        return {"url": f"/jobs/{random.choice(job_ids)}"}
+    if roll < 0.8:
+        return {"url": "/jobs", "params": {"title": random.choice(TITLE_FILTERS), "limit": 20}}
+    return {"url": "/jobs/search", "params": {"q": random.choice(SEARCH_TERMS), "limit": 20}}
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)] if ordered else 0.0
+
+
+async def run(base_url: str, rps: float, duration: float, revalidate: float, max_connections: int) -> Dict:
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=10.0) as client:
+        job_ids = await sample_job_ids(client)
+        etags: Dict[str, str] = {}
+        latencies: List[float] = []
+        statuses: Dict[int, int] = {}
+
+        async def one():
+            request = next_request(job_ids)
+            key = str(request)
+            headers = {"Accept-Encoding": "gzip"}
+            if key in etags and random.random() < revalidate:
+                headers["If-None-Match"] = etags[key]
+            started = time.perf_counter()
+            try:
+                response = await client.get(request["url"], params=request.get("params"), headers=headers)
+                status = response.status_code
+                if "etag" in response.headers:
+                    etags[key] = response.headers["etag"]
+            except httpx.HTTPError:
+                status = 0
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+
+        tasks = []
+        started = time.perf_counter()
+        interval = 1.0 / rps
+        for sent in range(int(rps * duration)):
+            # Open loop: keep the schedule even when responses are slow
+            delay = started + sent * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(one()))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    errors = sum(count for status, count in statuses.items() if status == 0 or status >= 500)
+    return {
+        "requests": len(latencies),
+        "achieved_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+        "error_rate": round(errors / max(len(latencies), 1), 4),
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+def main() -> int:
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Load test the read API")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--rps", type=float, default=200, help="Offered requests per second")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of load")
+    parser.add_argument("--p99-ms", type=float, default=50, help="p99 latency target")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--revalidate", type=float, default=0.3, help="Share of repeat requests sent with If-None-Match")
+    parser.add_argument("--max-connections", type=int, default=100)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.url, args.rps, args.duration, args.revalidate, args.max_connections))
+    passed = result["p99_ms"] <= args.p99_ms and result["error_rate"] <= args.max_error_rate
+    print(json.dumps({**result, "target_p99_ms": args.p99_ms, "passed": passed}, indent=2))
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
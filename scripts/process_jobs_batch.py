@@ -1,17 +1,13 @@
 import asyncio
 from datetime import datetime, UTC
-from backend.workflows.elevate_job_descriptions import JobElevationWorkflow
-from backend.database import get_jobs_collection
 from backend.logging_config import setup_logging
-from tqdm import tqdm
-
-
-setup_logging()
+from backend.utils.loop_diagnostics import LoopDiagnostics, add_diagnostics_arguments
 
 async def process_jobs_with_rate_limit(
     max_jobs: int = 500,
     jobs_per_minute: int = 16,
-    batch_size: int = 4
+    batch_size: int = 4,
+    candidates: int = 1
 ):
     """
     Process jobs with rate limiting.
@@ -20,8 +16,12 @@ async def process_jobs_with_rate_limit(
         max_jobs: Maximum number of jobs to process
         jobs_per_minute: Number of jobs to process per minute
         batch_size: Number of jobs to process in parallel
+        candidates: Parallel extraction candidates per job in the first round
     """
-    workflow = JobElevationWorkflow(batch_size=batch_size)
+    # Deferred so `--help` and argument errors don't pay for the workflow imports
+    from backend.workflows.elevate_job_descriptions import JobElevationWorkflow
+    
+    workflow = JobElevationWorkflow(batch_size=batch_size, num_candidates=candidates)
     await workflow.initialize()
     
     jobs_processed = 0
@@ -49,20 +49,27 @@ async def main():
     parser.add_argument("--max-jobs", type=int, default=500)
     parser.add_argument("--jobs-per-minute", type=int, default=16)
     parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--candidates", type=int, default=1, help="Parallel extraction candidates (K)")
+    add_diagnostics_arguments(parser)
     args = parser.parse_args()
     
+    setup_logging()
     start_time = datetime.now(UTC)
-    total_processed = await process_jobs_with_rate_limit(
-        max_jobs=args.max_jobs,
-        jobs_per_minute=args.jobs_per_minute,
-        batch_size=args.batch_size
-    )
+    async with LoopDiagnostics.from_args("process_jobs_batch", args) as diagnostics:
+        total_processed = await process_jobs_with_rate_limit(
+            max_jobs=args.max_jobs,
+            jobs_per_minute=args.jobs_per_minute,
+            batch_size=args.batch_size,
+            candidates=args.candidates
+        )
     duration = datetime.now(UTC) - start_time
     
     print(f"\nProcessing complete:")
     print(f"Total jobs processed: {total_processed}")
     print(f"Time taken: {duration}")
     print(f"Average rate: {total_processed / duration.total_seconds() * 60:.1f} jobs/minute")
+    if diagnostics.enabled:
+        print(f"Loop diagnostics: {diagnostics.summary()}")
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file